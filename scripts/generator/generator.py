@@ -8,17 +8,33 @@ import os
 import sys
 import json
 import re
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Mapping, Optional
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (unless the caller already did)
+if str(Path(__file__).parent.parent) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from wizard.state import WizardState, get_state
 from wizard.drivers import KLIPPER_TMC_SECTION, SPI_DRIVERS
 from generator.templates import TemplateRenderer
 
+# Rendered sections for recently generated contexts, most recent last. Rendering
+# is a pure function of (templates, context); the per-run header timestamp is
+# applied afterwards, so repeat generations of the same state hit this cache.
+_RENDER_CACHE: "OrderedDict[tuple, Dict[str, str]]" = OrderedDict()
+_RENDER_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=64)
+def _read_board_json(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a board/toolboard JSON file; keyed on mtime so edits are picked up."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
 
 class ConfigGenerator:
     """Generates Klipper configuration files from wizard state."""
@@ -42,12 +58,19 @@ class ConfigGenerator:
         state: WizardState = None,
         output_dir: Path = None,
         renderer: TemplateRenderer = None,
-        templates_dir: Path = None
+        templates_dir: Path = None,
+        *,
+        read_existing: bool = True,
     ):
         self.state = state or get_state()
         self.output_dir = output_dir or Path.home() / "printer_data" / "config"
+        # False: generate as for an empty config dir (previews); don't look for
+        # an existing printer.cfg SAVE_CONFIG block or user-overrides.cfg
+        self.read_existing = read_existing
         self.renderer = renderer or TemplateRenderer()
         self.templates_dir = templates_dir or self._find_templates_dir()
+        # Header timestamp, taken once per generate() so all files agree
+        self._timestamp: Optional[str] = None
 
         # Section to file mapping
         self.file_mapping = {
@@ -310,13 +333,11 @@ class ConfigGenerator:
             return self._get_manual_board_context()
 
         board_file = self.templates_dir / "boards" / f"{board_type}.json"
-        if board_file.exists():
-            try:
-                with open(board_file, encoding='utf-8') as f:
-                    board_data = json.load(f)
-                return self._transform_board_data(board_data)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            board_data = _read_board_json(board_file, board_file.stat().st_mtime_ns)
+            return self._transform_board_data(board_data)
+        except (json.JSONDecodeError, IOError):
+            pass
 
         return self._get_manual_board_context()
 
@@ -326,13 +347,11 @@ class ConfigGenerator:
             return {}
 
         board_file = self.templates_dir / "toolboards" / f"{board_type}.json"
-        if board_file.exists():
-            try:
-                with open(board_file, encoding='utf-8') as f:
-                    board_data = json.load(f)
-                return self._transform_board_data(board_data)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            board_data = _read_board_json(board_file, board_file.stat().st_mtime_ns)
+            return self._transform_board_data(board_data)
+        except (json.JSONDecodeError, IOError):
+            pass
 
         return self._get_manual_toolboard_context()
 
@@ -432,7 +451,8 @@ class ConfigGenerator:
             'fan_ports': list(board_data.get('fan_ports', {}).keys()),
             'thermistor_ports': list(board_data.get('thermistor_ports', {}).keys()),
             'endstop_ports': list(board_data.get('endstop_ports', {}).keys()),
-            'defaults': board_data.get('default_assignments', {}),
+            # Copy: board_data is the cached parse shared across generators
+            'defaults': dict(board_data.get('default_assignments') or {}),
         }
 
     def _get_manual_board_context(self) -> Dict[str, Any]:
@@ -829,13 +849,19 @@ class ConfigGenerator:
             },
         }
 
-    def generate(self) -> Dict[str, str]:
+    def generate(self, *, sections_only: bool = False) -> Dict[str, str]:
         """
         Generate all configuration files.
 
+        Args:
+            sections_only: Return the validated, rendered sections keyed by
+                section (e.g. 'stepper_z1') and skip assembling files, headers,
+                printer.cfg and user-overrides.cfg. For structural checks.
+
         Returns:
             Dict mapping file paths to their contents
         """
+        self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         context = self.get_context()
 
         # Validation: required fields for a functional config
@@ -847,7 +873,7 @@ class ConfigGenerator:
             parts = path.split(".")
             cur = cfg
             for p in parts:
-                if not isinstance(cur, dict) or p not in cur:
+                if not isinstance(cur, Mapping) or p not in cur:
                     errors.append(f"Missing required setting: {path}")
                     return
                 cur = cur[p]
@@ -942,7 +968,7 @@ class ConfigGenerator:
         if errors:
             raise ValueError("Wizard state is incomplete:\n" + "\n".join(f"- {e}" for e in errors))
 
-        rendered = self.renderer.render_all(context)
+        rendered = self._render_all(context)
 
         # Validation: fail fast on render errors (these are always broken configs)
         render_errors = []
@@ -958,6 +984,9 @@ class ConfigGenerator:
                 + ("\n- ... (more)" if len(render_errors) > 50 else "")
             )
 
+        if sections_only:
+            return rendered
+
         # Group by output file
         files: Dict[str, List[str]] = {}
 
@@ -1007,15 +1036,40 @@ class ConfigGenerator:
 
         # Generate user-overrides.cfg if it doesn't exist
         user_overrides_path = self.output_dir / "user-overrides.cfg"
-        if not user_overrides_path.exists():
+        if not self.read_existing or not user_overrides_path.exists():
             result['user-overrides.cfg'] = self._generate_user_overrides()
 
         return result
 
+    def _render_all(self, context: Mapping[str, Any]) -> Dict[str, str]:
+        """Render all sections, reusing the result for an identical context."""
+        templates_file = Path(self.renderer.templates_file)
+        try:
+            key = (
+                type(self.renderer),
+                templates_file,
+                templates_file.stat().st_mtime_ns,
+                # "generated" is the export time, not part of the config
+                json.dumps({k: v for k, v in context.items() if k != "generated"}, sort_keys=True, default=str),
+            )
+        except (OSError, TypeError):
+            return self.renderer.render_all(context)
+
+        cached = _RENDER_CACHE.get(key)
+        if cached is None:
+            cached = self.renderer.render_all(context)
+            _RENDER_CACHE[key] = cached
+            if len(_RENDER_CACHE) > _RENDER_CACHE_SIZE:
+                _RENDER_CACHE.popitem(last=False)
+        else:
+            _RENDER_CACHE.move_to_end(key)
+        # Callers get their own dict so they can't alter the cached entry
+        return dict(cached)
+
     def _generate_header(self, file_path: str) -> str:
         """Generate file header with metadata."""
         description = self.OUTPUT_FILES.get(file_path, "Configuration")
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         return f"""#######################################
 # {description}
@@ -1030,7 +1084,7 @@ class ConfigGenerator:
 
     def _generate_printer_cfg(self) -> str:
         """Generate main printer.cfg with includes."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Wizard-managed non-gschpoozi includes
         pre_includes = []
@@ -1095,6 +1149,8 @@ class ConfigGenerator:
         # Generate fresh printer.cfg, only preserving the SAVE_CONFIG block
         # (contains PID tuning, bed mesh, and other calibration data from Klipper)
         # User customizations should go in user-overrides.cfg, not printer.cfg
+        if not self.read_existing:
+            return generated_block
         try:
             # Look for existing printer.cfg to extract SAVE_CONFIG block
             existing_path = self.output_dir / "printer.cfg"
@@ -1166,11 +1222,24 @@ class ConfigGenerator:
         Returns:
             List of written file paths
         """
+        return list(self.iter_write_files(files))
+
+    def iter_write_files(self, files: Dict[str, str] = None) -> Iterator[Path]:
+        """
+        Write generated files to disk, yielding each path as it is written.
+
+        Files are only written while the iterator is consumed; use
+        write_files() when the caller doesn't need to stream.
+
+        Args:
+            files: Optional pre-generated files dict
+
+        Yields:
+            Written file paths
+        """
         if files is None:
             files = self.generate()
 
-        written = []
-
         # Ensure gschpoozi directory exists
         gschpoozi_dir = self.output_dir / "gschpoozi"
         gschpoozi_dir.mkdir(parents=True, exist_ok=True)
@@ -1193,9 +1262,7 @@ class ConfigGenerator:
             with open(full_path, 'w', encoding='utf-8') as f:
                 f.write(content)
 
-            written.append(full_path)
-
-        return written
+            yield full_path
 
     def preview(self) -> str:
         """Generate a preview of all config files."""
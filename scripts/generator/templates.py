@@ -5,10 +5,41 @@ Handles loading config-sections.yaml and rendering templates.
 """
 
 import ast
+import functools
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
-from jinja2 import Environment, BaseLoader, TemplateSyntaxError
+from jinja2 import Environment, BaseLoader, Template, TemplateSyntaxError
+
+
+@functools.lru_cache(maxsize=4)
+def _load_templates_file(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse config-sections.yaml; keyed on mtime so edits are picked up."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+@functools.lru_cache(maxsize=1)
+def _jinja_env() -> Environment:
+    """Jinja2 environment shared by all renderers."""
+    env = Environment(
+        loader=BaseLoader(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    # Add custom filters
+    env.filters['abs'] = abs
+    env.filters['klipper_tmc_section'] = lambda dt: {
+        "TMC2226": "tmc2209",
+    }.get(dt, dt.lower())
+    return env
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template(template_str: str) -> Template:
+    """Compile a section template once; the YAML holds a fixed set of them."""
+    return _jinja_env().from_string(template_str)
 
 
 class TemplateRenderer:
@@ -20,18 +51,8 @@ class TemplateRenderer:
         self.pin_config: Dict[str, str] = {}
         self._load_templates()
 
-        # Set up Jinja2 environment
-        self.env = Environment(
-            loader=BaseLoader(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # Add custom filters
-        self.env.filters['abs'] = abs
-        self.env.filters['klipper_tmc_section'] = lambda dt: {
-            "TMC2226": "tmc2209",
-        }.get(dt, dt.lower())
+        # Jinja2 environment (shared; compiled templates are cached per source)
+        self.env = _jinja_env()
 
     def _find_templates_file(self) -> Path:
         """Find config-sections.yaml in the schema directory."""
@@ -53,13 +74,34 @@ class TemplateRenderer:
         )
 
     def _load_templates(self) -> None:
-        """Load templates from YAML file."""
-        with open(self.templates_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        """Load templates from YAML file (parsed once per file version)."""
+        path = Path(self.templates_file)
+        data = _load_templates_file(path, path.stat().st_mtime_ns)
 
         self.templates = data
         self.pin_config = data.get('pin_config', {})
 
+    def precompile(self) -> int:
+        """
+        Compile every section template up front (e.g. at server startup) so
+        the first render doesn't pay for it. Returns the number compiled.
+        """
+        count = 0
+        pending = [v for v in self.templates.values() if isinstance(v, dict)]
+        while pending:
+            section = pending.pop()
+            template_str = section.get('template')
+            if isinstance(template_str, str):
+                if section.get("render") != "raw":
+                    try:
+                        _compile_template(template_str)
+                        count += 1
+                    except TemplateSyntaxError:
+                        pass  # reported as a render error when the section is used
+                continue
+            pending.extend(v for v in section.values() if isinstance(v, dict))
+        return count
+
     def evaluate_condition(self, condition: str, context: Dict[str, Any]) -> bool:
         """Evaluate a condition string against context."""
         if not condition:
@@ -171,7 +213,7 @@ class TemplateRenderer:
             # Add pin_config to context
             context['pin_config'] = self.pin_config
 
-            template = self.env.from_string(template_str)
+            template = _compile_template(template_str)
             result = template.render(**context)
             # Ensure result ends with at least one newline
             if not result.endswith('\n'):
@@ -12,8 +12,14 @@ import json
 import re
 import argparse
 import traceback
+import functools
+import subprocess
+import threading
+import time
+from concurrent import futures
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Union, Tuple
+from typing import Any, Callable, Dict, Optional, Union, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -35,18 +41,287 @@ from wizard.drivers import KLIPPER_TMC_SECTION, SPI_DRIVERS, NO_STALLGUARD_DRIVE
 SCRIPT_DIR = Path(__file__).parent.resolve()
 REPO_ROOT = SCRIPT_DIR.parent.parent  # scripts/wizard -> scripts -> repo root
 
+# User home (klipper, moonraker, printer_data, ... live under it); resolved once
+HOME = Path.home()
+
+# Klipper ecosystem components: install path and systemd service (None = no own service)
+_COMPONENT_INFO = {
+    "klipper": {"path": HOME / "klipper", "service": "klipper"},
+    "moonraker": {"path": HOME / "moonraker", "service": "moonraker"},
+    "mainsail": {"path": HOME / "mainsail", "service": None},  # nginx-served
+    "fluidd": {"path": HOME / "fluidd", "service": None},  # nginx-served
+    "crowsnest": {"path": HOME / "crowsnest", "service": "crowsnest"},
+    "sonar": {"path": HOME / "sonar", "service": "sonar"},
+    "timelapse": {"path": HOME / "moonraker-timelapse", "service": None},  # moonraker plugin
+    "klipperscreen": {"path": HOME / "KlipperScreen", "service": "KlipperScreen"},
+}
+_COMPONENT_SERVICES = tuple(i["service"] for i in _COMPONENT_INFO.values() if i["service"])
+# KlipperScreen installs under either service name depending on the installer
+_KLIPPERSCREEN_SERVICES = ("KlipperScreen", "klipperscreen")
+
+# How long a batched `systemctl is-active/is-enabled` answer is reused (seconds)
+_SYSTEMCTL_CACHE_TTL = 2.0
+
+# Per-axis stepper settings stored under stepper_<axis>.* by _stepper_axis
+_STEPPER_FIELDS = (
+    "motor_port", "dir_pin_inverted", "driver_type", "driver_protocol",
+    "driver_SGT", "driver_SGTHRS", "run_current", "hold_current",
+    "homing_current", "sense_resistor", "stealthchop_threshold",
+    "microsteps", "full_steps_per_rotation", "belt_pitch", "pulley_teeth",
+    "endstop_type", "endstop_source", "endstop_port", "endstop_port_toolboard",
+    "endstop_pullup", "endstop_invert", "endstop_config",
+    "position_min", "position_max", "position_endstop",
+    "homing_speed", "second_homing_speed", "homing_retract_dist",
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _stepper_keys(axis: str) -> dict:
+    """Map stepper field names to full state keys for an axis (x, y, x1, y1).
+
+    Cached so re-entering an axis reuses the same key strings.
+    """
+    prefix = f"stepper_{axis}"
+    return {name: f"{prefix}.{name}" for name in _STEPPER_FIELDS}
+
+
+# Klipper MCUs show up here; re-listed only when udev adds or removes a link
+SERIAL_BY_ID_DIR = Path("/dev/serial/by-id")
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_serial_devices(_mtime_ns: int) -> Optional[Tuple[Tuple[str, str], ...]]:
+    try:
+        # scandir hands back path/name strings directly; no Path objects per entry
+        with os.scandir(SERIAL_BY_ID_DIR) as entries:
+            return tuple((entry.path, entry.name) for entry in entries)
+    except FileNotFoundError:
+        return None
+
+
+def _list_serial_devices() -> Optional[Tuple[Tuple[str, str], ...]]:
+    """List /dev/serial/by-id entries as (path, name), or None if the directory doesn't exist.
+
+    The listing is cached on the directory's mtime, which udev bumps on every
+    device add/remove, so going Back and re-entering a board/probe screen
+    costs one stat() and a newly plugged board always shows up.
+    """
+    try:
+        mtime_ns = SERIAL_BY_ID_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _scan_serial_devices(mtime_ns)
+
+
+# Confirmation / summary dialog texts, rendered from templates/wizard/*.j2
+WIZARD_TEMPLATES_DIR = REPO_ROOT / "templates" / "wizard"
+
+
+@functools.lru_cache(maxsize=None)
+def _wizard_jinja_env():
+    from jinja2 import Environment, FileSystemLoader
+    return Environment(
+        loader=FileSystemLoader(str(WIZARD_TEMPLATES_DIR)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        cache_size=-1,
+        auto_reload=False,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _wizard_template(name: str):
+    """Load (and compile once) a wizard dialog template by name.
+
+    The Jinja2 environment is created on first use and never re-stats the
+    template files, so repeated renders only walk the compiled template.
+    """
+    return _wizard_jinja_env().get_template(f"{name}.j2")
+
+
+# Title of the confirmation box shown after a setup step saves its settings
+_TITLE_SAVED = "Configuration Saved"
+
+# Static (tag, label) choices for the probe / homing / leveling radiolists
+_PROBE_TYPES = (
+    ("none", "No Probe"),
+    ("tap", "Voron Tap"),
+    ("klicky", "Klicky / Euclid"),
+    ("bltouch", "BLTouch / 3DTouch"),
+    ("inductive", "Inductive (PINDA)"),
+    ("beacon", "Beacon (eddy current)"),
+    ("cartographer", "Cartographer"),
+    ("btt_eddy", "BTT Eddy"),
+)
+_HOMING_METHODS_EDDY = (
+    ("beacon_contact", "Beacon Contact"),
+    ("homing_override", "Custom Homing Override"),
+)
+_HOMING_METHODS_STANDARD = (
+    ("safe_z_home", "Safe Z Home (standard)"),
+    ("homing_override", "Homing Override (sensorless)"),
+)
+
+# Eddy-current probes (own serial connection, coil temperature sensor)
+_EDDY_PROBES = frozenset({"beacon", "cartographer", "btt_eddy"})
+# Eddy probes with a separate Klipper module and contact homing
+_CONTACT_EDDY_PROBES = frozenset({"beacon", "cartographer"})
+_HOMING_METHODS_BY_PROBE = {
+    probe: _HOMING_METHODS_EDDY for probe in _CONTACT_EDDY_PROBES
+}
+_LEVELING_OPTIONS_QGL = (
+    ("qgl", "Quad Gantry Level"),
+    ("none", "None"),
+)
+_LEVELING_OPTIONS_Z_TILT = (
+    ("z_tilt", "Z Tilt Adjust"),
+    ("none", "None"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _radio_items(options: tuple, current: str) -> tuple:
+    """Build (tag, label, selected) radiolist items for a static option tuple.
+
+    The UI selects the first item when nothing matches ``current``.
+    """
+    return tuple((tag, label, tag == current) for tag, label in options)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_generator_cls():
+    """Import and return ConfigGenerator on first use.
+
+    Kept out of the module imports so the wizard starts without pulling in
+    jinja2/yaml; later calls return the cached class.
+    """
+    from generator import ConfigGenerator
+    return ConfigGenerator
+
+
+# Runs config generation off the UI thread (threads are only started on first submit)
+_GENERATE_EXECUTOR = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="generate")
+
+
+def _generate_and_write(
+    state: WizardState,
+    max_shown: int = 8,
+    cancel: Optional[threading.Event] = None,
+) -> Tuple[Path, int, list]:
+    """Generate and write all config files; return (output_dir, count, first paths).
+
+    When ``cancel`` is set, no further files are written (it is checked before
+    the first write and after each one).
+    """
+    generator = _get_generator_cls()(state=state)
+    files = generator.generate()
+    # Single pass over the written paths: count them all, keep the first few
+    shown = []
+    total = 0
+    if cancel is not None and cancel.is_set():
+        return generator.output_dir, total, shown
+    for path in generator.iter_write_files(files):
+        total += 1
+        if total <= max_shown:
+            shown.append(path)
+        if cancel is not None and cancel.is_set():
+            break
+    return generator.output_dir, total, shown
+
+
+def _touches_services(method):
+    """Mark a wizard action that may install, remove, start or stop components.
+
+    Cached service status is dropped when the action returns, so menu labels
+    that probe for those components are rebuilt.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_probes()
+    return wrapper
+
+
+def _profiled(func):
+    """Run ``func`` under cProfile when GSCHPOOZI_PROFILE=1 is set.
+
+    Stats (top 40 by cumulative time) go to stderr once the call returns,
+    i.e. after whiptail has released the terminal.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if os.environ.get("GSCHPOOZI_PROFILE") != "1":
+            return func(*args, **kwargs)
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(40)
+    return wrapper
+
+
+@dataclass
+class MenuFrame:
+    """One screen on the menu stack run by GschpooziWizard._run_menu_stack.
+
+    ``build`` returns (prompt, items) from the current state. ``actions`` maps
+    a menu tag to a callable that either does its work inline or returns a
+    MenuFrame to push. Choices in ``back_choices`` (and Esc) pop the frame,
+    after ``confirm_back`` agrees if one is given.
+    """
+    title: Optional[str]
+    build: Callable[[], Tuple[str, list]]
+    actions: Dict[str, Callable[[], Any]]
+    back_choices: Tuple[str, ...] = ("B",)
+    confirm_back: Optional[Callable[[], bool]] = None
+    fallback: Optional[Callable[[str], None]] = None
+    menu_kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Last built (prompt, items) and the (state version, probe epoch) it was built from
+    rendered: Optional[Tuple[str, list]] = None
+    rendered_version: Tuple[int, int] = (-1, -1)
+
 
 class GschpooziWizard:
     """Main wizard controller."""
 
     VERSION = "3.0.0"
 
+    # Static menu entries (labels that don't depend on state)
+    _MAIN_MENU_ITEMS = (
+        ("1", "Klipper Setup         (Installation & verification)"),
+        ("2", "Hardware Setup        (Configure your printer)"),
+        ("3", "Tuning & Optimization (Macros, input shaper, etc.)"),
+        ("G", "Generate Config       (Create printer.cfg)"),
+        ("C", "Clear Settings        (Reset all wizard settings)"),
+        ("Q", "Quit"),
+    )
+    _KLIPPER_SETUP_ITEMS = (
+        ("1.0", "Configure Klipper Variant    (Standard / Kalico)"),
+        ("1.1", "Manage Klipper Components  (KIAUH-style install/update/remove)"),
+        ("1.2", "CAN Interface Setup       (can0 / can-utils / systemd)"),
+        ("1.3", "Katapult / Flashing       (DFU + CAN firmware flash)"),
+        ("1.4", "Update Manager Fix        (Git fetch workaround)"),
+        ("1.5", "Klipper-PLR              (Power Loss Recovery)"),
+        ("B", "Back to Main Menu"),
+    )
+
     def __init__(self):
         self.ui = WizardUI(
             title="gschpoozi",
             backtitle=f"gschpoozi v{self.VERSION} - Klipper Configuration Wizard"
         )
         self.state = get_state()
+        # (query, units) -> (monotonic time, {unit: status}); see _systemctl_status
+        self._systemctl_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, Dict[str, str]]] = {}
+        # Bumped whenever services or installed components may have changed, so
+        # menu frames that show them (e.g. KlipperScreen status) get rebuilt
+        self._probe_epoch = 0
+        # (state version, text) for _get_status_text
+        self._status_text_cache: Tuple[int, str] = (-1, "")
 
     def _get_pin_manager(self) -> PinManager:
         """Create a PinManager with current board data."""
@@ -60,7 +335,7 @@ class GschpooziWizard:
 
     def _wizard_log_path(self) -> Path:
         # Keep logs next to the state file so users can find it easily.
-        return Path.home() / "printer_data" / "config" / ".gschpoozi_wizard.log"
+        return HOME / "printer_data" / "config" / ".gschpoozi_wizard.log"
 
     def _log_wizard(self, message: str) -> None:
         """Best-effort logging for diagnosing whiptail / control-flow issues."""
@@ -124,7 +399,7 @@ class GschpooziWizard:
         We use this for KIAUH-like installers that require a real TTY for prompts,
         sudo password entry, and screen control.
         """
-        import subprocess
+        self._invalidate_probes()  # installers may add/start/stop services
         try:
             with open("/dev/tty", "r+") as tty:
                 result = subprocess.run(cmd, stdin=tty, stdout=tty, stderr=tty, text=True)
@@ -189,7 +464,7 @@ class GschpooziWizard:
         Args:
             probe_type: "beacon" or "cartographer"
         """
-        klipper_extras = Path.home() / "klipper" / "klippy" / "extras"
+        klipper_extras = HOME / "klipper" / "klippy" / "extras"
 
         if probe_type == "beacon":
             module_file = klipper_extras / "beacon.py"
@@ -273,8 +548,7 @@ class GschpooziWizard:
     @staticmethod
     def _is_cartographer_plugin_installed() -> bool:
         """Check if the new Cartographer3D pip plugin is installed in klippy-env."""
-        import subprocess
-        klippy_pip = Path.home() / "klippy-env" / "bin" / "pip"
+        klippy_pip = HOME / "klippy-env" / "bin" / "pip"
         if not klippy_pip.exists():
             return False
         try:
@@ -340,7 +614,6 @@ class GschpooziWizard:
     def _has_passwordless_sudo(self) -> bool:
         """Return True if sudo can run non-interactively (no password prompt)."""
         try:
-            import subprocess
             result = subprocess.run(["sudo", "-n", "true"], capture_output=True, text=True)
             return result.returncode == 0
         except Exception:
@@ -349,7 +622,6 @@ class GschpooziWizard:
     def _run_shell(self, command: str) -> Tuple[bool, str]:
         """Run a shell command and return (ok, combined_output)."""
         try:
-            import subprocess
             result = subprocess.run(
                 command,
                 shell=True,
@@ -371,7 +643,7 @@ class GschpooziWizard:
         Output streams directly to terminal. For commands that need user interaction.
         Returns the exit code.
         """
-        import subprocess
+        self._invalidate_probes()  # the command may start/stop services
         # KIAUH approach: run without capturing output, let it stream to terminal
         # stderr=PIPE to capture errors, but stdout goes to terminal
         try:
@@ -380,6 +652,46 @@ class GschpooziWizard:
         except Exception:
             return 1
 
+    def _invalidate_probes(self) -> None:
+        """Forget cached service status and mark menu frames for a rebuild."""
+        self._systemctl_cache.clear()
+        self._probe_epoch += 1
+
+    def _systemctl_status(self, query: str, units: Tuple[str, ...]) -> Dict[str, str]:
+        """Return ``systemctl <query>`` output (e.g. "active", "enabled") per unit.
+
+        All units are asked in one systemctl call (one status line per unit)
+        and the answer is reused for a couple of seconds, so menu redraws don't
+        fork one process per service. Units that can't be queried map to "".
+        """
+        key = (query, tuple(units))
+        now = time.monotonic()
+        cached = self._systemctl_cache.get(key)
+        if cached is not None and now - cached[0] < _SYSTEMCTL_CACHE_TTL:
+            return cached[1]
+
+        def _query(names: Tuple[str, ...]) -> list:
+            try:
+                r = subprocess.run(
+                    ["systemctl", query, *names],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                )
+                return r.stdout.splitlines()
+            except Exception:
+                return []
+
+        lines = _query(key[1])
+        if len(lines) != len(units):
+            # systemctl skips lines for units it can't resolve (is-enabled on a
+            # missing unit file); fall back to asking one unit at a time
+            lines = [(_query((unit,)) or [""])[0] for unit in units]
+        result = {unit: line.strip() for unit, line in zip(units, lines)}
+
+        self._systemctl_cache[key] = (now, result)
+        return result
+
     def _run_systemctl(self, action: str, service: str) -> bool:
         """Run systemctl command interactively (allows sudo password prompt).
 
@@ -406,7 +718,7 @@ class GschpooziWizard:
         Ensure a [update_manager <name>] entry exists in moonraker.conf.
         Returns True if present/added, False if cannot write.
         """
-        conf = Path.home() / "printer_data" / "config" / "moonraker.conf"
+        conf = HOME / "printer_data" / "config" / "moonraker.conf"
         try:
             # IMPORTANT:
             # Do NOT create moonraker.conf here. A partial file containing only
@@ -464,7 +776,7 @@ class GschpooziWizard:
         Writes a [update_manager gschpoozi] stanza to:
           ~/printer_data/config/moonraker.conf
         """
-        conf = Path.home() / "printer_data" / "config" / "moonraker.conf"
+        conf = HOME / "printer_data" / "config" / "moonraker.conf"
         header = "[update_manager gschpoozi]"
 
         try:
@@ -480,8 +792,6 @@ class GschpooziWizard:
 
         # Best-effort: read repo origin + current branch so Moonraker doesn't flag a "master/main" anomaly.
         try:
-            import subprocess
-
             if (repo_path / ".git").exists():
                 r = subprocess.run(
                     ["git", "-C", str(repo_path), "config", "--get", "remote.origin.url"],
@@ -538,7 +848,7 @@ class GschpooziWizard:
 
     def _write_klipperscreen_conf(self, host: str, port: int) -> Tuple[bool, str]:
         """Write/update ~/KlipperScreen/KlipperScreen.conf with [printer default]."""
-        conf_path = Path.home() / "KlipperScreen" / "KlipperScreen.conf"
+        conf_path = HOME / "KlipperScreen" / "KlipperScreen.conf"
         try:
             conf_path.parent.mkdir(parents=True, exist_ok=True)
             if conf_path.exists():
@@ -1010,7 +1320,7 @@ class GschpooziWizard:
         - Follows [include ...] directives recursively (best-effort, no crash on missing files)
         - Also scans ~/printer_data/config/gschpoozi/*.cfg
         """
-        base = Path.home() / "printer_data" / "config"
+        base = HOME / "printer_data" / "config"
         start = base / "printer.cfg"
 
         # Allow trailing comments after the closing bracket:
@@ -1066,7 +1376,7 @@ class GschpooziWizard:
                 inc_path = Path(inc)
                 candidates = []
                 if str(inc_path).startswith("~/"):
-                    candidates = [Path.home() / str(inc_path)[2:]]
+                    candidates = [HOME / str(inc_path)[2:]]
                 elif inc_path.is_absolute():
                     candidates = [inc_path]
                 else:
@@ -1316,57 +1626,92 @@ class GschpooziWizard:
             return 0
         except KeyboardInterrupt:
             return 130
-        except Exception as e:
+        except (OSError, RuntimeError, ValueError, subprocess.SubprocessError) as e:
+            # Expected failures (I/O, bad input/state, external commands); anything
+            # else is a bug and should surface with its traceback.
             self.ui.msgbox(f"Error: {e}", title="Error")
             return 1
 
+    @_profiled
     def main_menu(self) -> None:
         """Display the main menu."""
-        while True:
-            status = self._get_status_text()
+        self._run_menu_stack(self._main_menu_frame())
+
+    def _main_menu_frame(self) -> MenuFrame:
+        """Menu frame for the top-level menu."""
+        return MenuFrame(
+            title=None,
+            build=lambda: (
+                f"Welcome to gschpoozi!\n\n{self._get_status_text()}\n\nSelect a category:",
+                self._MAIN_MENU_ITEMS,
+            ),
+            actions={
+                "1": self._klipper_setup_frame,
+                "2": self._hardware_setup_frame,
+                "3": self._tuning_frame,
+                "G": self.generate_config,
+                "C": self._clear_settings,
+            },
+            back_choices=("Q",),
+            confirm_back=lambda: self.ui.yesno("Are you sure you want to exit?", default_no=True),
+            menu_kwargs={"height": 40, "width": 120},
+        )
+
+    def _run_menu_stack(self, initial: MenuFrame) -> None:
+        """Drive a stack of menu frames until the initial frame is left.
+
+        Actions either do their work inline or return a MenuFrame to push;
+        Back/Esc pops the current frame. A frame's prompt and items are only
+        rebuilt when the wizard state has changed since they were last built,
+        or after _invalidate_probes() (an action installed, removed, started
+        or stopped something a label probes for).
+        """
+        stack = [initial]
+        while stack:
+            frame = stack[-1]
+            version = (self.state.version, self._probe_epoch)
+            if frame.rendered is None or frame.rendered_version != version:
+                frame.rendered = frame.build()
+                frame.rendered_version = version
+            prompt, items = frame.rendered
+
+            choice = self.ui.menu(prompt, items, title=frame.title, **frame.menu_kwargs)
+
+            if choice is None or choice in frame.back_choices:
+                if frame.confirm_back is None or frame.confirm_back():
+                    stack.pop()
+                continue
 
-            choice = self.ui.menu(
-                f"Welcome to gschpoozi!\n\n{status}\n\nSelect a category:",
-                [
-                    ("1", "Klipper Setup         (Installation & verification)"),
-                    ("2", "Hardware Setup        (Configure your printer)"),
-                    ("3", "Tuning & Optimization (Macros, input shaper, etc.)"),
-                    ("G", "Generate Config       (Create printer.cfg)"),
-                    ("C", "Clear Settings        (Reset all wizard settings)"),
-                    ("Q", "Quit"),
-                ],
-                height=40,
-                width=120,
-            )
+            action = frame.actions.get(choice)
+            if action is None:
+                if frame.fallback is not None:
+                    frame.fallback(choice)
+                continue
 
-            if choice is None or choice == "Q":
-                if self.ui.yesno("Are you sure you want to exit?", default_no=True):
-                    break
-            elif choice == "1":
-                self.klipper_setup_menu()
-            elif choice == "2":
-                self.hardware_setup_menu()
-            elif choice == "3":
-                self.tuning_menu()
-            elif choice == "G":
-                self.generate_config()
-            elif choice == "C":
-                self._clear_settings()
+            result = action()
+            if isinstance(result, MenuFrame):
+                stack.append(result)
 
     def _get_status_text(self) -> str:
         """Get status text showing configuration progress."""
-        completion = self.state.get_completion_status()
+        version = self.state.version
+        if self._status_text_cache[0] == version:
+            return self._status_text_cache[1]
 
-        done = sum(1 for v in completion.values() if v)
+        completion = self.state.get_completion_status()
+        items = [k for k, v in completion.items() if v]
+        done = len(items)
         total = len(completion)
 
         if done == 0:
-            return "Status: Not started"
+            text = "Status: Not started"
         elif done == total:
-            return "Status: Configuration complete! Ready to generate."
+            text = "Status: Configuration complete! Ready to generate."
         else:
-            items = [k for k, v in completion.items() if v]
-            return f"Status: {done}/{total} sections configured ({', '.join(items)})"
+            text = f"Status: {done}/{total} sections configured ({', '.join(items)})"
+
+        self._status_text_cache = (version, text)
+        return text
 
     def _clear_settings(self) -> None:
         """Clear all wizard settings and reset to defaults."""
@@ -1419,42 +1764,34 @@ class GschpooziWizard:
 
     def klipper_setup_menu(self) -> None:
         """Klipper installation and verification menu."""
-        while True:
+        self._run_menu_stack(self._klipper_setup_frame())
+
+    def _klipper_setup_frame(self) -> MenuFrame:
+        """Menu frame for 1. Klipper Setup."""
+        def _build() -> Tuple[str, list]:
             # Get current variant selection
             current_variant = self.state.get("klipper.variant", "standard")
             variant_text = "Standard Klipper" if current_variant == "standard" else "Kalico Klipper"
-
-            choice = self.ui.menu(
+            return (
                 "Klipper Setup\n\n"
                 "Manage Klipper ecosystem components and related tools.\n"
                 "Warning: install/remove actions may require sudo and can modify system services.\n\n"
                 f"Current Klipper variant: {variant_text}",
-                [
-                    ("1.0", "Configure Klipper Variant    (Standard / Kalico)"),
-                    ("1.1", "Manage Klipper Components  (KIAUH-style install/update/remove)"),
-                    ("1.2", "CAN Interface Setup       (can0 / can-utils / systemd)"),
-                    ("1.3", "Katapult / Flashing       (DFU + CAN firmware flash)"),
-                    ("1.4", "Update Manager Fix        (Git fetch workaround)"),
-                    ("1.5", "Klipper-PLR              (Power Loss Recovery)"),
-                    ("B", "Back to Main Menu"),
-                ],
-                title="1. Klipper Setup",
+                self._KLIPPER_SETUP_ITEMS,
             )
 
-            if choice is None or choice == "B":
-                break
-            elif choice == "1.0":
-                self._configure_klipper_variant()
-            elif choice == "1.1":
-                self._manage_klipper_components()
-            elif choice == "1.2":
-                self._can_interface_setup()
-            elif choice == "1.3":
-                self._katapult_setup()
-            elif choice == "1.4":
-                self._update_manager_git_fetch_workaround()
-            elif choice == "1.5":
-                self._install_klipper_plr()
+        return MenuFrame(
+            title="1. Klipper Setup",
+            build=_build,
+            actions={
+                "1.0": self._configure_klipper_variant,
+                "1.1": self._manage_klipper_components,
+                "1.2": self._can_interface_setup,
+                "1.3": self._katapult_setup,
+                "1.4": self._update_manager_git_fetch_workaround,
+                "1.5": self._install_klipper_plr,
+            },
+        )
 
     def _configure_klipper_variant(self) -> None:
         """Configure Klipper variant selection (Standard vs Kalico)."""
@@ -1498,8 +1835,6 @@ class GschpooziWizard:
 
         We store this config LOCALLY in the repo so it doesn't affect other git repos.
         """
-        import subprocess
-
         repo = REPO_ROOT
 
         def get_http_version() -> str:
@@ -1610,8 +1945,6 @@ class GschpooziWizard:
 
         Returns dict with: installed, version, service_running, service_enabled, has_service, path
         """
-        import subprocess
-
         status = {
             "installed": False,
             "version": None,
@@ -1621,19 +1954,7 @@ class GschpooziWizard:
             "path": None,
         }
 
-        # Component paths and service names
-        component_info = {
-            "klipper": {"path": Path.home() / "klipper", "service": "klipper"},
-            "moonraker": {"path": Path.home() / "moonraker", "service": "moonraker"},
-            "mainsail": {"path": Path.home() / "mainsail", "service": None},  # nginx-served
-            "fluidd": {"path": Path.home() / "fluidd", "service": None},  # nginx-served
-            "crowsnest": {"path": Path.home() / "crowsnest", "service": "crowsnest"},
-            "sonar": {"path": Path.home() / "sonar", "service": "sonar"},
-            "timelapse": {"path": Path.home() / "moonraker-timelapse", "service": None},  # moonraker plugin
-            "klipperscreen": {"path": Path.home() / "KlipperScreen", "service": "KlipperScreen"},
-        }
-
-        info = component_info.get(component.lower())
+        info = _COMPONENT_INFO.get(component.lower())
         if not info:
             return status
 
@@ -1660,29 +1981,14 @@ class GschpooziWizard:
             except Exception:
                 pass
 
-        # Check service status
+        # Check service status (all component services are queried together)
         if service:
-            try:
-                r = subprocess.run(
-                    ["systemctl", "is-active", service],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                status["service_running"] = (r.stdout.strip() == "active")
-            except Exception:
-                pass
-
-            try:
-                r = subprocess.run(
-                    ["systemctl", "is-enabled", service],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                status["service_enabled"] = (r.stdout.strip() == "enabled")
-            except Exception:
-                pass
+            status["service_running"] = (
+                self._systemctl_status("is-active", _COMPONENT_SERVICES).get(service) == "active"
+            )
+            status["service_enabled"] = (
+                self._systemctl_status("is-enabled", _COMPONENT_SERVICES).get(service) == "enabled"
+            )
 
         return status
 
@@ -1706,11 +2012,10 @@ class GschpooziWizard:
 
         return f"{component:<14} [ {' | '.join(parts)} ]"
 
+    @_touches_services
     def _install_klipper_plr(self) -> None:
         """Install or manage BTT Klipper-PLR (Power Loss Recovery)."""
-        import subprocess
-
-        plr_dir = Path.home() / "KlipperPLR"
+        plr_dir = HOME / "KlipperPLR"
 
         def _check_plr_installed() -> bool:
             return plr_dir.exists() and (plr_dir / "plr.py").exists()
@@ -1877,6 +2182,7 @@ class GschpooziWizard:
             width=65,
         )
 
+    @_touches_services
     def _manage_klipper_components(self) -> None:
         """
         KIAUH-style component manager.
@@ -2098,284 +2404,268 @@ class GschpooziWizard:
 
     def hardware_setup_menu(self) -> None:
         """Hardware configuration menu."""
-        while True:
-            # Build menu items dynamically based on config
-            awd_enabled = self.state.get("printer.awd_enabled", False)
+        self._run_menu_stack(self._hardware_setup_frame())
 
-            # Get status info for each section
-            # MCU Configuration
-            main_board_id = self.state.get("mcu.main.board_type", "")
-            main_board_name = self._get_board_name(main_board_id, "boards") if main_board_id else None
-            toolboard_id = self.state.get("mcu.toolboard.board_type", "")
-            toolboard_name = self._get_board_name(toolboard_id, "toolboards") if toolboard_id else None
-            mcu_status = None
-            if main_board_name:
-                mcu_status = main_board_name
-                if toolboard_name:
-                    mcu_status += f", {toolboard_name}"
-
-            # Printer Settings
-            kinematics = self.state.get("printer.kinematics", "")
-            printer_status = None
-            if kinematics:
-                printer_status = kinematics.capitalize()
-                if awd_enabled:
-                    printer_status += " - AWD"
-
-            # Stepper status helper
-            def get_stepper_status(axis):
-                driver = self.state.get(f"stepper_{axis}.driver_type", "")
-                if driver:
-                    return driver
-                return None
-
-            # X Axis
-            x_status = get_stepper_status("x")
-
-            # Y Axis
-            y_status = get_stepper_status("y")
-
-            # X1 Axis
-            x1_status = get_stepper_status("x1") if awd_enabled else None
-
-            # Y1 Axis
-            y1_status = get_stepper_status("y1") if awd_enabled else None
-
-            # Z Axis
-            z_count = self.state.get("stepper_z.z_motor_count", None)
-            z_status = None
-            if z_count:
-                z_status = f"{z_count} motors"
-
-            # Extruder
-            extruder_type = self.state.get("extruder.extruder_type", "")
-            nozzle = self.state.get("extruder.nozzle_diameter", None)
-            extruder_status = None
-            if extruder_type:
-                extruder_status = extruder_type.replace("_", " ").title()
-                if nozzle:
-                    extruder_status += f", {nozzle}mm"
-
-            # Heated Bed
-            bed_sensor = self.state.get("heater_bed.sensor_type", "")
-            bed_status = bed_sensor if bed_sensor else None
-
-            # Fans
-            part_loc = self.state.get("fans.part_cooling.location", "")
-            hotend_loc = self.state.get("fans.hotend.location", "")
-            controller_enabled = self.state.get("fans.controller.enabled", False)
-            fans_status = None
-            if part_loc or hotend_loc or controller_enabled:
-                parts = []
-                if part_loc:
-                    parts.append(f"Part:{part_loc[:2]}")
-                if hotend_loc:
-                    parts.append(f"Hotend:{hotend_loc[:2]}")
-                if controller_enabled:
-                    parts.append("Ctrl")
-                fans_status = ", ".join(parts)
-
-            # Probe
-            probe_type = self.state.get("probe.probe_type", "")
-            probe_status = None
-            if probe_type and probe_type != "none":
-                # Format probe type nicely: capitalize and replace underscores
-                probe_status = probe_type.replace("_", " ").title()
-
-            # Homing
-            homing_method = self.state.get("homing.homing_method", "")
-            homing_status = None
-            if homing_method:
-                # Format homing method nicely: capitalize and replace underscores
-                homing_status = homing_method.replace("_", " ").title()
-
-            # Bed Leveling
-            leveling_type = self.state.get("bed_leveling.leveling_type", "")
-            mesh_enabled = self.state.get("bed_leveling.bed_mesh.enabled", False)
-            leveling_status = None
-            parts = []
-            if leveling_type and leveling_type != "none":
-                # Format leveling type nicely
-                formatted_type = (
-                    leveling_type.replace("_", " ").upper()
-                    if leveling_type == "qgl"
-                    else leveling_type.replace("_", " ").title()
-                )
-                parts.append(formatted_type)
-            if mesh_enabled:
-                parts.append("Mesh")
-            if parts:
-                leveling_status = " + ".join(parts)
-
-            # Temperature Sensors
-            temp_sensor_count = 0
-            if self.state.get("temperature_sensors.mcu_main.enabled", False):
-                temp_sensor_count += 1
-            if self.state.get("temperature_sensors.host.enabled", False):
-                temp_sensor_count += 1
-            if self.state.get("temperature_sensors.toolboard.enabled", False):
-                temp_sensor_count += 1
-            if self.state.get("temperature_sensors.chamber.enabled", False):
-                temp_sensor_count += 1
-            # Count additional user-defined sensors
-            additional_sensors = self.state.get("temperature_sensors.additional", [])
-            if isinstance(additional_sensors, list):
-                temp_sensor_count += len([s for s in additional_sensors if isinstance(s, dict)])
-            temp_sensors_status = None
-            if temp_sensor_count > 0:
-                temp_sensors_status = f"{temp_sensor_count} sensor{'s' if temp_sensor_count != 1 else ''}"
-
-            # LEDs
-            leds = self.state.get("leds", [])
-            if not isinstance(leds, list):
-                leds = []
-            leds_count = len(leds)
-            leds_status = None
-            if leds_count > 0:
-                leds_status = f"{leds_count} LED{'s' if leds_count != 1 else ''}"
-            if self.state.get("lighting.case_light.enabled", False):
-                leds_status = f"{leds_status} + case light" if leds_status else "case light"
-
-            # Filament Sensors
-            filament_sensors = self.state.get("filament_sensors", [])
-            if not isinstance(filament_sensors, list):
-                filament_sensors = []
-            filament_count = len(filament_sensors)
-            filament_sensors_status = None
-            if filament_count > 0:
-                filament_sensors_status = f"{filament_count} sensor{'s' if filament_count != 1 else ''}"
-
-            # Display (KlipperScreen first)
-            display_status = None
-            ks_enabled = self.state.get("display.klipperscreen.enabled", False)
-            try:
-                ks_installed = (Path.home() / "KlipperScreen").exists()
-            except Exception:
-                ks_installed = False
-            ks_running = False
-            if ks_installed:
-                try:
-                    import subprocess
-                    # Try common service names
-                    for svc in ("KlipperScreen", "klipperscreen"):
-                        result = subprocess.run(
-                            ["systemctl", "is-active", svc],
-                            capture_output=True,
-                            text=True,
-                        )
-                        if result.stdout.strip() == "active":
-                            ks_running = True
-                            break
-                except Exception:
-                    ks_running = False
-
-            if ks_running:
-                display_status = "KlipperScreen (running)"
-            elif ks_installed:
-                display_status = "KlipperScreen (installed)"
-            elif ks_enabled:
-                display_status = "KlipperScreen (enabled)"
-
-            # Advanced
-            advanced_status = None
-            adv_parts = []
-            if self.state.get("advanced.force_move.enable_force_move", False):
-                adv_parts.append("ForceMove")
-            if self.state.get("advanced.firmware_retraction.enabled", False):
-                adv_parts.append("FWRetract")
-            if adv_parts:
-                advanced_status = ", ".join(adv_parts)
-
-            menu_items = [
-                ("2.1", self._format_menu_item("MCU Configuration", mcu_status) if mcu_status else "MCU Configuration     (Boards & connections)"),
-                ("2.2", self._format_menu_item("Printer Settings", printer_status) if printer_status else "Printer Settings      (Kinematics & limits)"),
-                ("2.3", self._format_menu_item("X Axis", x_status) if x_status else "X Axis                (Stepper & driver)"),
-            ]
+    def _hardware_setup_frame(self) -> MenuFrame:
+        """Menu frame for 2. Hardware Setup."""
+        def _coming_soon(choice: str) -> None:
+            # Placeholder for sections without a handler yet
+            self.ui.msgbox(
+                f"Section {choice} coming soon!\n\n"
+                "Optional hardware - implement as needed.",
+                title=f"Section {choice}"
+            )
 
-            # Show AWD X1 option if AWD enabled
+        return MenuFrame(
+            title="2. Hardware Setup",
+            build=self._build_hardware_setup_menu,
+            actions={
+                "2.1": self._mcu_setup_frame,
+                "2.2": self._printer_settings,
+                "2.3": lambda: self._stepper_axis("x"),
+                "2.3.1": lambda: self._stepper_axis("x1"),
+                "2.4": lambda: self._stepper_axis("y"),
+                "2.4.1": lambda: self._stepper_axis("y1"),
+                "2.5": self._stepper_z,
+                "2.6": self._extruder_setup,
+                "2.7": self._heater_bed_setup,
+                "2.8": self._fans_setup,
+                "2.9": self._probe_setup,
+                "2.10": self._homing_setup,
+                "2.11": self._bed_leveling_setup,
+                "2.12": self._temperature_sensors_setup,
+                "2.13": self._lighting_setup,
+                "2.14": self._filament_sensors_setup,
+                "2.15": self._display_setup,
+                "2.16": self._advanced_setup,
+            },
+            fallback=_coming_soon,
+            menu_kwargs={"height": 40, "width": 120},
+        )
+
+    def _build_hardware_setup_menu(self) -> Tuple[str, list]:
+        """Build the Hardware Setup prompt and items from current state."""
+        # Build menu items dynamically based on config
+        awd_enabled = self.state.get("printer.awd_enabled", False)
+
+        # Get status info for each section
+        # MCU Configuration
+        main_board_id = self.state.get("mcu.main.board_type", "")
+        main_board_name = self._get_board_name(main_board_id, "boards") if main_board_id else None
+        toolboard_id = self.state.get("mcu.toolboard.board_type", "")
+        toolboard_name = self._get_board_name(toolboard_id, "toolboards") if toolboard_id else None
+        mcu_status = None
+        if main_board_name:
+            mcu_status = main_board_name
+            if toolboard_name:
+                mcu_status += f", {toolboard_name}"
+
+        # Printer Settings
+        kinematics = self.state.get("printer.kinematics", "")
+        printer_status = None
+        if kinematics:
+            printer_status = kinematics.capitalize()
             if awd_enabled:
-                menu_items.append(("2.3.1", self._format_menu_item("X1 Axis (AWD)", x1_status) if x1_status else "X1 Axis (AWD)        (Secondary X stepper)"))
+                printer_status += " - AWD"
 
-            menu_items.append(("2.4", self._format_menu_item("Y Axis", y_status) if y_status else "Y Axis                (Stepper & driver)"))
+        # Stepper status helper
+        def get_stepper_status(axis):
+            driver = self.state.get(f"stepper_{axis}.driver_type", "")
+            if driver:
+                return driver
+            return None
 
-            # Show AWD Y1 option if AWD enabled
-            if awd_enabled:
-                menu_items.append(("2.4.1", self._format_menu_item("Y1 Axis (AWD)", y1_status) if y1_status else "Y1 Axis (AWD)        (Secondary Y stepper)"))
-
-            menu_items.extend([
-                ("2.5", self._format_menu_item("Z Axis", z_status) if z_status else "Z Axis                (Stepper(s) & driver(s))"),
-                ("2.6", self._format_menu_item("Extruder", extruder_status) if extruder_status else "Extruder              (Motor & hotend)"),
-                ("2.7", self._format_menu_item("Heated Bed", bed_status) if bed_status else "Heated Bed            (Heater & thermistor)"),
-                ("2.8", self._format_menu_item("Fans", fans_status) if fans_status else "Fans                  (Part cooling, hotend, etc.)"),
-                ("2.9", self._format_menu_item("Probe", probe_status) if probe_status else "Probe                 (BLTouch, Beacon, etc.)"),
-                ("2.10", self._format_menu_item("Homing", homing_status) if homing_status else "Homing               (Safe Z home, sensorless)"),
-                ("2.11", self._format_menu_item("Bed Leveling", leveling_status) if leveling_status else "Bed Leveling         (Mesh, Z tilt, QGL)"),
-                ("2.12", self._format_menu_item("Temperature Sensors", temp_sensors_status) if temp_sensors_status else "Temperature Sensors  (MCU, chamber, etc.)"),
-                ("2.13", self._format_menu_item("Lighting", leds_status) if leds_status else "Lighting             (Case light, LEDs, effects)"),
-                ("2.14", self._format_menu_item("Filament Sensors", filament_sensors_status) if filament_sensors_status else "Filament Sensors     (Runout detection)"),
-                ("2.15", self._format_menu_item("Display", display_status) if display_status else "Display              (LCD, OLED, KlipperScreen)"),
-                ("2.16", self._format_menu_item("Advanced", advanced_status) if advanced_status else "Advanced             (Servo, buttons, etc.)"),
-                ("B", "Back to Main Menu"),
-            ])
+        # X Axis
+        x_status = get_stepper_status("x")
 
-            choice = self.ui.menu(
-                "Hardware Setup - Configure Your Printer\n\n"
-                "Work through these sections to configure your hardware.",
-                menu_items,
-                title="2. Hardware Setup",
-                height=40,
-                width=120,
+        # Y Axis
+        y_status = get_stepper_status("y")
+
+        # X1 Axis
+        x1_status = get_stepper_status("x1") if awd_enabled else None
+
+        # Y1 Axis
+        y1_status = get_stepper_status("y1") if awd_enabled else None
+
+        # Z Axis
+        z_count = self.state.get("stepper_z.z_motor_count", None)
+        z_status = None
+        if z_count:
+            z_status = f"{z_count} motors"
+
+        # Extruder
+        extruder_type = self.state.get("extruder.extruder_type", "")
+        nozzle = self.state.get("extruder.nozzle_diameter", None)
+        extruder_status = None
+        if extruder_type:
+            extruder_status = extruder_type.replace("_", " ").title()
+            if nozzle:
+                extruder_status += f", {nozzle}mm"
+
+        # Heated Bed
+        bed_sensor = self.state.get("heater_bed.sensor_type", "")
+        bed_status = bed_sensor if bed_sensor else None
+
+        # Fans
+        part_loc = self.state.get("fans.part_cooling.location", "")
+        hotend_loc = self.state.get("fans.hotend.location", "")
+        controller_enabled = self.state.get("fans.controller.enabled", False)
+        fans_status = None
+        if part_loc or hotend_loc or controller_enabled:
+            parts = []
+            if part_loc:
+                parts.append(f"Part:{part_loc[:2]}")
+            if hotend_loc:
+                parts.append(f"Hotend:{hotend_loc[:2]}")
+            if controller_enabled:
+                parts.append("Ctrl")
+            fans_status = ", ".join(parts)
+
+        # Probe
+        probe_type = self.state.get("probe.probe_type", "")
+        probe_status = None
+        if probe_type and probe_type != "none":
+            # Format probe type nicely: capitalize and replace underscores
+            probe_status = probe_type.replace("_", " ").title()
+
+        # Homing
+        homing_method = self.state.get("homing.homing_method", "")
+        homing_status = None
+        if homing_method:
+            # Format homing method nicely: capitalize and replace underscores
+            homing_status = homing_method.replace("_", " ").title()
+
+        # Bed Leveling
+        leveling_type = self.state.get("bed_leveling.leveling_type", "")
+        mesh_enabled = self.state.get("bed_leveling.bed_mesh.enabled", False)
+        leveling_status = None
+        parts = []
+        if leveling_type and leveling_type != "none":
+            # Format leveling type nicely
+            formatted_type = (
+                leveling_type.replace("_", " ").upper()
+                if leveling_type == "qgl"
+                else leveling_type.replace("_", " ").title()
             )
+            parts.append(formatted_type)
+        if mesh_enabled:
+            parts.append("Mesh")
+        if parts:
+            leveling_status = " + ".join(parts)
+
+        # Temperature Sensors
+        temp_sensor_count = 0
+        if self.state.get("temperature_sensors.mcu_main.enabled", False):
+            temp_sensor_count += 1
+        if self.state.get("temperature_sensors.host.enabled", False):
+            temp_sensor_count += 1
+        if self.state.get("temperature_sensors.toolboard.enabled", False):
+            temp_sensor_count += 1
+        if self.state.get("temperature_sensors.chamber.enabled", False):
+            temp_sensor_count += 1
+        # Count additional user-defined sensors
+        additional_sensors = self.state.get("temperature_sensors.additional", [])
+        if isinstance(additional_sensors, list):
+            temp_sensor_count += len([s for s in additional_sensors if isinstance(s, dict)])
+        temp_sensors_status = None
+        if temp_sensor_count > 0:
+            temp_sensors_status = f"{temp_sensor_count} sensor{'s' if temp_sensor_count != 1 else ''}"
+
+        # LEDs
+        leds = self.state.get("leds", [])
+        if not isinstance(leds, list):
+            leds = []
+        leds_count = len(leds)
+        leds_status = None
+        if leds_count > 0:
+            leds_status = f"{leds_count} LED{'s' if leds_count != 1 else ''}"
+        if self.state.get("lighting.case_light.enabled", False):
+            leds_status = f"{leds_status} + case light" if leds_status else "case light"
+
+        # Filament Sensors
+        filament_sensors = self.state.get("filament_sensors", [])
+        if not isinstance(filament_sensors, list):
+            filament_sensors = []
+        filament_count = len(filament_sensors)
+        filament_sensors_status = None
+        if filament_count > 0:
+            filament_sensors_status = f"{filament_count} sensor{'s' if filament_count != 1 else ''}"
+
+        # Display (KlipperScreen first)
+        display_status = None
+        ks_enabled = self.state.get("display.klipperscreen.enabled", False)
+        try:
+            ks_installed = (HOME / "KlipperScreen").exists()
+        except Exception:
+            ks_installed = False
+        ks_running = False
+        if ks_installed:
+            # Try common service names
+            ks_active = self._systemctl_status("is-active", _KLIPPERSCREEN_SERVICES)
+            ks_running = "active" in ks_active.values()
+
+        if ks_running:
+            display_status = "KlipperScreen (running)"
+        elif ks_installed:
+            display_status = "KlipperScreen (installed)"
+        elif ks_enabled:
+            display_status = "KlipperScreen (enabled)"
+
+        # Advanced
+        advanced_status = None
+        adv_parts = []
+        if self.state.get("advanced.force_move.enable_force_move", False):
+            adv_parts.append("ForceMove")
+        if self.state.get("advanced.firmware_retraction.enabled", False):
+            adv_parts.append("FWRetract")
+        if adv_parts:
+            advanced_status = ", ".join(adv_parts)
+
+        menu_items = [
+            ("2.1", self._format_menu_item("MCU Configuration", mcu_status) if mcu_status else "MCU Configuration     (Boards & connections)"),
+            ("2.2", self._format_menu_item("Printer Settings", printer_status) if printer_status else "Printer Settings      (Kinematics & limits)"),
+            ("2.3", self._format_menu_item("X Axis", x_status) if x_status else "X Axis                (Stepper & driver)"),
+        ]
 
-            if choice is None or choice == "B":
-                break
-            elif choice == "2.1":
-                self._mcu_setup()
-            elif choice == "2.2":
-                self._printer_settings()
-            elif choice == "2.3":
-                self._stepper_axis("x")
-            elif choice == "2.3.1":
-                self._stepper_axis("x1")
-            elif choice == "2.4":
-                self._stepper_axis("y")
-            elif choice == "2.4.1":
-                self._stepper_axis("y1")
-            elif choice == "2.5":
-                self._stepper_z()
-            elif choice == "2.6":
-                self._extruder_setup()
-            elif choice == "2.7":
-                self._heater_bed_setup()
-            elif choice == "2.8":
-                self._fans_setup()
-            elif choice == "2.9":
-                self._probe_setup()
-            elif choice == "2.10":
-                self._homing_setup()
-            elif choice == "2.11":
-                self._bed_leveling_setup()
-            elif choice == "2.12":
-                self._temperature_sensors_setup()
-            elif choice == "2.13":
-                self._lighting_setup()
-            elif choice == "2.14":
-                self._filament_sensors_setup()
-            elif choice == "2.15":
-                self._display_setup()
-            elif choice == "2.16":
-                self._advanced_setup()
-            else:
-                # Placeholder for remaining sections (2.15-2.16)
-                self.ui.msgbox(
-                    f"Section {choice} coming soon!\n\n"
-                    "Optional hardware - implement as needed.",
-                    title=f"Section {choice}"
-                )
+        # Show AWD X1 option if AWD enabled
+        if awd_enabled:
+            menu_items.append(("2.3.1", self._format_menu_item("X1 Axis (AWD)", x1_status) if x1_status else "X1 Axis (AWD)        (Secondary X stepper)"))
+
+        menu_items.append(("2.4", self._format_menu_item("Y Axis", y_status) if y_status else "Y Axis                (Stepper & driver)"))
+
+        # Show AWD Y1 option if AWD enabled
+        if awd_enabled:
+            menu_items.append(("2.4.1", self._format_menu_item("Y1 Axis (AWD)", y1_status) if y1_status else "Y1 Axis (AWD)        (Secondary Y stepper)"))
+
+        menu_items.extend([
+            ("2.5", self._format_menu_item("Z Axis", z_status) if z_status else "Z Axis                (Stepper(s) & driver(s))"),
+            ("2.6", self._format_menu_item("Extruder", extruder_status) if extruder_status else "Extruder              (Motor & hotend)"),
+            ("2.7", self._format_menu_item("Heated Bed", bed_status) if bed_status else "Heated Bed            (Heater & thermistor)"),
+            ("2.8", self._format_menu_item("Fans", fans_status) if fans_status else "Fans                  (Part cooling, hotend, etc.)"),
+            ("2.9", self._format_menu_item("Probe", probe_status) if probe_status else "Probe                 (BLTouch, Beacon, etc.)"),
+            ("2.10", self._format_menu_item("Homing", homing_status) if homing_status else "Homing               (Safe Z home, sensorless)"),
+            ("2.11", self._format_menu_item("Bed Leveling", leveling_status) if leveling_status else "Bed Leveling         (Mesh, Z tilt, QGL)"),
+            ("2.12", self._format_menu_item("Temperature Sensors", temp_sensors_status) if temp_sensors_status else "Temperature Sensors  (MCU, chamber, etc.)"),
+            ("2.13", self._format_menu_item("Lighting", leds_status) if leds_status else "Lighting             (Case light, LEDs, effects)"),
+            ("2.14", self._format_menu_item("Filament Sensors", filament_sensors_status) if filament_sensors_status else "Filament Sensors     (Runout detection)"),
+            ("2.15", self._format_menu_item("Display", display_status) if display_status else "Display              (LCD, OLED, KlipperScreen)"),
+            ("2.16", self._format_menu_item("Advanced", advanced_status) if advanced_status else "Advanced             (Servo, buttons, etc.)"),
+            ("B", "Back to Main Menu"),
+        ])
+
+        return (
+            "Hardware Setup - Configure Your Printer\n\n"
+            "Work through these sections to configure your hardware.",
+            menu_items,
+        )
 
     def _mcu_setup(self) -> None:
         """MCU configuration wizard."""
-        while True:
+        self._run_menu_stack(self._mcu_setup_frame())
+
+    def _mcu_setup_frame(self) -> MenuFrame:
+        """Menu frame for 2.1 MCU Configuration."""
+        def _build() -> Tuple[str, list]:
             # Get current configuration status
             main_board_id = self.state.get("mcu.main.board_type", "")
             main_board_name = self._get_board_name(main_board_id, "boards") if main_board_id else None
@@ -2391,33 +2681,29 @@ class GschpooziWizard:
             host_enabled = self.state.get("mcu.host.enabled", False)
 
             # Format menu items with status
-            menu_items = [
-                ("2.1.1", self._format_menu_item("Main Board", main_board_name) if main_board_name else "Main Board            (Required)"),
-                ("2.1.2", self._format_menu_item("Toolhead Board", toolboard_name) if toolboard_name else "Toolhead Board        (Optional)"),
-                ("2.1.3", self._format_menu_item("Host MCU", "Enabled" if host_enabled else None) if host_enabled else "Host MCU              (For ADXL, GPIO)"),
-                ("2.1.4", "Additional MCUs       (Multi-board setups)"),
-                ("B", "Back"),
-            ]
-
-            choice = self.ui.menu(
+            return (
                 "MCU Configuration\n\n"
                 "Configure your printer's control boards.",
-                menu_items,
-                title="2.1 MCU Configuration",
+                [
+                    ("2.1.1", self._format_menu_item("Main Board", main_board_name) if main_board_name else "Main Board            (Required)"),
+                    ("2.1.2", self._format_menu_item("Toolhead Board", toolboard_name) if toolboard_name else "Toolhead Board        (Optional)"),
+                    ("2.1.3", self._format_menu_item("Host MCU", "Enabled" if host_enabled else None) if host_enabled else "Host MCU              (For ADXL, GPIO)"),
+                    ("2.1.4", "Additional MCUs       (Multi-board setups)"),
+                    ("B", "Back"),
+                ],
             )
 
-            if choice is None or choice == "B":
-                break
-            elif choice == "2.1.1":
-                self._configure_main_board()
-            elif choice == "2.1.2":
-                self._configure_toolboard()
-            elif choice == "2.1.3":
-                self._configure_host_mcu()
-            elif choice == "2.1.4":
-                self._additional_mcus_setup()
-            else:
-                self.ui.msgbox("Coming soon!", title=choice)
+        return MenuFrame(
+            title="2.1 MCU Configuration",
+            build=_build,
+            actions={
+                "2.1.1": self._configure_main_board,
+                "2.1.2": self._configure_toolboard,
+                "2.1.3": self._configure_host_mcu,
+                "2.1.4": self._additional_mcus_setup,
+            },
+            fallback=lambda choice: self.ui.msgbox("Coming soon!", title=choice),
+        )
 
     def _additional_mcus_setup(self) -> None:
         """Configure additional MCUs (MMU/filament changers, buffers, expansion boards)."""
@@ -2784,12 +3070,11 @@ class GschpooziWizard:
                 self.ui.msgbox("Buffer saved.", title="Saved")
                 continue
 
+    @_touches_services
     def _install_happy_hare(self) -> None:
         """Install Happy Hare MMU stack (interactive installer)."""
-        from pathlib import Path
-
         repo = "https://github.com/moggieuk/Happy-Hare.git"
-        target_dir = Path.home() / "Happy-Hare"
+        target_dir = HOME / "Happy-Hare"
         installer = target_dir / "install.sh"
 
         if not self.ui.yesno(
@@ -2854,12 +3139,11 @@ class GschpooziWizard:
                 title="Happy Hare",
             )
 
+    @_touches_services
     def _install_afc(self) -> None:
         """Install AFC-Klipper-Add-On stack (interactive installer)."""
-        from pathlib import Path
-
         repo = "https://github.com/ArmoredTurtle/AFC-Klipper-Add-On.git"
-        target_dir = Path.home() / "AFC-Klipper-Add-On"
+        target_dir = HOME / "AFC-Klipper-Add-On"
         installer = target_dir / "install-afc.sh"
 
         if not self.ui.yesno(
@@ -3012,24 +3296,19 @@ class GschpooziWizard:
         # Serial detection (placeholder)
         self.ui.infobox("Scanning for connected MCUs...", title="Detecting")
 
-        import subprocess
-        import time
-        time.sleep(1)  # Simulated scan
-
         # Try to find serial devices
         serial_path = ""
-        serial_dir = Path("/dev/serial/by-id")
-        if serial_dir.exists():
-            devices = list(serial_dir.iterdir())
+        devices = _list_serial_devices()
+        if devices is not None:
             if devices:
                 # Build mapping: short_name -> full_path
                 serial_map = {}
                 device_items = []
-                for i, d in enumerate(devices):
-                    short_name = self._format_serial_name(str(d))
+                for i, (d, _name) in enumerate(devices):
+                    short_name = self._format_serial_name(d)
                     # Use index prefix to ensure uniqueness
                     tag = f"{i+1}. {short_name}"
-                    serial_map[tag] = str(d)
+                    serial_map[tag] = d
                     device_items.append((tag, "", False))
 
                 device_items.append(("manual", "Enter path manually", False))
@@ -3056,10 +3335,10 @@ class GschpooziWizard:
 
         if serial_path:
             # Save configuration
-            self.state.set("mcu.main.board_type", board)
-            self.state.set("mcu.main.serial", serial_path)
-            self.state.set("mcu.main.connection_type", "USB")
-            self.state.save()
+            with self.state.transaction():
+                self.state.set("mcu.main.board_type", board)
+                self.state.set("mcu.main.serial", serial_path)
+                self.state.set("mcu.main.connection_type", "USB")
 
             self.ui.msgbox(
                 f"Main board configured!\n\n"
@@ -3132,18 +3411,16 @@ class GschpooziWizard:
 
         # Save connection type immediately and clear incompatible fields
         # This ensures connection_type is persisted even if user cancels serial/UUID entry
-        if conn_type == "CAN":
-            self.state.set("mcu.toolboard.connection_type", "CAN")
-            # Clear USB-specific fields to prevent stale data
-            self.state.delete("mcu.toolboard.serial")
-        else:  # USB
-            self.state.set("mcu.toolboard.connection_type", "USB")
-            # Clear CAN-specific fields to prevent stale data
-            self.state.delete("mcu.toolboard.canbus_uuid")
-            self.state.delete("mcu.toolboard.canbus_bitrate")
-
-        # Save immediately to ensure persistence
-        self.state.save()
+        with self.state.transaction():
+            if conn_type == "CAN":
+                self.state.set("mcu.toolboard.connection_type", "CAN")
+                # Clear USB-specific fields to prevent stale data
+                self.state.delete("mcu.toolboard.serial")
+            else:  # USB
+                self.state.set("mcu.toolboard.connection_type", "USB")
+                # Clear CAN-specific fields to prevent stale data
+                self.state.delete("mcu.toolboard.canbus_uuid")
+                self.state.delete("mcu.toolboard.canbus_bitrate")
 
         if conn_type == "CAN":
             self.ui.msgbox(
@@ -3178,9 +3455,9 @@ class GschpooziWizard:
 
             if uuid:
                 # connection_type already saved above
-                self.state.set("mcu.toolboard.canbus_uuid", uuid)
-                self.state.set("mcu.toolboard.canbus_bitrate", int(bitrate or 1000000))
-                self.state.save()
+                with self.state.transaction():
+                    self.state.set("mcu.toolboard.canbus_uuid", uuid)
+                    self.state.set("mcu.toolboard.canbus_bitrate", int(bitrate or 1000000))
 
                 self.ui.msgbox(f"Toolboard configured!\n\nUUID: {uuid}", title="Success")
         else:
@@ -3189,23 +3466,20 @@ class GschpooziWizard:
             current_serial = self.state.get("mcu.toolboard.serial", "")
 
             self.ui.infobox("Scanning for USB devices...", title="Detecting")
-            import time
-            time.sleep(1)
 
             serial = None
-            serial_dir = Path("/dev/serial/by-id")
-            if serial_dir.exists():
-                devices = list(serial_dir.iterdir())
+            devices = _list_serial_devices()
+            if devices is not None:
                 if devices:
                     # Build mapping: short_name -> full_path
                     serial_map = {}
                     device_items = []
-                    for i, d in enumerate(devices):
-                        short_name = self._format_serial_name(str(d))
+                    for i, (d, _name) in enumerate(devices):
+                        short_name = self._format_serial_name(d)
                         tag = f"{i+1}. {short_name}"
-                        serial_map[tag] = str(d)
+                        serial_map[tag] = d
                         # Preselect if this matches saved serial
-                        is_selected = (str(d) == current_serial)
+                        is_selected = (d == current_serial)
                         device_items.append((tag, "", is_selected))
 
                     device_items.append(("manual", "Enter path manually", False))
@@ -3363,24 +3637,24 @@ class GschpooziWizard:
         )
 
         # Save
-        self.state.set("printer.kinematics", kinematics)
-        self.state.set("printer.awd_enabled", awd_enabled)
-        self.state.set("printer.bed_size_x", int(bed_x))
-        self.state.set("printer.bed_size_y", int(bed_y))
-        self.state.set("printer.bed_size_z", int(bed_z))
-        self.state.set("printer.max_velocity", int(max_velocity or 300))
-        self.state.set("printer.max_accel", int(max_accel or 3000))
-        self.state.set("printer.max_z_velocity", int(max_z_velocity or 15))
-        self.state.set("printer.max_z_accel", int(max_z_accel or 350))
-        if square_corner_velocity not in (None, ""):
-            # Allow explicit 0
-            try:
-                self.state.set("printer.square_corner_velocity", float(square_corner_velocity))
-            except ValueError:
-                self.state.set("printer.square_corner_velocity", square_corner_velocity)
-        else:
-            self.state.delete("printer.square_corner_velocity")
-        self.state.save()
+        with self.state.transaction():
+            self.state.set("printer.kinematics", kinematics)
+            self.state.set("printer.awd_enabled", awd_enabled)
+            self.state.set("printer.bed_size_x", int(bed_x))
+            self.state.set("printer.bed_size_y", int(bed_y))
+            self.state.set("printer.bed_size_z", int(bed_z))
+            self.state.set("printer.max_velocity", int(max_velocity or 300))
+            self.state.set("printer.max_accel", int(max_accel or 3000))
+            self.state.set("printer.max_z_velocity", int(max_z_velocity or 15))
+            self.state.set("printer.max_z_accel", int(max_z_accel or 350))
+            if square_corner_velocity not in (None, ""):
+                # Allow explicit 0
+                try:
+                    self.state.set("printer.square_corner_velocity", float(square_corner_velocity))
+                except ValueError:
+                    self.state.set("printer.square_corner_velocity", square_corner_velocity)
+            else:
+                self.state.delete("printer.square_corner_velocity")
 
         awd_text = "AWD: Enabled\n" if awd_enabled else ""
         self.ui.msgbox(
@@ -3407,6 +3681,7 @@ class GschpooziWizard:
         """
         axis_upper = axis.upper()
         state_key = f"stepper_{axis}"
+        keys = _stepper_keys(axis)
         is_secondary = axis in ("x1", "y1")
 
         # Determine inheritance source
@@ -3462,7 +3737,7 @@ class GschpooziWizard:
 
         # Motor port selection using PinManager (filters used ports)
         pin_manager = self._get_pin_manager()
-        current_port = self.state.get(f"{state_key}.motor_port", "")
+        current_port = self.state.get(keys["motor_port"], "")
         # Mark current port as available for reselection
         if current_port:
             pin_manager.mark_unused("mainboard", current_port)
@@ -3477,11 +3752,11 @@ class GschpooziWizard:
             return
 
         # Persist early so later cancels don't wipe already-selected values.
-        self.state.set(f"{state_key}.motor_port", motor_port)
+        self.state.set(keys["motor_port"], motor_port)
         self.state.save()
 
         # Direction pin inversion (always ask - this differs per motor)
-        current_inverted = self.state.get(f"{state_key}.dir_pin_inverted", False)
+        current_inverted = self.state.get(keys["dir_pin_inverted"], False)
         dir_inverted = self.ui.yesno(
             f"Invert direction pin for {axis_upper}?\n\n"
             "(If motor moves wrong direction, change this)",
@@ -3490,7 +3765,7 @@ class GschpooziWizard:
         )
 
         # Persist early so later cancels don't wipe already-selected values.
-        self.state.set(f"{state_key}.dir_pin_inverted", dir_inverted)
+        self.state.set(keys["dir_pin_inverted"], dir_inverted)
         self.state.save()
 
         # If inheriting, copy settings and only ask for axis-specific things
@@ -3502,8 +3777,8 @@ class GschpooziWizard:
             # For primary axes (Y), still need endstop config
             if not is_secondary:
                 # Load saved endstop type
-                current_endstop_type = self.state.get(f"{state_key}.endstop_type", "physical")
-                inherited_driver = self.state.get(f"{state_key}.driver_type", "TMC2209")
+                current_endstop_type = self.state.get(keys["endstop_type"], "physical")
+                inherited_driver = self.state.get(keys["driver_type"], "TMC2209")
                 if inherited_driver in NO_STALLGUARD_DRIVERS:
                     self.ui.msgbox(
                         f"{inherited_driver} does not support StallGuard.\n"
@@ -3524,7 +3799,7 @@ class GschpooziWizard:
                 if endstop_type is None:
                     return
                 # Persist immediately so cancelling later doesn't lose it.
-                self.state.set(f"{state_key}.endstop_type", endstop_type)
+                self.state.set(keys["endstop_type"], endstop_type)
                 self.state.save()
 
                 # Physical endstop port and config
@@ -3532,12 +3807,12 @@ class GschpooziWizard:
                 if endstop_type == "physical":
                     # Allow selecting endstop on mainboard vs toolboard when a toolboard exists.
                     has_toolboard = bool(self.state.get("mcu.toolboard.connection_type"))
-                    current_endstop_src = self.state.get(f"{state_key}.endstop_source", "")
+                    current_endstop_src = self.state.get(keys["endstop_source"], "")
                     if not current_endstop_src:
                         # Infer from existing stored ports so the UI reflects prior choices.
-                        if self.state.get(f"{state_key}.endstop_port_toolboard"):
+                        if self.state.get(keys["endstop_port_toolboard"]):
                             current_endstop_src = "toolboard"
-                        elif self.state.get(f"{state_key}.endstop_port"):
+                        elif self.state.get(keys["endstop_port"]):
                             current_endstop_src = "mainboard"
                         else:
                             current_endstop_src = "mainboard"
@@ -3557,20 +3832,20 @@ class GschpooziWizard:
                         endstop_source = "mainboard"
 
                     # Persist location immediately so it doesn't get lost on later cancels.
-                    self.state.set(f"{state_key}.endstop_source", endstop_source)
+                    self.state.set(keys["endstop_source"], endstop_source)
                     self.state.save()
 
                     board_type = "toolboards" if endstop_source == "toolboard" else "boards"
                     if endstop_source == "toolboard":
-                        current_endstop_port = self.state.get(f"{state_key}.endstop_port_toolboard", "")
+                        current_endstop_port = self.state.get(keys["endstop_port_toolboard"], "")
                     else:
-                        current_endstop_port = self.state.get(f"{state_key}.endstop_port", "")
+                        current_endstop_port = self.state.get(keys["endstop_port"], "")
 
                     # Global DIY rule: allow selecting ANY known-capable pin/port (not just endstop_ports),
                     # and always show already-assigned pins with a warning (but still selectable).
                     pin_manager = self._get_pin_manager()
-                    current_pullup = bool(self.state.get(f"{state_key}.endstop_pullup", True))
-                    current_invert = bool(self.state.get(f"{state_key}.endstop_invert", False))
+                    current_pullup = bool(self.state.get(keys["endstop_pullup"], True))
+                    current_invert = bool(self.state.get(keys["endstop_invert"], False))
 
                     selected = pin_manager.select_digital_input(
                         endstop_source,
@@ -3598,36 +3873,36 @@ class GschpooziWizard:
 
                     # Persist chosen endstop port immediately and clear the other side to avoid ambiguity.
                     if endstop_source == "toolboard":
-                        self.state.set(f"{state_key}.endstop_port_toolboard", endstop_port)
-                        self.state.delete(f"{state_key}.endstop_port")
+                        self.state.set(keys["endstop_port_toolboard"], endstop_port)
+                        self.state.delete(keys["endstop_port"])
                     else:
-                        self.state.set(f"{state_key}.endstop_port", endstop_port)
-                        self.state.delete(f"{state_key}.endstop_port_toolboard")
+                        self.state.set(keys["endstop_port"], endstop_port)
+                        self.state.delete(keys["endstop_port_toolboard"])
                     self.state.save()
 
                     # Persist config immediately so it is reflected when re-entering the menu.
-                    self.state.set(f"{state_key}.endstop_pullup", bool(endstop_pullup))
-                    self.state.set(f"{state_key}.endstop_invert", bool(endstop_invert))
+                    self.state.set(keys["endstop_pullup"], bool(endstop_pullup))
+                    self.state.set(keys["endstop_invert"], bool(endstop_invert))
                     # Drop legacy encoding going forward
-                    self.state.delete(f"{state_key}.endstop_config")
+                    self.state.delete(keys["endstop_config"])
                     self.state.save()
                 else:
                     # Sensorless: clear any stale physical endstop wiring info.
-                    self.state.delete(f"{state_key}.endstop_source")
-                    self.state.delete(f"{state_key}.endstop_port")
-                    self.state.delete(f"{state_key}.endstop_port_toolboard")
-                    self.state.delete(f"{state_key}.endstop_pullup")
-                    self.state.delete(f"{state_key}.endstop_invert")
-                    self.state.delete(f"{state_key}.endstop_config")
+                    self.state.delete(keys["endstop_source"])
+                    self.state.delete(keys["endstop_port"])
+                    self.state.delete(keys["endstop_port_toolboard"])
+                    self.state.delete(keys["endstop_pullup"])
+                    self.state.delete(keys["endstop_invert"])
+                    self.state.delete(keys["endstop_config"])
                     self.state.save()
 
                     # Sensorless homing configuration
-                    driver_protocol = self.state.get(f"{state_key}.driver_protocol", "uart")
-                    driver_type = self.state.get(f"{state_key}.driver_type", "TMC2209")
+                    driver_protocol = self.state.get(keys["driver_protocol"], "uart")
+                    driver_type = self.state.get(keys["driver_type"], "TMC2209")
 
                     if driver_protocol == "spi":
                         # SPI drivers (TMC5160, etc.) use driver_SGT: range -64 to 63
-                        current_sgt = self.state.get(f"{state_key}.driver_SGT", 1)
+                        current_sgt = self.state.get(keys["driver_SGT"], 1)
                         sgt_value = self.ui.inputbox(
                             f"StallGuard threshold (driver_SGT) for {axis_upper}:\n\n"
                             f"Driver: {driver_type} (SPI)\n"
@@ -3645,12 +3920,12 @@ class GschpooziWizard:
                             try:
                                 val = int(sgt_value)
                                 val = max(-64, min(63, val))  # Clamp to valid range
-                                self.state.set(f"{state_key}.driver_SGT", val)
+                                self.state.set(keys["driver_SGT"], val)
                             except ValueError:
                                 pass
                     else:
                         # UART drivers (TMC2209, etc.) use driver_SGTHRS: range 0 to 255
-                        current_sgthrs = self.state.get(f"{state_key}.driver_SGTHRS", 70)
+                        current_sgthrs = self.state.get(keys["driver_SGTHRS"], 70)
                         sgthrs_value = self.ui.inputbox(
                             f"StallGuard threshold (driver_SGTHRS) for {axis_upper}:\n\n"
                             f"Driver: {driver_type} (UART)\n"
@@ -3668,13 +3943,13 @@ class GschpooziWizard:
                             try:
                                 val = int(sgthrs_value)
                                 val = max(0, min(255, val))  # Clamp to valid range
-                                self.state.set(f"{state_key}.driver_SGTHRS", val)
+                                self.state.set(keys["driver_SGTHRS"], val)
                             except ValueError:
                                 pass
 
                     # Homing current (optional - reduced current for gentler homing)
-                    run_current = self.state.get(f"{state_key}.run_current", 1.0)
-                    current_homing_current = self.state.get(f"{state_key}.homing_current")
+                    run_current = self.state.get(keys["run_current"], 1.0)
+                    current_homing_current = self.state.get(keys["homing_current"])
                     default_homing = str(current_homing_current) if current_homing_current else ""
 
                     homing_current = self.ui.inputbox(
@@ -3693,16 +3968,16 @@ class GschpooziWizard:
                         homing_current = homing_current.strip()
                         if homing_current:
                             try:
-                                self.state.set(f"{state_key}.homing_current", float(homing_current))
+                                self.state.set(keys["homing_current"], float(homing_current))
                             except ValueError:
                                 pass
                         else:
-                            self.state.delete(f"{state_key}.homing_current")
+                            self.state.delete(keys["homing_current"])
 
                     self.state.save()
 
                 bed_size = self.state.get(f"printer.bed_size_{axis}", 350)
-                current_position_max = self.state.get(f"{state_key}.position_max", bed_size)
+                current_position_max = self.state.get(keys["position_max"], bed_size)
                 position_max = self._inputbox_debug(
                     f"Position max for {axis_upper} (mm):",
                     default=str(current_position_max),
@@ -3719,13 +3994,13 @@ class GschpooziWizard:
                     return
                 # Persist immediately.
                 try:
-                    self.state.set(f"{state_key}.position_max", int(float(position_max)))
+                    self.state.set(keys["position_max"], int(float(position_max)))
                     self.state.save()
                 except Exception:
                     # Keep prior value if parse fails; final validation will catch issues.
                     pass
 
-                current_position_endstop = self.state.get(f"{state_key}.position_endstop", position_max)
+                current_position_endstop = self.state.get(keys["position_endstop"], position_max)
                 position_endstop = self._inputbox_debug(
                     f"Position endstop for {axis_upper} (0 for min, {position_max} for max):",
                     default=str(current_position_endstop),
@@ -3742,7 +4017,7 @@ class GschpooziWizard:
                     return
                 # Persist immediately.
                 try:
-                    self.state.set(f"{state_key}.position_endstop", int(float(position_endstop)))
+                    self.state.set(keys["position_endstop"], int(float(position_endstop)))
                     self.state.save()
                 except Exception:
                     pass
@@ -3754,7 +4029,7 @@ class GschpooziWizard:
                 except Exception:
                     parsed_endstop = float(current_position_endstop) if current_position_endstop is not None else 0.0
 
-                current_position_min = self.state.get(f"{state_key}.position_min", None)
+                current_position_min = self.state.get(keys["position_min"], None)
                 if current_position_min is None:
                     current_position_min = int(parsed_endstop) if parsed_endstop < 0 else 0
 
@@ -3775,13 +4050,13 @@ class GschpooziWizard:
                     return
                 # Persist immediately.
                 try:
-                    self.state.set(f"{state_key}.position_min", int(float(position_min)))
+                    self.state.set(keys["position_min"], int(float(position_min)))
                     self.state.save()
                 except Exception:
                     pass
 
                 # Homing settings
-                current_homing_speed = self.state.get(f"{state_key}.homing_speed", 50)
+                current_homing_speed = self.state.get(keys["homing_speed"], 50)
                 homing_speed = self.ui.inputbox(
                     f"Homing speed for {axis_upper} (mm/s):\n\n"
                     "Speed at which axis moves toward endstop.\n\n"
@@ -3799,12 +4074,12 @@ class GschpooziWizard:
                     return
                 # Persist immediately.
                 try:
-                    self.state.set(f"{state_key}.homing_speed", int(float(homing_speed)))
+                    self.state.set(keys["homing_speed"], int(float(homing_speed)))
                     self.state.save()
                 except Exception:
                     pass
 
-                current_retract = self.state.get(f"{state_key}.homing_retract_dist", 5.0 if endstop_type == "physical" else 0.0)
+                current_retract = self.state.get(keys["homing_retract_dist"], 5.0 if endstop_type == "physical" else 0.0)
                 default_retract = "0" if endstop_type == "sensorless" else str(int(current_retract))
                 homing_retract_dist = self.ui.inputbox(
                     f"Homing retract distance for {axis_upper} (mm):\n\n"
@@ -3822,13 +4097,13 @@ class GschpooziWizard:
                     return
                 # Persist immediately (0 is valid).
                 try:
-                    self.state.set(f"{state_key}.homing_retract_dist", float(homing_retract_dist))
+                    self.state.set(keys["homing_retract_dist"], float(homing_retract_dist))
                     self.state.save()
                 except Exception:
                     pass
 
                 second_homing_speed = None
-                current_has_second = self.state.get(f"{state_key}.second_homing_speed") is not None
+                current_has_second = self.state.get(keys["second_homing_speed"]) is not None
                 if self.ui.yesno(
                     f"Use second (slower) homing speed for {axis_upper}?\n\n"
                     "After first touch, back off and home again slowly\n"
@@ -3836,7 +4111,7 @@ class GschpooziWizard:
                     title=f"Stepper {axis_upper} - Second Homing Speed",
                     default_no=not current_has_second
                 ):
-                    current_second = self.state.get(f"{state_key}.second_homing_speed", 10)
+                    current_second = self.state.get(keys["second_homing_speed"], 10)
                     second_homing_speed = self.ui.inputbox(
                         f"Second homing speed for {axis_upper} (mm/s):\n\n"
                         "Slower speed for the second homing move.\n"
@@ -3851,73 +4126,73 @@ class GschpooziWizard:
                     if second_homing_speed is None:
                         return
                     try:
-                        self.state.set(f"{state_key}.second_homing_speed", int(float(second_homing_speed)))
+                        self.state.set(keys["second_homing_speed"], int(float(second_homing_speed)))
                         self.state.save()
                     except Exception:
                         pass
                 else:
                     # If user disables it, clear stale value.
                     if current_has_second:
-                        self.state.delete(f"{state_key}.second_homing_speed")
+                        self.state.delete(keys["second_homing_speed"])
                         self.state.save()
 
                 # Persist final pass for consistency (but avoid clobbering toolboard vs mainboard endstop keys).
-                self.state.set(f"{state_key}.endstop_type", endstop_type or "physical")
+                self.state.set(keys["endstop_type"], endstop_type or "physical")
                 if endstop_type == "physical":
-                    resolved_source = locals().get("endstop_source") or self.state.get(f"{state_key}.endstop_source") or "mainboard"
+                    resolved_source = locals().get("endstop_source") or self.state.get(keys["endstop_source"]) or "mainboard"
                     if endstop_port:
                         if resolved_source == "toolboard":
-                            self.state.set(f"{state_key}.endstop_port_toolboard", endstop_port)
-                            self.state.delete(f"{state_key}.endstop_port")
+                            self.state.set(keys["endstop_port_toolboard"], endstop_port)
+                            self.state.delete(keys["endstop_port"])
                         else:
-                            self.state.set(f"{state_key}.endstop_port", endstop_port)
-                            self.state.delete(f"{state_key}.endstop_port_toolboard")
+                            self.state.set(keys["endstop_port"], endstop_port)
+                            self.state.delete(keys["endstop_port_toolboard"])
                     # Ensure legacy endstop_config stays removed
-                    self.state.delete(f"{state_key}.endstop_config")
+                    self.state.delete(keys["endstop_config"])
                 else:
-                    self.state.delete(f"{state_key}.endstop_source")
-                    self.state.delete(f"{state_key}.endstop_port")
-                    self.state.delete(f"{state_key}.endstop_port_toolboard")
-                    self.state.delete(f"{state_key}.endstop_pullup")
-                    self.state.delete(f"{state_key}.endstop_invert")
-                    self.state.delete(f"{state_key}.endstop_config")
+                    self.state.delete(keys["endstop_source"])
+                    self.state.delete(keys["endstop_port"])
+                    self.state.delete(keys["endstop_port_toolboard"])
+                    self.state.delete(keys["endstop_pullup"])
+                    self.state.delete(keys["endstop_invert"])
+                    self.state.delete(keys["endstop_config"])
 
                 bed_size = self.state.get(f"printer.bed_size_{axis}", 350)
                 try:
-                    self.state.set(f"{state_key}.position_max", int(float(position_max or bed_size)))
+                    self.state.set(keys["position_max"], int(float(position_max or bed_size)))
                 except Exception:
-                    self.state.set(f"{state_key}.position_max", int(bed_size))
+                    self.state.set(keys["position_max"], int(bed_size))
                 try:
-                    self.state.set(f"{state_key}.position_endstop", int(float(position_endstop or position_max or bed_size)))
+                    self.state.set(keys["position_endstop"], int(float(position_endstop or position_max or bed_size)))
                 except Exception:
-                    self.state.set(f"{state_key}.position_endstop", int(float(self.state.get(f"{state_key}.position_endstop", 0) or 0)))
+                    self.state.set(keys["position_endstop"], int(float(self.state.get(keys["position_endstop"], 0) or 0)))
                 try:
-                    self.state.set(f"{state_key}.position_min", int(float(position_min)))
+                    self.state.set(keys["position_min"], int(float(position_min)))
                 except Exception:
                     pass
                 try:
-                    self.state.set(f"{state_key}.homing_speed", int(float(homing_speed or 50)))
+                    self.state.set(keys["homing_speed"], int(float(homing_speed or 50)))
                 except Exception:
                     pass
                 try:
                     # 0 is valid
-                    self.state.set(f"{state_key}.homing_retract_dist", float(homing_retract_dist))
+                    self.state.set(keys["homing_retract_dist"], float(homing_retract_dist))
                 except Exception:
                     pass
                 if second_homing_speed:
                     try:
-                        self.state.set(f"{state_key}.second_homing_speed", int(float(second_homing_speed)))
+                        self.state.set(keys["second_homing_speed"], int(float(second_homing_speed)))
                     except Exception:
                         pass
 
             # Save axis-specific settings
-            self.state.set(f"{state_key}.motor_port", motor_port)
-            self.state.set(f"{state_key}.dir_pin_inverted", dir_inverted)
+            self.state.set(keys["motor_port"], motor_port)
+            self.state.set(keys["dir_pin_inverted"], dir_inverted)
             self.state.save()
 
             # Summary
-            inherited_driver = self.state.get(f"{state_key}.driver_type")
-            inherited_current = self.state.get(f"{state_key}.run_current")
+            inherited_driver = self.state.get(keys["driver_type"])
+            inherited_current = self.state.get(keys["run_current"])
 
             if is_secondary:
                 self.ui.msgbox(
@@ -3925,7 +4200,7 @@ class GschpooziWizard:
                     f"Motor: {motor_port}\n"
                     f"Direction inverted: {'Yes' if dir_inverted else 'No'}\n"
                     f"(Inherited from {inherit_from.upper()}: {inherited_driver}, {inherited_current}A)",
-                    title="Configuration Saved"
+                    title=_TITLE_SAVED
                 )
             else:
                 self.ui.msgbox(
@@ -3935,14 +4210,14 @@ class GschpooziWizard:
                     f"Endstop: {endstop_type}\n"
                     f"Position: 0 to {position_max}mm\n"
                     f"(Inherited from {inherit_from.upper()}: {inherited_driver}, {inherited_current}A)",
-                    title="Configuration Saved"
+                    title=_TITLE_SAVED
                 )
             return
 
         # === FULL CONFIGURATION (no inheritance) ===
 
         # Belt configuration
-        current_belt = self.state.get(f"{state_key}.belt_pitch", 2)
+        current_belt = self.state.get(keys["belt_pitch"], 2)
         belt_pitch = self.ui.radiolist(
             f"Belt pitch for {axis_upper} axis:",
             [
@@ -3954,10 +4229,10 @@ class GschpooziWizard:
         )
         if belt_pitch is None:
             return
-        self.state.set(f"{state_key}.belt_pitch", float(belt_pitch))
+        self.state.set(keys["belt_pitch"], float(belt_pitch))
         self.state.save()
 
-        current_pulley = self.state.get(f"{state_key}.pulley_teeth", 20)
+        current_pulley = self.state.get(keys["pulley_teeth"], 20)
         pulley_teeth = self.ui.radiolist(
             f"Pulley teeth for {axis_upper} axis:",
             [
@@ -3971,13 +4246,13 @@ class GschpooziWizard:
         )
         if pulley_teeth is None:
             return
-        self.state.set(f"{state_key}.pulley_teeth", int(pulley_teeth))
+        self.state.set(keys["pulley_teeth"], int(pulley_teeth))
         self.state.save()
 
         # Microsteps
         # Default to 16 for X/Y motion steppers unless explicitly set (common on many builds)
         default_microsteps = 16 if axis in ("x", "y", "x1", "y1") else 32
-        current_microsteps = self.state.get(f"{state_key}.microsteps", default_microsteps)
+        current_microsteps = self.state.get(keys["microsteps"], default_microsteps)
         microsteps = self.ui.radiolist(
             f"Microsteps for {axis_upper}:",
             [
@@ -3989,11 +4264,11 @@ class GschpooziWizard:
         )
         if microsteps is None:
             return
-        self.state.set(f"{state_key}.microsteps", int(microsteps))
+        self.state.set(keys["microsteps"], int(microsteps))
         self.state.save()
 
         # Full steps per rotation (motor type)
-        current_steps = self.state.get(f"{state_key}.full_steps_per_rotation", 200)
+        current_steps = self.state.get(keys["full_steps_per_rotation"], 200)
         full_steps = self.ui.radiolist(
             f"Motor step angle for {axis_upper}:",
             [
@@ -4004,14 +4279,14 @@ class GschpooziWizard:
         )
         if full_steps is None:
             return
-        self.state.set(f"{state_key}.full_steps_per_rotation", int(full_steps))
+        self.state.set(keys["full_steps_per_rotation"], int(full_steps))
         self.state.save()
 
         # TMC Driver Type (default to the board's onboard drivers when fixed,
         # e.g. Duet 2 has soldered TMC2660s)
         board_data = self._load_board_data(self.state.get("mcu.main.board_type", ""), "boards")
         onboard_driver = (board_data or {}).get("onboard_drivers", "")
-        current_driver = self.state.get(f"{state_key}.driver_type", onboard_driver or "TMC2209")
+        current_driver = self.state.get(keys["driver_type"], onboard_driver or "TMC2209")
         driver_type = self.ui.radiolist(
             f"TMC driver type for {axis_upper}:",
             [
@@ -4025,15 +4300,15 @@ class GschpooziWizard:
         )
         if driver_type is None:
             return
-        self.state.set(f"{state_key}.driver_type", driver_type)
-        self.state.set(f"{state_key}.driver_protocol", "spi" if driver_type in SPI_DRIVERS else "uart")
+        self.state.set(keys["driver_type"], driver_type)
+        self.state.set(keys["driver_protocol"], "spi" if driver_type in SPI_DRIVERS else "uart")
         self.state.save()
 
         # Determine protocol from driver type
         driver_protocol = "spi" if driver_type in SPI_DRIVERS else "uart"
 
         # Run current
-        current_current = self.state.get(f"{state_key}.run_current", 1.0)
+        current_current = self.state.get(keys["run_current"], 1.0)
         default_current = "1.7" if driver_type == "TMC5160" else str(current_current)
         run_current = self.ui.inputbox(
             f"TMC run current for {axis_upper} (A):\n\n"
@@ -4054,14 +4329,14 @@ class GschpooziWizard:
         if run_current is None:
             return
         try:
-            self.state.set(f"{state_key}.run_current", float(run_current))
+            self.state.set(keys["run_current"], float(run_current))
             self.state.save()
         except ValueError:
             # Keep previous value if user input isn't parseable; final validation will catch if needed.
             pass
 
         # Hold current (optional)
-        current_hold = self.state.get(f"{state_key}.hold_current", "")
+        current_hold = self.state.get(keys["hold_current"], "")
         hold_current = self.ui.inputbox(
             f"TMC hold current for {axis_upper} (A):\n\n"
             "Current when motor is stationary (holding position).\n"
@@ -4082,17 +4357,17 @@ class GschpooziWizard:
             return
         if hold_current.strip():
             try:
-                self.state.set(f"{state_key}.hold_current", float(hold_current))
+                self.state.set(keys["hold_current"], float(hold_current))
                 self.state.save()
             except ValueError:
                 pass
         else:
             # Clear hold_current if empty (use run_current)
-            self.state.delete(f"{state_key}.hold_current")
+            self.state.delete(keys["hold_current"])
             self.state.save()
 
         # StealthChop threshold
-        current_stealth = self.state.get(f"{state_key}.stealthchop_threshold", "")
+        current_stealth = self.state.get(keys["stealthchop_threshold"], "")
         stealthchop = self.ui.inputbox(
             f"StealthChop threshold for {axis_upper} (mm/s):\n\n"
             "Speed below which stealthChop (quiet mode) is active.\n"
@@ -4113,18 +4388,18 @@ class GschpooziWizard:
             return
         if stealthchop.strip():
             try:
-                self.state.set(f"{state_key}.stealthchop_threshold", int(stealthchop))
+                self.state.set(keys["stealthchop_threshold"], int(stealthchop))
                 self.state.save()
             except ValueError:
                 pass
         else:
-            self.state.delete(f"{state_key}.stealthchop_threshold")
+            self.state.delete(keys["stealthchop_threshold"])
             self.state.save()
 
         # SPI-specific settings
         sense_resistor = None
         if driver_protocol == "spi":
-            current_sense = self.state.get(f"{state_key}.sense_resistor", 0.075)
+            current_sense = self.state.get(keys["sense_resistor"], 0.075)
             sense_resistor = self.ui.radiolist(
                 f"Sense resistor for {axis_upper}:\n\n"
                 "(Check your driver board specifications)",
@@ -4139,7 +4414,7 @@ class GschpooziWizard:
             )
             if sense_resistor is None:
                 return
-            self.state.set(f"{state_key}.sense_resistor", float(sense_resistor))
+            self.state.set(keys["sense_resistor"], float(sense_resistor))
             self.state.save()
 
         # Endstop configuration (only for primary steppers)
@@ -4152,7 +4427,7 @@ class GschpooziWizard:
         second_homing_speed = None
 
         if not is_secondary:
-            current_endstop = self.state.get(f"{state_key}.endstop_type", "physical")
+            current_endstop = self.state.get(keys["endstop_type"], "physical")
             if driver_type in NO_STALLGUARD_DRIVERS:
                 self.ui.msgbox(
                     f"{driver_type} does not support StallGuard.\n"
@@ -4173,19 +4448,19 @@ class GschpooziWizard:
             if endstop_type is None:
                 return
             # Persist immediately.
-            self.state.set(f"{state_key}.endstop_type", endstop_type)
+            self.state.set(keys["endstop_type"], endstop_type)
             self.state.save()
 
             # Physical endstop port and config
             if endstop_type == "physical":
                 # If a toolboard exists, allow selecting endstop from mainboard or toolboard.
                 has_toolboard = bool(self.state.get("mcu.toolboard.connection_type"))
-                current_endstop_src = self.state.get(f"{state_key}.endstop_source", "")
+                current_endstop_src = self.state.get(keys["endstop_source"], "")
                 if not current_endstop_src:
                     # Infer from existing stored ports so the UI reflects prior choices.
-                    if self.state.get(f"{state_key}.endstop_port_toolboard"):
+                    if self.state.get(keys["endstop_port_toolboard"]):
                         current_endstop_src = "toolboard"
-                    elif self.state.get(f"{state_key}.endstop_port"):
+                    elif self.state.get(keys["endstop_port"]):
                         current_endstop_src = "mainboard"
                     else:
                         current_endstop_src = "mainboard"
@@ -4204,18 +4479,18 @@ class GschpooziWizard:
                     endstop_source = "mainboard"
 
                 # Persist location immediately so it doesn't get lost on later cancels.
-                self.state.set(f"{state_key}.endstop_source", endstop_source)
+                self.state.set(keys["endstop_source"], endstop_source)
                 self.state.save()
 
                 # Global DIY rule: allow selecting ANY known-capable pin/port (not just endstop_ports),
                 # and always show already-assigned pins with a warning (but still selectable).
                 pin_manager = self._get_pin_manager()
                 if endstop_source == "toolboard":
-                    current_port = self.state.get(f"{state_key}.endstop_port_toolboard", "")
+                    current_port = self.state.get(keys["endstop_port_toolboard"], "")
                 else:
-                    current_port = self.state.get(f"{state_key}.endstop_port", "")
-                current_pullup = bool(self.state.get(f"{state_key}.endstop_pullup", True))
-                current_invert = bool(self.state.get(f"{state_key}.endstop_invert", False))
+                    current_port = self.state.get(keys["endstop_port"], "")
+                current_pullup = bool(self.state.get(keys["endstop_pullup"], True))
+                current_invert = bool(self.state.get(keys["endstop_invert"], False))
 
                 selected = pin_manager.select_digital_input(
                     endstop_source,
@@ -4243,35 +4518,35 @@ class GschpooziWizard:
 
                 # Persist chosen endstop port immediately and clear the other side to avoid ambiguity.
                 if endstop_source == "toolboard":
-                    self.state.set(f"{state_key}.endstop_port_toolboard", endstop_port)
-                    self.state.delete(f"{state_key}.endstop_port")
+                    self.state.set(keys["endstop_port_toolboard"], endstop_port)
+                    self.state.delete(keys["endstop_port"])
                 else:
-                    self.state.set(f"{state_key}.endstop_port", endstop_port)
-                    self.state.delete(f"{state_key}.endstop_port_toolboard")
+                    self.state.set(keys["endstop_port"], endstop_port)
+                    self.state.delete(keys["endstop_port_toolboard"])
                 self.state.save()
 
                 # Persist config immediately so it is reflected when re-entering the menu.
-                self.state.set(f"{state_key}.endstop_pullup", bool(endstop_pullup))
-                self.state.set(f"{state_key}.endstop_invert", bool(endstop_invert))
-                self.state.delete(f"{state_key}.endstop_config")
+                self.state.set(keys["endstop_pullup"], bool(endstop_pullup))
+                self.state.set(keys["endstop_invert"], bool(endstop_invert))
+                self.state.delete(keys["endstop_config"])
                 self.state.save()
             else:
                 # Sensorless: clear any stale physical endstop wiring info.
-                self.state.delete(f"{state_key}.endstop_source")
-                self.state.delete(f"{state_key}.endstop_port")
-                self.state.delete(f"{state_key}.endstop_port_toolboard")
-                self.state.delete(f"{state_key}.endstop_pullup")
-                self.state.delete(f"{state_key}.endstop_invert")
-                self.state.delete(f"{state_key}.endstop_config")
+                self.state.delete(keys["endstop_source"])
+                self.state.delete(keys["endstop_port"])
+                self.state.delete(keys["endstop_port_toolboard"])
+                self.state.delete(keys["endstop_pullup"])
+                self.state.delete(keys["endstop_invert"])
+                self.state.delete(keys["endstop_config"])
                 self.state.save()
 
                 # Sensorless homing configuration
-                driver_protocol = self.state.get(f"{state_key}.driver_protocol", "uart")
-                driver_type = self.state.get(f"{state_key}.driver_type", "TMC2209")
+                driver_protocol = self.state.get(keys["driver_protocol"], "uart")
+                driver_type = self.state.get(keys["driver_type"], "TMC2209")
 
                 if driver_protocol == "spi":
                     # SPI drivers (TMC5160, etc.) use driver_SGT: range -64 to 63
-                    current_sgt = self.state.get(f"{state_key}.driver_SGT", 1)
+                    current_sgt = self.state.get(keys["driver_SGT"], 1)
                     sgt_value = self.ui.inputbox(
                         f"StallGuard threshold (driver_SGT) for {axis_upper}:\n\n"
                         f"Driver: {driver_type} (SPI)\n"
@@ -4289,12 +4564,12 @@ class GschpooziWizard:
                         try:
                             val = int(sgt_value)
                             val = max(-64, min(63, val))  # Clamp to valid range
-                            self.state.set(f"{state_key}.driver_SGT", val)
+                            self.state.set(keys["driver_SGT"], val)
                         except ValueError:
                             pass
                 else:
                     # UART drivers (TMC2209, etc.) use driver_SGTHRS: range 0 to 255
-                    current_sgthrs = self.state.get(f"{state_key}.driver_SGTHRS", 70)
+                    current_sgthrs = self.state.get(keys["driver_SGTHRS"], 70)
                     sgthrs_value = self.ui.inputbox(
                         f"StallGuard threshold (driver_SGTHRS) for {axis_upper}:\n\n"
                         f"Driver: {driver_type} (UART)\n"
@@ -4312,13 +4587,13 @@ class GschpooziWizard:
                         try:
                             val = int(sgthrs_value)
                             val = max(0, min(255, val))  # Clamp to valid range
-                            self.state.set(f"{state_key}.driver_SGTHRS", val)
+                            self.state.set(keys["driver_SGTHRS"], val)
                         except ValueError:
                             pass
 
                 # Homing current (optional - reduced current for gentler homing)
-                run_current = self.state.get(f"{state_key}.run_current", 1.0)
-                current_homing_current = self.state.get(f"{state_key}.homing_current")
+                run_current = self.state.get(keys["run_current"], 1.0)
+                current_homing_current = self.state.get(keys["homing_current"])
                 default_homing = str(current_homing_current) if current_homing_current else ""
 
                 homing_current = self.ui.inputbox(
@@ -4337,16 +4612,16 @@ class GschpooziWizard:
                     homing_current = homing_current.strip()
                     if homing_current:
                         try:
-                            self.state.set(f"{state_key}.homing_current", float(homing_current))
+                            self.state.set(keys["homing_current"], float(homing_current))
                         except ValueError:
                             pass
                     else:
-                        self.state.delete(f"{state_key}.homing_current")
+                        self.state.delete(keys["homing_current"])
 
                 self.state.save()
 
             bed_size = self.state.get(f"printer.bed_size_{axis}", 350)
-            current_max = self.state.get(f"{state_key}.position_max", bed_size)
+            current_max = self.state.get(keys["position_max"], bed_size)
             position_max = self._inputbox_debug(
                 f"Position max for {axis_upper} (mm):",
                 default=str(current_max),
@@ -4363,12 +4638,12 @@ class GschpooziWizard:
                 return
             # Persist immediately.
             try:
-                self.state.set(f"{state_key}.position_max", int(float(position_max)))
+                self.state.set(keys["position_max"], int(float(position_max)))
                 self.state.save()
             except Exception:
                 pass
 
-            current_endstop_pos = self.state.get(f"{state_key}.position_endstop", position_max)
+            current_endstop_pos = self.state.get(keys["position_endstop"], position_max)
             position_endstop = self._inputbox_debug(
                 f"Position endstop for {axis_upper} (0 for min, {position_max} for max):",
                 default=str(current_endstop_pos),
@@ -4385,7 +4660,7 @@ class GschpooziWizard:
                 return
             # Persist immediately.
             try:
-                self.state.set(f"{state_key}.position_endstop", int(float(position_endstop)))
+                self.state.set(keys["position_endstop"], int(float(position_endstop)))
                 self.state.save()
             except Exception:
                 pass
@@ -4396,7 +4671,7 @@ class GschpooziWizard:
             except Exception:
                 parsed_endstop = float(current_endstop_pos) if current_endstop_pos is not None else 0.0
 
-            current_min = self.state.get(f"{state_key}.position_min", None)
+            current_min = self.state.get(keys["position_min"], None)
             if current_min is None:
                 current_min = int(parsed_endstop) if parsed_endstop < 0 else 0
 
@@ -4418,13 +4693,13 @@ class GschpooziWizard:
                 return
             # Persist immediately.
             try:
-                self.state.set(f"{state_key}.position_min", int(float(position_min)))
+                self.state.set(keys["position_min"], int(float(position_min)))
                 self.state.save()
             except Exception:
                 pass
 
             # Homing settings
-            current_homing_speed = self.state.get(f"{state_key}.homing_speed", 50)
+            current_homing_speed = self.state.get(keys["homing_speed"], 50)
             homing_speed = self.ui.inputbox(
                 f"Homing speed for {axis_upper} (mm/s):\n\n"
                 "Speed at which axis moves toward endstop.\n\n"
@@ -4442,12 +4717,12 @@ class GschpooziWizard:
                 return
             # Persist immediately.
             try:
-                self.state.set(f"{state_key}.homing_speed", int(float(homing_speed)))
+                self.state.set(keys["homing_speed"], int(float(homing_speed)))
                 self.state.save()
             except Exception:
                 pass
 
-            current_retract = self.state.get(f"{state_key}.homing_retract_dist", 5.0)
+            current_retract = self.state.get(keys["homing_retract_dist"], 5.0)
             default_retract = "0" if endstop_type == "sensorless" else "5"
             homing_retract_dist = self.ui.inputbox(
                 f"Homing retract distance for {axis_upper} (mm):\n\n"
@@ -4465,13 +4740,13 @@ class GschpooziWizard:
                 return
             # Persist immediately (0 is valid).
             try:
-                self.state.set(f"{state_key}.homing_retract_dist", float(homing_retract_dist))
+                self.state.set(keys["homing_retract_dist"], float(homing_retract_dist))
                 self.state.save()
             except Exception:
                 pass
 
             # Optional second homing speed - check if already configured
-            current_has_second = self.state.get(f"{state_key}.second_homing_speed") is not None
+            current_has_second = self.state.get(keys["second_homing_speed"]) is not None
             if self.ui.yesno(
                 f"Use second (slower) homing speed for {axis_upper}?\n\n"
                 "After first touch, back off and home again slowly\n"
@@ -4479,7 +4754,7 @@ class GschpooziWizard:
                 title=f"Stepper {axis_upper} - Second Homing Speed",
                 default_no=not current_has_second
             ):
-                current_second = self.state.get(f"{state_key}.second_homing_speed", 10)
+                current_second = self.state.get(keys["second_homing_speed"], 10)
                 second_homing_speed = self.ui.inputbox(
                     f"Second homing speed for {axis_upper} (mm/s):\n\n"
                     "Slower speed for the second homing move.\n"
@@ -4494,56 +4769,56 @@ class GschpooziWizard:
                 if second_homing_speed is None:
                     return
                 try:
-                    self.state.set(f"{state_key}.second_homing_speed", int(float(second_homing_speed)))
+                    self.state.set(keys["second_homing_speed"], int(float(second_homing_speed)))
                     self.state.save()
                 except Exception:
                     pass
             else:
                 # If user disables it, clear stale value.
                 if current_has_second:
-                    self.state.delete(f"{state_key}.second_homing_speed")
+                    self.state.delete(keys["second_homing_speed"])
                     self.state.save()
 
         # Save all settings
-        self.state.set(f"{state_key}.motor_port", motor_port)
-        self.state.set(f"{state_key}.dir_pin_inverted", dir_inverted)
-        self.state.set(f"{state_key}.belt_pitch", float(belt_pitch or 2))
-        self.state.set(f"{state_key}.pulley_teeth", int(pulley_teeth or 20))
-        self.state.set(f"{state_key}.microsteps", int(microsteps or 32))
-        self.state.set(f"{state_key}.full_steps_per_rotation", int(full_steps or 200))
-        self.state.set(f"{state_key}.driver_type", driver_type or "TMC2209")
-        self.state.set(f"{state_key}.driver_protocol", driver_protocol)
-        self.state.set(f"{state_key}.run_current", float(run_current or 1.0))
+        self.state.set(keys["motor_port"], motor_port)
+        self.state.set(keys["dir_pin_inverted"], dir_inverted)
+        self.state.set(keys["belt_pitch"], float(belt_pitch or 2))
+        self.state.set(keys["pulley_teeth"], int(pulley_teeth or 20))
+        self.state.set(keys["microsteps"], int(microsteps or 32))
+        self.state.set(keys["full_steps_per_rotation"], int(full_steps or 200))
+        self.state.set(keys["driver_type"], driver_type or "TMC2209")
+        self.state.set(keys["driver_protocol"], driver_protocol)
+        self.state.set(keys["run_current"], float(run_current or 1.0))
 
         if sense_resistor:
-            self.state.set(f"{state_key}.sense_resistor", float(sense_resistor))
+            self.state.set(keys["sense_resistor"], float(sense_resistor))
 
         if not is_secondary:
-            self.state.set(f"{state_key}.endstop_type", endstop_type or "physical")
+            self.state.set(keys["endstop_type"], endstop_type or "physical")
             if endstop_type == "physical" and endstop_port:
                 # Persist which side we used so the generator schema can render the right pin map.
                 if "endstop_source" in locals():
-                    self.state.set(f"{state_key}.endstop_source", endstop_source)
+                    self.state.set(keys["endstop_source"], endstop_source)
                 if "endstop_source" in locals() and endstop_source == "toolboard":
-                    self.state.set(f"{state_key}.endstop_port_toolboard", endstop_port)
+                    self.state.set(keys["endstop_port_toolboard"], endstop_port)
                     # Clear mainboard key to avoid ambiguity
-                    self.state.delete(f"{state_key}.endstop_port")
+                    self.state.delete(keys["endstop_port"])
                 else:
-                    self.state.set(f"{state_key}.endstop_port", endstop_port)
-                    self.state.delete(f"{state_key}.endstop_port_toolboard")
+                    self.state.set(keys["endstop_port"], endstop_port)
+                    self.state.delete(keys["endstop_port_toolboard"])
             # Ensure we do not keep the legacy endstop_config encoding; templates use
             # endstop_pullup/endstop_invert (with fallback for older state).
-            self.state.delete(f"{state_key}.endstop_config")
+            self.state.delete(keys["endstop_config"])
             bed_size = self.state.get(f"printer.bed_size_{axis}", 350)
-            self.state.set(f"{state_key}.position_max", int(position_max or bed_size))
-            self.state.set(f"{state_key}.position_endstop", int(position_endstop or position_max or bed_size))
-            self.state.set(f"{state_key}.position_min", int(float(position_min)))
+            self.state.set(keys["position_max"], int(position_max or bed_size))
+            self.state.set(keys["position_endstop"], int(position_endstop or position_max or bed_size))
+            self.state.set(keys["position_min"], int(float(position_min)))
             if homing_speed:
-                self.state.set(f"{state_key}.homing_speed", int(homing_speed or 50))
+                self.state.set(keys["homing_speed"], int(homing_speed or 50))
             if homing_retract_dist:
-                self.state.set(f"{state_key}.homing_retract_dist", float(homing_retract_dist or (0 if endstop_type == "sensorless" else 5)))
+                self.state.set(keys["homing_retract_dist"], float(homing_retract_dist or (0 if endstop_type == "sensorless" else 5)))
             if second_homing_speed:
-                self.state.set(f"{state_key}.second_homing_speed", int(second_homing_speed))
+                self.state.set(keys["second_homing_speed"], int(second_homing_speed))
 
         self.state.save()
 
@@ -4555,7 +4830,7 @@ class GschpooziWizard:
                 f"Microsteps: {microsteps}\n"
                 f"Driver: {driver_type}\n"
                 f"Current: {run_current}A",
-                title="Configuration Saved"
+                title=_TITLE_SAVED
             )
         else:
             self.ui.msgbox(
@@ -4567,7 +4842,7 @@ class GschpooziWizard:
                 f"Endstop: {endstop_type}\n"
                 f"Position: 0 to {position_max}mm\n"
                 f"Current: {run_current}A",
-                title="Configuration Saved"
+                title=_TITLE_SAVED
             )
 
     def _stepper_z(self) -> None:
@@ -4840,7 +5115,7 @@ class GschpooziWizard:
             f"Endstop: {endstop_type}\n"
             f"Height: {position_max}mm\n"
             f"Current: {run_current}A",
-            title="Configuration Saved"
+            title=_TITLE_SAVED
         )
 
     def _configure_z_motor_ports(self, z_count: int) -> None:
@@ -5530,7 +5805,7 @@ class GschpooziWizard:
             f"  Temp range: {min_temp}°C - {max_temp}°C\n"
             f"  Drive: {drive_type}\n"
             f"  Nozzle: {nozzle_diameter}mm",
-            title="Configuration Saved"
+            title=_TITLE_SAVED
         )
 
     def _collect_used_mainboard_pins(self, exclude_bed: bool = False) -> set:
@@ -5948,7 +6223,7 @@ class GschpooziWizard:
             f"Control: {control}\n"
             f"Surface(s): {', '.join(surface_types)}\n\n"
             "Remember to run PID_CALIBRATE HEATER=heater_bed TARGET=60",
-            title="Configuration Saved"
+            title=_TITLE_SAVED
         )
 
     def _fans_setup(self) -> None:
@@ -6455,115 +6730,96 @@ class GschpooziWizard:
             else:
                 cleaned_additional_fans.append(fan)
 
-        # Save part cooling fan
-        # State keys must match config-sections.yaml template expectations
-        self.state.set("fans.part_cooling.location", part_location)
-        if part_location == "toolboard":
-            self.state.set("fans.part_cooling.pin_toolboard", part_pin)
-            self.state.delete("fans.part_cooling.pin_mainboard")  # Clear other key
-        else:
-            self.state.set("fans.part_cooling.pin_mainboard", part_pin)
-            self.state.delete("fans.part_cooling.pin_toolboard")  # Clear other key
-        self.state.set("fans.part_cooling.max_power", float(max_power or 1.0))
-        self.state.set("fans.part_cooling.cycle_time", float(cycle_time or 0.002))
-        self.state.set("fans.part_cooling.hardware_pwm", bool(hardware_pwm))
-        self.state.set("fans.part_cooling.shutdown_speed", float(shutdown_speed or 0))
-        # Remove invalid parameters if they exist (from old configs)
-        self.state.delete("fans.part_cooling.kick_start_time")
-        self.state.delete("fans.part_cooling.off_below")
-        # Save progress even if user later cancels out
-        self.state.save()
-
-        # Save hotend fan
-        # State keys must match config-sections.yaml template expectations
-        self.state.set("fans.hotend.location", hotend_location)
-        if hotend_location == "toolboard":
-            self.state.set("fans.hotend.pin_toolboard", hotend_pin)
-            self.state.delete("fans.hotend.pin_mainboard")  # Clear other key
-        else:
-            self.state.set("fans.hotend.pin_mainboard", hotend_pin)
-            self.state.delete("fans.hotend.pin_toolboard")  # Clear other key
-        self.state.set("fans.hotend.heater", heater or "extruder")
-        self.state.set("fans.hotend.heater_temp", int(heater_temp or 50))
-        self.state.set("fans.hotend.fan_speed", float(fan_speed or 1.0))
-        # Save progress even if user later cancels out
-        self.state.save()
-
-        # Save controller fan
-        self.state.set("fans.controller.enabled", has_controller_fan)
-        if has_controller_fan and controller_pin:
-            self.state.set("fans.controller.pin", controller_pin)  # Changed from port
-            self.state.set("fans.controller.kick_start_time", float(controller_kick_start or 0.5))
-            self.state.set("fans.controller.stepper", stepper or "stepper_x")
-            self.state.set("fans.controller.idle_timeout", int(idle_timeout or 60))
-            self.state.set("fans.controller.idle_speed", float(idle_speed or 0.5))
-        else:
-            self.state.delete("fans.controller.pin")
-            self.state.delete("fans.controller.kick_start_time")
-            self.state.delete("fans.controller.stepper")
-            self.state.delete("fans.controller.idle_timeout")
-            self.state.delete("fans.controller.idle_speed")
-        # Save progress even if user later cancels out
-        self.state.save()
-
-        if cleaned_additional_fans:
-            self.state.set("fans.additional_fans", cleaned_additional_fans)
-        else:
-            self.state.delete("fans.additional_fans")
-        if multi_pins:
-            self.state.set("advanced.multi_pins", multi_pins)
-        else:
-            self.state.delete("advanced.multi_pins")
-
-        self.state.save()
-
-        summary = (
-            f"Part cooling: {part_location} ({part_pin})\n"
-            f"Hotend: {hotend_location} ({hotend_pin})\n"
-            f"Controller fan: {'Yes (' + controller_pin + ')' if has_controller_fan and controller_pin else 'No'}"
-        )
-        if cleaned_additional_fans:
-            summary += f"\nAdditional: {', '.join(f.get('name', 'Unknown') for f in cleaned_additional_fans)}"
+        with self.state.transaction():
+            # Save part cooling fan
+            # State keys must match config-sections.yaml template expectations
+            self.state.set_if_changed("fans.part_cooling.location", part_location)
+            if part_location == "toolboard":
+                self.state.set_if_changed("fans.part_cooling.pin_toolboard", part_pin)
+                self.state.delete("fans.part_cooling.pin_mainboard")  # Clear other key
+            else:
+                self.state.set_if_changed("fans.part_cooling.pin_mainboard", part_pin)
+                self.state.delete("fans.part_cooling.pin_toolboard")  # Clear other key
+            self.state.set_if_changed("fans.part_cooling.max_power", float(max_power or 1.0))
+            self.state.set_if_changed("fans.part_cooling.cycle_time", float(cycle_time or 0.002))
+            self.state.set_if_changed("fans.part_cooling.hardware_pwm", bool(hardware_pwm))
+            self.state.set_if_changed("fans.part_cooling.shutdown_speed", float(shutdown_speed or 0))
+            # Remove invalid parameters if they exist (from old configs)
+            self.state.delete("fans.part_cooling.kick_start_time")
+            self.state.delete("fans.part_cooling.off_below")
+
+            # Save hotend fan
+            # State keys must match config-sections.yaml template expectations
+            self.state.set_if_changed("fans.hotend.location", hotend_location)
+            if hotend_location == "toolboard":
+                self.state.set_if_changed("fans.hotend.pin_toolboard", hotend_pin)
+                self.state.delete("fans.hotend.pin_mainboard")  # Clear other key
+            else:
+                self.state.set_if_changed("fans.hotend.pin_mainboard", hotend_pin)
+                self.state.delete("fans.hotend.pin_toolboard")  # Clear other key
+            self.state.set_if_changed("fans.hotend.heater", heater or "extruder")
+            self.state.set_if_changed("fans.hotend.heater_temp", int(heater_temp or 50))
+            self.state.set_if_changed("fans.hotend.fan_speed", float(fan_speed or 1.0))
+
+            # Save controller fan
+            self.state.set_if_changed("fans.controller.enabled", has_controller_fan)
+            if has_controller_fan and controller_pin:
+                self.state.set_if_changed("fans.controller.pin", controller_pin)  # Changed from port
+                self.state.set_if_changed("fans.controller.kick_start_time", float(controller_kick_start or 0.5))
+                self.state.set_if_changed("fans.controller.stepper", stepper or "stepper_x")
+                self.state.set_if_changed("fans.controller.idle_timeout", int(idle_timeout or 60))
+                self.state.set_if_changed("fans.controller.idle_speed", float(idle_speed or 0.5))
+            else:
+                self.state.delete("fans.controller.pin")
+                self.state.delete("fans.controller.kick_start_time")
+                self.state.delete("fans.controller.stepper")
+                self.state.delete("fans.controller.idle_timeout")
+                self.state.delete("fans.controller.idle_speed")
+
+            if cleaned_additional_fans:
+                self.state.set_if_changed("fans.additional_fans", cleaned_additional_fans)
+            else:
+                self.state.delete("fans.additional_fans")
+            if multi_pins:
+                self.state.set_if_changed("advanced.multi_pins", multi_pins)
+            else:
+                self.state.delete("advanced.multi_pins")
 
         self.ui.msgbox(
-            f"Fans configured!\n\n{summary}",
-            title="Configuration Saved"
+            _wizard_template("fans_saved").render(
+                part_location=part_location,
+                part_pin=part_pin,
+                hotend_location=hotend_location,
+                hotend_pin=hotend_pin,
+                controller_pin=controller_pin if has_controller_fan else None,
+                additional_fans=cleaned_additional_fans,
+            ),
+            title=_TITLE_SAVED
         )
 
     def _probe_setup(self) -> None:
         """Configure probe."""
-        probe_types = [
-            ("none", "No Probe"),
-            ("tap", "Voron Tap"),
-            ("klicky", "Klicky / Euclid"),
-            ("bltouch", "BLTouch / 3DTouch"),
-            ("inductive", "Inductive (PINDA)"),
-            ("beacon", "Beacon (eddy current)"),
-            ("cartographer", "Cartographer"),
-            ("btt_eddy", "BTT Eddy"),
-        ]
-
         # Load saved probe type
         current_probe_type = self.state.get("probe.probe_type", "tap")
         probe_type = self.ui.radiolist(
             "Select your probe type:",
-            [(k, v, k == current_probe_type) for k, v in probe_types],
+            _radio_items(_PROBE_TYPES, current_probe_type),
             title="Probe - Type"
         )
         if probe_type is None:
             return
 
         if probe_type == "none":
-            self.state.delete("probe")
+            self.state.pop_subtree("probe")
             self.state.save()
             return
 
         # Check if probe module needs to be installed (beacon/cartographer)
-        if probe_type in ["beacon", "cartographer"]:
+        if probe_type in _CONTACT_EDDY_PROBES:
             self._check_and_install_probe_module(probe_type)
 
         # Eddy current probes have their own serial connection
-        eddy_probes = ["beacon", "cartographer", "btt_eddy"]
+        eddy_probes = _EDDY_PROBES
 
         # Offsets (for non-Tap probes)
         if probe_type != "tap":
@@ -6621,21 +6877,19 @@ class GschpooziWizard:
         if probe_type in eddy_probes:
             # Serial detection
             self.ui.infobox("Scanning for probe serial...", title="Detecting")
-            import time
-            time.sleep(1)
 
             # Try to find serial device
-            serial_dir = Path("/dev/serial/by-id")
+            all_devices = _list_serial_devices()
             serial_devices = []
-            if serial_dir.exists():
+            if all_devices is not None:
                 probe_patterns = {
                     "beacon": "Beacon",
                     "cartographer": "Cartographer",
                     "btt_eddy": "BTT"
                 }
                 pattern = probe_patterns.get(probe_type, "")
-                serial_devices = [str(d) for d in serial_dir.iterdir()
-                                  if pattern.lower() in d.name.lower()]
+                serial_devices = [path for path, name in all_devices
+                                  if pattern.lower() in name.lower()]
 
             # Load saved serial
             current_serial = self.state.get("probe.serial", "")
@@ -6907,29 +7161,58 @@ class GschpooziWizard:
                 return
 
         # Save
-        self.state.set("probe.probe_type", probe_type)
-        self.state.set("probe.x_offset", float(x_offset or 0))
-        self.state.set("probe.y_offset", float(y_offset or 0))
-        # Save z_offset - handle negative values properly
-        if z_offset is not None and z_offset != "":
-            try:
-                self.state.set("probe.z_offset", float(z_offset))
-            except ValueError:
-                self.state.set("probe.z_offset", 0.0)
-
-        # Save samples configuration (non-eddy probes only)
-        if samples:
-            self.state.set("probe.samples", int(samples))
-        if samples_tolerance:
-            self.state.set("probe.samples_tolerance", float(samples_tolerance))
-
-        if serial:
-            self.state.set("probe.serial", serial)
-        if homing_mode:
-            self.state.set("probe.homing_mode", homing_mode)
-        if contact_max_temp:
-            contact_max_val = int(contact_max_temp)
-            self.state.set("probe.contact_max_hotend_temperature", contact_max_val)
+        contact_max_val = None
+        with self.state.transaction():
+            self.state.set_if_changed("probe.probe_type", probe_type)
+            if probe_type == "tap":
+                # Tap sits on the nozzle: offsets are fixed, nothing to parse
+                self.state.set_if_changed("probe.x_offset", 0.0)
+                self.state.set_if_changed("probe.y_offset", 0.0)
+            else:
+                self.state.set_if_changed("probe.x_offset", float(x_offset or 0))
+                self.state.set_if_changed("probe.y_offset", float(y_offset or 0))
+            # Save z_offset - handle negative values properly
+            if z_offset is not None and z_offset != "":
+                try:
+                    self.state.set_if_changed("probe.z_offset", float(z_offset))
+                except ValueError:
+                    self.state.set_if_changed("probe.z_offset", 0.0)
+
+            # Save samples configuration (non-eddy probes only)
+            if samples:
+                self.state.set_if_changed("probe.samples", int(samples))
+            if samples_tolerance:
+                self.state.set_if_changed("probe.samples_tolerance", float(samples_tolerance))
+
+            if serial:
+                self.state.set_if_changed("probe.serial", serial)
+            if homing_mode:
+                self.state.set_if_changed("probe.homing_mode", homing_mode)
+            if contact_max_temp:
+                contact_max_val = int(contact_max_temp)
+                self.state.set_if_changed("probe.contact_max_hotend_temperature", contact_max_val)
+            if mesh_main_direction:
+                self.state.set_if_changed("probe.bed_mesh.mesh_main_direction", mesh_main_direction)
+            if mesh_runs:
+                self.state.set_if_changed("probe.bed_mesh.mesh_runs", int(mesh_runs))
+            if location:
+                self.state.set_if_changed("probe.location", location)
+
+            # Save probe pins
+            if sensor_pin:
+                self.state.set_if_changed("probe.sensor_pin", sensor_pin)
+            if control_pin:
+                self.state.set_if_changed("probe.control_pin", control_pin)
+            if probe_pin:
+                # Generator expects probe_pin_mainboard or probe_pin_toolboard
+                if location == "toolboard":
+                    self.state.set_if_changed("probe.probe_pin_toolboard", probe_pin)
+                    self.state.delete("probe.probe_pin_mainboard")
+                else:
+                    self.state.set_if_changed("probe.probe_pin_mainboard", probe_pin)
+                    self.state.delete("probe.probe_pin_toolboard")
+
+        if contact_max_val is not None:
             # Warn if preheat is too close to contact max
             preheat = self.state.get("macros.extruder_preheat_temp", 150)
             if preheat >= contact_max_val - 5:
@@ -6940,50 +7223,28 @@ class GschpooziWizard:
                     f"or raising contact limit.",
                     title="Temperature Conflict Warning"
                 )
-        if mesh_main_direction:
-            self.state.set("probe.bed_mesh.mesh_main_direction", mesh_main_direction)
-        if mesh_runs:
-            self.state.set("probe.bed_mesh.mesh_runs", int(mesh_runs))
-        if location:
-            self.state.set("probe.location", location)
-
-        # Save probe pins
-        if sensor_pin:
-            self.state.set("probe.sensor_pin", sensor_pin)
-        if control_pin:
-            self.state.set("probe.control_pin", control_pin)
-        if probe_pin:
-            # Generator expects probe_pin_mainboard or probe_pin_toolboard
-            if location == "toolboard":
-                self.state.set("probe.probe_pin_toolboard", probe_pin)
-                self.state.delete("probe.probe_pin_mainboard")
-            else:
-                self.state.set("probe.probe_pin_mainboard", probe_pin)
-                self.state.delete("probe.probe_pin_toolboard")
-
-        self.state.save()
-
-        # Build summary
-        summary = f"Type: {probe_type}\nOffset: X={x_offset}, Y={y_offset}, Z={z_offset}"
-        if serial:
-            summary += f"\nSerial: {Path(serial).name if '/' in serial else serial}"
-        if homing_mode:
-            summary += f"\nHoming: {homing_mode}"
-        if samples:
-            summary += f"\nSamples: {samples} (tolerance: {samples_tolerance}mm)"
-        if probe_type in eddy_probes:
-            summary += f"\nMesh: {mesh_main_direction} direction, {mesh_runs} run(s)"
 
         self.ui.msgbox(
-            f"Probe configured!\n\n{summary}\n\n"
-            "Remember to run PROBE_CALIBRATE for Z offset",
-            title="Configuration Saved"
-        )
-
-        # Configure bed mesh (probe-dependent settings)
+            _wizard_template("probe_saved").render(
+                probe_type=probe_type,
+                x_offset=x_offset,
+                y_offset=y_offset,
+                z_offset=z_offset,
+                serial=(Path(serial).name if '/' in serial else serial) if serial else None,
+                homing_mode=homing_mode,
+                samples=samples,
+                samples_tolerance=samples_tolerance,
+                is_eddy=probe_type in eddy_probes,
+                mesh_main_direction=mesh_main_direction,
+                mesh_runs=mesh_runs,
+            ),
+            title=_TITLE_SAVED
+        )
+
+        # Configure bed mesh (probe-dependent settings); saves on its own
         self._configure_probe_bed_mesh(probe_type, eddy_probes)
 
-    def _configure_probe_bed_mesh(self, probe_type: str, eddy_probes: list) -> None:
+    def _configure_probe_bed_mesh(self, probe_type: str, eddy_probes: frozenset) -> None:
         """Configure bed mesh settings (moved from bed leveling since mesh is probe-dependent)."""
         is_eddy_probe = probe_type in eddy_probes
 
@@ -6993,7 +7254,7 @@ class GschpooziWizard:
             in the [bed_mesh] config section.
             """
             try:
-                bed_mesh_py = Path.home() / "klipper" / "klippy" / "extras" / "bed_mesh.py"
+                bed_mesh_py = HOME / "klipper" / "klippy" / "extras" / "bed_mesh.py"
                 if not bed_mesh_py.exists():
                     return False
                 txt = bed_mesh_py.read_text(encoding="utf-8", errors="ignore")
@@ -7148,16 +7409,10 @@ class GschpooziWizard:
         current_method = self.state.get("homing.homing_method", "")
 
         # Homing method based on probe
-        if probe_type in ["beacon", "cartographer"]:
-            methods = [
-                ("beacon_contact", "Beacon Contact", current_method == "beacon_contact" or (not current_method and True)),
-                ("homing_override", "Custom Homing Override", current_method == "homing_override"),
-            ]
-        else:
-            methods = [
-                ("safe_z_home", "Safe Z Home (standard)", current_method == "safe_z_home" or (not current_method and True)),
-                ("homing_override", "Homing Override (sensorless)", current_method == "homing_override"),
-            ]
+        methods = _radio_items(
+            _HOMING_METHODS_BY_PROBE.get(probe_type, _HOMING_METHODS_STANDARD),
+            current_method,
+        )
 
         method = self.ui.radiolist(
             "Z homing method:",
@@ -7174,15 +7429,13 @@ class GschpooziWizard:
         )
 
         # Save
-        self.state.set("homing.homing_method", method or "safe_z_home")
-        self.state.set("homing.z_hop", int(z_hop or 10))
-        self.state.save()
+        with self.state.transaction():
+            self.state.set_if_changed("homing.homing_method", method or "safe_z_home")
+            self.state.set_if_changed("homing.z_hop", int(z_hop or 10))
 
         self.ui.msgbox(
-            f"Homing configured!\n\n"
-            f"Method: {method}\n"
-            f"Z hop: {z_hop}mm",
-            title="Configuration Saved"
+            _wizard_template("homing_saved").render(method=method, z_hop=z_hop),
+            title=_TITLE_SAVED
         )
 
     def _bed_leveling_setup(self) -> None:
@@ -7199,15 +7452,9 @@ class GschpooziWizard:
 
             # Leveling type based on Z motor count
             if z_count == 4:
-                leveling_options = [
-                    ("qgl", "Quad Gantry Level", current_leveling_type == "qgl"),
-                    ("none", "None", current_leveling_type == "none"),
-                ]
+                leveling_options = _radio_items(_LEVELING_OPTIONS_QGL, current_leveling_type)
             elif z_count >= 2:
-                leveling_options = [
-                    ("z_tilt", "Z Tilt Adjust", current_leveling_type == "z_tilt"),
-                    ("none", "None", current_leveling_type == "none"),
-                ]
+                leveling_options = _radio_items(_LEVELING_OPTIONS_Z_TILT, current_leveling_type)
             else:
                 self.ui.msgbox(
                     "You have a single Z stepper.\n\n"
@@ -7225,13 +7472,14 @@ class GschpooziWizard:
             if leveling_type is None:
                 return
 
-            self.state.set("bed_leveling.leveling_type", leveling_type or "none")
+            self.state.set_if_changed("bed_leveling.leveling_type", leveling_type or "none")
             self.state.save()
 
             self.ui.msgbox(
-                f"Leveling method saved!\n\n"
-                f"Method: {_format_leveling_type(leveling_type)}",
-                title="Configuration Saved"
+                _wizard_template("bed_leveling_saved").render(
+                    leveling_type=_format_leveling_type(leveling_type),
+                ),
+                title=_TITLE_SAVED
             )
 
         # Bed leveling menu - only leveling method (bed mesh moved to probe section)
@@ -7530,7 +7778,7 @@ class GschpooziWizard:
 
         # Probe temperature sensor (Beacon/Cartographer/Eddy/PINDA)
         probe_type = self.state.get("probe.probe_type", "")
-        eddy_probes = ["beacon", "cartographer", "btt_eddy"]
+        eddy_probes = _EDDY_PROBES
         inductive_probes = ["inductive"]  # PINDA
 
         current_probe_temp_enabled = self.state.get("temperature_sensors.probe.enabled", False)
@@ -7713,7 +7961,7 @@ class GschpooziWizard:
         self.ui.msgbox(
             f"Temperature sensors configured!\n\n"
             f"Sensors: {', '.join(sensor_names) if sensor_names else 'None'}",
-            title="Configuration Saved"
+            title=_TITLE_SAVED
         )
 
     def _lighting_setup(self) -> None:
@@ -7858,7 +8106,7 @@ class GschpooziWizard:
     def _is_led_effect_plugin_installed() -> bool:
         """Detect the klipper-led_effect plugin (led_effect.py in Klipper extras)."""
         try:
-            base = Path.home() / "klipper" / "klippy" / "extras"
+            base = HOME / "klipper" / "klippy" / "extras"
             return (base / "led_effect.py").exists() or (base / "led_effect.pyc").exists()
         except Exception:
             return False
@@ -8126,7 +8374,7 @@ class GschpooziWizard:
         self.ui.msgbox(
             f"LEDs configured!\n\n"
             f"Strips: {', '.join(led_names) if led_names else 'None'}",
-            title="Configuration Saved"
+            title=_TITLE_SAVED
         )
 
     def _filament_sensors_setup(self) -> None:
@@ -8351,9 +8599,10 @@ class GschpooziWizard:
         self.ui.msgbox(
             f"Filament sensor configured!\n\n"
             f"Sensors: {', '.join(sensor_names) if sensor_names else 'None'}",
-            title="Configuration Saved"
+            title=_TITLE_SAVED
         )
 
+    @_touches_services
     def _display_setup(self) -> None:
         """Configure display options (LCD/OLED direct display via Klipper).
 
@@ -8385,7 +8634,7 @@ class GschpooziWizard:
         install_cmd = (ks_meta.get("installation", {}) or {}).get("command", "")
         update_mgr = (ks_meta.get("moonraker_update_manager", {}) or {}).get("update_manager KlipperScreen", {})
 
-        ks_dir = Path.home() / "KlipperScreen"
+        ks_dir = HOME / "KlipperScreen"
         conf_path = ks_dir / "KlipperScreen.conf"
 
         # Detect service state
@@ -8394,20 +8643,12 @@ class GschpooziWizard:
             running = False
             svc_name = "KlipperScreen"
             if installed:
-                try:
-                    import subprocess
-                    for svc in ("KlipperScreen", "klipperscreen"):
-                        result = subprocess.run(
-                            ["systemctl", "is-active", svc],
-                            capture_output=True,
-                            text=True,
-                        )
-                        if result.stdout.strip() == "active":
-                            running = True
-                            svc_name = svc
-                            break
-                except Exception:
-                    running = False
+                active = self._systemctl_status("is-active", _KLIPPERSCREEN_SERVICES)
+                for svc in _KLIPPERSCREEN_SERVICES:
+                    if active.get(svc) == "active":
+                        running = True
+                        svc_name = svc
+                        break
             return installed, running, svc_name
 
         while True:
@@ -8525,10 +8766,8 @@ class GschpooziWizard:
                         # If Mainsail is served from ~/mainsail via nginx, that causes nginx 403
                         # (www-data cannot traverse /home/<user>). Auto-heal to avoid breaking UI.
                         try:
-                            import subprocess
-
                             mainsail_site = Path("/etc/nginx/sites-enabled/mainsail")
-                            idx = Path.home() / "mainsail" / "index.html"
+                            idx = HOME / "mainsail" / "index.html"
                             if mainsail_site.exists() and idx.exists():
                                 r = subprocess.run(
                                     ["sudo", "-u", "www-data", "test", "-r", str(idx)],
@@ -8538,7 +8777,7 @@ class GschpooziWizard:
                                 if r.returncode != 0:
                                     self._log_wizard("klipperscreen_install detected mainsail nginx permission issue; chmod o+x $HOME")
                                     # Make HOME traversable for nginx without making it listable.
-                                    self._run_shell_interactive(f"sudo chmod o+x {Path.home()}")
+                                    self._run_shell_interactive(f"sudo chmod o+x {HOME}")
                                     self._run_shell_interactive("sudo systemctl restart nginx")
                         except Exception as e:
                             self._log_wizard(f"klipperscreen_install nginx self-heal failed: {type(e).__name__}:{e}")
@@ -8603,7 +8842,7 @@ class GschpooziWizard:
                         self._run_shell_interactive("sudo systemctl daemon-reload")
                     else:
                         # Just update requirements
-                        ks_env = Path.home() / ".KlipperScreen-env"
+                        ks_env = HOME / ".KlipperScreen-env"
                         ks_req = ks_dir / "scripts" / "KlipperScreen-requirements.txt"
                         if ks_env.exists() and ks_req.exists():
                             print("\n" + "=" * 60)
@@ -8652,7 +8891,7 @@ class GschpooziWizard:
                     restart = self.ui.yesno(
                         f"Configuration saved!\n\nHost: {new_host}\nPort: {new_port}\n\n"
                         "Restart KlipperScreen now?",
-                        title="Configuration Saved",
+                        title=_TITLE_SAVED,
                         default_no=False,
                     )
                     if restart:
@@ -8709,7 +8948,7 @@ class GschpooziWizard:
                     self.ui.msgbox(f"Failed to remove directory:\n\n{e}", title="Error")
                     continue
 
-                ks_env = Path.home() / ".KlipperScreen-env"
+                ks_env = HOME / ".KlipperScreen-env"
                 try:
                     if ks_env.exists():
                         shutil.rmtree(ks_env)
@@ -8777,7 +9016,7 @@ class GschpooziWizard:
         detected_mainsail = False
         detected_timelapse = False
         try:
-            cfg_path = Path.home() / "printer_data" / "config" / "printer.cfg"
+            cfg_path = HOME / "printer_data" / "config" / "printer.cfg"
             if cfg_path.exists():
                 txt = cfg_path.read_text(encoding="utf-8", errors="ignore")
                 detected_mainsail = "[include mainsail.cfg]" in txt
@@ -8786,13 +9025,13 @@ class GschpooziWizard:
             pass
 
         # Auto-detect web UI installation
-        mainsail_installed = (Path.home() / "mainsail").exists()
-        fluidd_installed = (Path.home() / "fluidd").exists()
+        mainsail_installed = (HOME / "mainsail").exists()
+        fluidd_installed = (HOME / "fluidd").exists()
 
         # Check for fluidd.cfg include in printer.cfg
         detected_fluidd = False
         try:
-            cfg_path = Path.home() / "printer_data" / "config" / "printer.cfg"
+            cfg_path = HOME / "printer_data" / "config" / "printer.cfg"
             if cfg_path.exists():
                 txt = cfg_path.read_text(encoding="utf-8", errors="ignore")
                 detected_fluidd = "[include fluidd.cfg]" in txt
@@ -8853,7 +9092,7 @@ class GschpooziWizard:
             "printer.cfg includes saved!\n\n"
             f"Web UI: {webui_status}\n"
             f"timelapse.cfg: {'Enabled' if timelapse else 'Disabled'}",
-            title="Configuration Saved",
+            title=_TITLE_SAVED,
         )
 
     def _advanced_multi_pin_setup(self) -> None:
@@ -8954,7 +9193,7 @@ class GschpooziWizard:
 
         self.ui.msgbox(
             f"Multi-pin groups saved!\n\nCount: {len(cleaned)}",
-            title="Configuration Saved",
+            title=_TITLE_SAVED,
         )
 
     def _advanced_force_move_setup(self) -> None:
@@ -8975,7 +9214,7 @@ class GschpooziWizard:
         self.state.save()
         self.ui.msgbox(
             f"Force move: {'Enabled' if enabled else 'Disabled'}",
-            title="Configuration Saved",
+            title=_TITLE_SAVED,
         )
 
     def _advanced_firmware_retraction_setup(self) -> None:
@@ -9039,7 +9278,7 @@ class GschpooziWizard:
 
         self.ui.msgbox(
             "Firmware retraction saved!",
-            title="Configuration Saved",
+            title=_TITLE_SAVED,
         )
 
     # -------------------------------------------------------------------------
@@ -9099,7 +9338,7 @@ class GschpooziWizard:
 
         self.ui.msgbox(
             f"Arc support saved!\n\nresolution = {res_val}",
-            title="Configuration Saved",
+            title=_TITLE_SAVED,
         )
 
     def _configure_exclude_object(self) -> None:
@@ -9136,7 +9375,6 @@ class GschpooziWizard:
         Motor selection is hierarchical (vendor -> motor) with no manual input.
         """
         import re
-        from pathlib import Path as _Path
 
         def _tmc_autotune_install_status() -> Tuple[bool, list[str], str]:
             """
@@ -9150,7 +9388,7 @@ class GschpooziWizard:
             Returns: (is_complete, missing_files, target_dir)
             """
             try:
-                base = _Path.home() / "klipper" / "klippy"
+                base = HOME / "klipper" / "klippy"
                 target = base / "plugins" if (base / "plugins").exists() else (base / "extras")
 
                 required = {
@@ -9161,14 +9399,14 @@ class GschpooziWizard:
                 missing = [name for name, p in required.items() if not p.exists()]
                 return (len(missing) == 0), missing, str(target)
             except Exception:
-                return False, ["autotune_tmc.py", "motor_constants.py", "motor_database.cfg"], str(Path.home() / "klipper" / "klippy" / "extras")
+                return False, ["autotune_tmc.py", "motor_constants.py", "motor_database.cfg"], str(HOME / "klipper" / "klippy" / "extras")
 
-        def _find_motor_db() -> Optional[_Path]:
+        def _find_motor_db() -> Optional[Path]:
             """Find the motor database file."""
             candidates = [
-                _Path.home() / "klipper_tmc_autotune" / "motor_database.cfg",
-                _Path.home() / "klipper" / "klippy" / "plugins" / "motor_database.cfg",
-                _Path.home() / "klipper" / "klippy" / "extras" / "motor_database.cfg",
+                HOME / "klipper_tmc_autotune" / "motor_database.cfg",
+                HOME / "klipper" / "klippy" / "plugins" / "motor_database.cfg",
+                HOME / "klipper" / "klippy" / "extras" / "motor_database.cfg",
             ]
             for p in candidates:
                 if p.exists():
@@ -9324,7 +9562,7 @@ class GschpooziWizard:
                 height=20,
                 width=88,
             ):
-                if not (Path.home() / "klipper" / "klippy" / "extras").exists():
+                if not (HOME / "klipper" / "klippy" / "extras").exists():
                     self.ui.msgbox(
                         "Klipper source tree not found at:\n\n"
                         "~/klipper/klippy/extras\n\n"
@@ -9794,12 +10032,12 @@ read -r _
         """Configure TMC chopper tuning macros."""
         # Check if gcode_shell_command is installed
         def _check_gcode_shell_command() -> bool:
-            extras_file = Path.home() / "klipper" / "klippy" / "extras" / "gcode_shell_command.py"
+            extras_file = HOME / "klipper" / "klippy" / "extras" / "gcode_shell_command.py"
             return extras_file.exists()
 
         def _install_gcode_shell_command() -> bool:
             """Install gcode_shell_command extension."""
-            target_dir = Path.home() / "klipper" / "klippy" / "extras"
+            target_dir = HOME / "klipper" / "klippy" / "extras"
             target_file = target_dir / "gcode_shell_command.py"
             source_file = REPO_ROOT / "scripts" / "tools" / "gcode_shell_command.py"
 
@@ -9866,7 +10104,6 @@ read -r _
                             default_no=False,
                         )
                         if restart:
-                            import subprocess
                             subprocess.run(["sudo", "systemctl", "restart", "klipper"], capture_output=True)
                             self.ui.msgbox("Klipper restarted.", title="Done")
                     else:
@@ -9894,7 +10131,7 @@ read -r _
             Also checks for duplicates in plugins/ and automatically removes them.
             """
             try:
-                base = Path.home() / "klipper" / "klippy"
+                base = HOME / "klipper" / "klippy"
                 extras_dir = base / "extras"
                 plugins_dir = base / "plugins"
                 extras_file = extras_dir / "gcode_shell_command.py"
@@ -9913,7 +10150,7 @@ read -r _
 
                 return False, str(extras_dir)
             except Exception:
-                return False, str(Path.home() / "klipper" / "klippy" / "extras")
+                return False, str(HOME / "klipper" / "klippy" / "extras")
 
         extension_installed, target_dir = _gcode_shell_command_install_status()
 
@@ -9931,7 +10168,7 @@ read -r _
                 height=18,
                 width=88,
             ):
-                if not (Path.home() / "klipper" / "klippy" / "extras").exists():
+                if not (HOME / "klipper" / "klippy" / "extras").exists():
                     self.ui.msgbox(
                         "Klipper source tree not found at:\n\n"
                         "~/klipper/klippy/extras\n\n"
@@ -9955,7 +10192,7 @@ read -r _
 
                     # Install using Python - delete old file first, then copy from repo or download
                     # Always install to extras/ (standard location), remove duplicates from plugins/
-                    target_base = Path.home() / "klipper" / "klippy"
+                    target_base = HOME / "klipper" / "klippy"
                     target_dir = target_base / "extras"  # Always use extras/, never plugins/
                     plugins_dir = target_base / "plugins"
                     target_file = target_dir / "gcode_shell_command.py"
@@ -10003,7 +10240,6 @@ read -r _
 
                         # Restart if requested
                         if restart:
-                            import subprocess
                             subprocess.run(["sudo", "systemctl", "restart", "klipper"], check=False)
                             self.ui.msgbox(
                                 "Extension installed and Klipper restarted!",
@@ -10141,7 +10377,7 @@ read -r _
 
         # Handle extension install/reinstall
         if choice == "__INSTALL__" or choice == "__REINSTALL__":
-            target_base = Path.home() / "klipper" / "klippy"
+            target_base = HOME / "klipper" / "klippy"
             target_dir = target_base / "extras"  # Always use extras/, never plugins/
             plugins_dir = target_base / "plugins"
             target_file = target_dir / "gcode_shell_command.py"
@@ -10200,7 +10436,6 @@ read -r _
 
                 # Restart if requested
                 if restart:
-                    import subprocess
                     subprocess.run(["sudo", "systemctl", "restart", "klipper"], check=False)
                     self.ui.msgbox(
                         "Extension installed and Klipper restarted!",
@@ -10498,7 +10733,7 @@ read -r _
                             homing_method = self.state.get("homing.homing_method", "")
                             contact_max = self.state.get("probe.contact_max_hotend_temperature", 180)
                             is_contact = "contact" in homing_mode or "contact" in homing_method
-                            if probe_type in ("beacon", "cartographer") and is_contact:
+                            if probe_type in _CONTACT_EDDY_PROBES and is_contact:
                                 if preheat_val >= contact_max - 5:
                                     self.ui.msgbox(
                                         f"Warning: Preheat temp {preheat_val}C is too close to contact limit {contact_max}C.\n\n"
@@ -11427,101 +11662,101 @@ read -r _
 
     def tuning_menu(self) -> None:
         """Tuning and optimization menu."""
-        while True:
-            # Check TMC Autotune status
-            tmc_enabled = self.state.get("tuning.tmc_autotune.enabled", False)
-            tmc_steppers = self.state.get("tuning.tmc_autotune.steppers", {}) or {}
-            if tmc_enabled and tmc_steppers:
-                tmc_count = len(tmc_steppers)
-                tmc_menu_label = self._format_menu_item("TMC Autotune", f"{tmc_count} motor{'s' if tmc_count > 1 else ''}")
-            else:
-                tmc_menu_label = "TMC Autotune         (Motor optimization)"
-
-            # Check Input Shaper status
-            input_shaper_enabled = self.state.get("tuning.input_shaper.enabled", False)
-            if input_shaper_enabled:
-                input_shaper_menu_label = self._format_menu_item("Input Shaper", "Enabled")
-            else:
-                input_shaper_menu_label = "Input Shaper         (Resonance compensation)"
-
-            # Show accelerometer status
-            accel_source = self.state.get("tuning.accelerometer.source", "")
-            accel_status = {
-                "toolboard": "Toolboard",
-                "beacon": "Beacon",
-                "cartographer": "Cartographer",
-            }.get(accel_source, None)
-
-            # Format accelerometer menu item
-            if accel_status:
-                accel_menu_label = self._format_menu_item("Accelerometer", accel_status)
-            else:
-                accel_menu_label = "Accelerometer         (For input shaper calibration)"
+        self._run_menu_stack(self._tuning_frame())
+
+    def _tuning_frame(self) -> MenuFrame:
+        """Menu frame for 3. Tuning & Optimization."""
+        return MenuFrame(
+            title="3. Tuning & Optimization",
+            build=self._build_tuning_menu,
+            actions={
+                "3.1": self._configure_tmc_autotune,
+                "3.2": self._configure_input_shaper,
+                "3.3": self._configure_accelerometer,
+                "3.4": self._configure_chopper_tuning,
+                "3.6": self._configure_macros,
+                "3.9": self._configure_exclude_object,
+                "3.10": self._configure_arc_support,
+            },
+            fallback=lambda choice: self.ui.msgbox(f"Section {choice} coming soon!", title=f"Section {choice}"),
+        )
+
+    def _build_tuning_menu(self) -> Tuple[str, list]:
+        """Build the tuning menu prompt and items from the current state."""
+        # Check TMC Autotune status
+        tmc_enabled = self.state.get("tuning.tmc_autotune.enabled", False)
+        tmc_steppers = self.state.get("tuning.tmc_autotune.steppers", {}) or {}
+        if tmc_enabled and tmc_steppers:
+            tmc_count = len(tmc_steppers)
+            tmc_menu_label = self._format_menu_item("TMC Autotune", f"{tmc_count} motor{'s' if tmc_count > 1 else ''}")
+        else:
+            tmc_menu_label = "TMC Autotune         (Motor optimization)"
 
-            # Check Macros status
-            macros_preset = self.state.get("macros.preset")
-            if macros_preset:
-                preset_display = macros_preset.replace("_", " ").title()
-                macros_menu_label = self._format_menu_item("Macros", preset_display)
-            else:
-                macros_menu_label = "Macros               (START_PRINT, etc.)"
+        # Check Input Shaper status
+        input_shaper_enabled = self.state.get("tuning.input_shaper.enabled", False)
+        if input_shaper_enabled:
+            input_shaper_menu_label = self._format_menu_item("Input Shaper", "Enabled")
+        else:
+            input_shaper_menu_label = "Input Shaper         (Resonance compensation)"
+
+        # Show accelerometer status
+        accel_source = self.state.get("tuning.accelerometer.source", "")
+        accel_status = {
+            "toolboard": "Toolboard",
+            "beacon": "Beacon",
+            "cartographer": "Cartographer",
+        }.get(accel_source, None)
+
+        # Format accelerometer menu item
+        if accel_status:
+            accel_menu_label = self._format_menu_item("Accelerometer", accel_status)
+        else:
+            accel_menu_label = "Accelerometer         (For input shaper calibration)"
 
-            # Check Exclude Object status
-            exclude_enabled = self.state.get("tuning.exclude_object.enabled", False)
-            if exclude_enabled:
-                exclude_menu_label = self._format_menu_item("Exclude Object", "Enabled")
-            else:
-                exclude_menu_label = "Exclude Object       (Cancel individual objects)"
+        # Check Macros status
+        macros_preset = self.state.get("macros.preset")
+        if macros_preset:
+            preset_display = macros_preset.replace("_", " ").title()
+            macros_menu_label = self._format_menu_item("Macros", preset_display)
+        else:
+            macros_menu_label = "Macros               (START_PRINT, etc.)"
 
-            # Check Arc Support status
-            arc_enabled = self.state.get("tuning.arc_support.enabled", False)
-            if arc_enabled:
-                arc_resolution = self.state.get("tuning.arc_support.resolution", 0.1)
-                arc_menu_label = self._format_menu_item("Arc Support", f"res={arc_resolution}")
-            else:
-                arc_menu_label = "Arc Support         (G2/G3 commands)"
+        # Check Exclude Object status
+        exclude_enabled = self.state.get("tuning.exclude_object.enabled", False)
+        if exclude_enabled:
+            exclude_menu_label = self._format_menu_item("Exclude Object", "Enabled")
+        else:
+            exclude_menu_label = "Exclude Object       (Cancel individual objects)"
 
-            # Check Chopper Tuning status
-            chopper_enabled = self.state.get("tuning.chopper_tuning_enabled", False)
-            if chopper_enabled:
-                chopper_menu_label = self._format_menu_item("Chopper Tuning", "Enabled")
-            else:
-                chopper_menu_label = "Chopper Tuning       (TMC driver optimization)"
+        # Check Arc Support status
+        arc_enabled = self.state.get("tuning.arc_support.enabled", False)
+        if arc_enabled:
+            arc_resolution = self.state.get("tuning.arc_support.resolution", 0.1)
+            arc_menu_label = self._format_menu_item("Arc Support", f"res={arc_resolution}")
+        else:
+            arc_menu_label = "Arc Support         (G2/G3 commands)"
 
-            choice = self.ui.menu(
-                "Tuning & Optimization\n\n"
-                "Configure advanced features and calibration.",
-                [
-                    ("3.1", tmc_menu_label),
-                    ("3.2", input_shaper_menu_label),
-                    ("3.3", accel_menu_label),
-                    ("3.4", chopper_menu_label),
-                    ("3.6", macros_menu_label),
-                    ("3.9", exclude_menu_label),
-                    ("3.10", arc_menu_label),
-                    ("B", "Back to Main Menu"),
-                ],
-                title="3. Tuning & Optimization",
-            )
+        # Check Chopper Tuning status
+        chopper_enabled = self.state.get("tuning.chopper_tuning_enabled", False)
+        if chopper_enabled:
+            chopper_menu_label = self._format_menu_item("Chopper Tuning", "Enabled")
+        else:
+            chopper_menu_label = "Chopper Tuning       (TMC driver optimization)"
 
-            if choice is None or choice == "B":
-                break
-            elif choice == "3.1":
-                self._configure_tmc_autotune()
-            elif choice == "3.2":
-                self._configure_input_shaper()
-            elif choice == "3.3":
-                self._configure_accelerometer()
-            elif choice == "3.4":
-                self._configure_chopper_tuning()
-            elif choice == "3.6":
-                self._configure_macros()
-            elif choice == "3.10":
-                self._configure_arc_support()
-            elif choice == "3.9":
-                self._configure_exclude_object()
-            else:
-                self.ui.msgbox(f"Section {choice} coming soon!", title=f"Section {choice}")
+        return (
+            "Tuning & Optimization\n\n"
+            "Configure advanced features and calibration.",
+            [
+                ("3.1", tmc_menu_label),
+                ("3.2", input_shaper_menu_label),
+                ("3.3", accel_menu_label),
+                ("3.4", chopper_menu_label),
+                ("3.6", macros_menu_label),
+                ("3.9", exclude_menu_label),
+                ("3.10", arc_menu_label),
+                ("B", "Back to Main Menu"),
+            ],
+        )
 
     # -------------------------------------------------------------------------
     # Generate Config
@@ -11529,9 +11764,7 @@ read -r _
 
     def generate_config(self) -> None:
         """Generate printer configuration files."""
-        completion = self.state.get_completion_status()
-
-        if not completion.get("mcu"):
+        if not self.state.is_complete("mcu"):
             self.ui.msgbox(
                 "Cannot generate config!\n\n"
                 "Please configure at least the main MCU first.",
@@ -11554,20 +11787,33 @@ read -r _
         self.ui.infobox("Generating configuration...", title="Please wait")
 
         try:
-            from generator import ConfigGenerator
-
-            generator = ConfigGenerator(state=self.state)
-            files = generator.generate()
-            written = generator.write_files(files)
-
-            file_list = "\n".join(f"• {p.name}" for p in written[:8])
-            if len(written) > 8:
-                file_list += f"\n  ... and {len(written) - 8} more"
+            cancel = threading.Event()
+            job = _GENERATE_EXECUTOR.submit(_generate_and_write, self.state, cancel=cancel)
+            # Poll quickly at first (small configs finish in well under a second),
+            # then back off; the wait stays interruptible with Ctrl-C.
+            delay = 0.02
+            try:
+                while not futures.wait([job], timeout=delay).done:
+                    delay = min(delay * 2, 0.5)
+            except KeyboardInterrupt:
+                # The worker can't be interrupted; stop it before the next file
+                # and wait for it so the wizard doesn't exit mid-write.
+                cancel.set()
+                print(
+                    "\nCancelling: waiting for config generation to stop "
+                    "(no further files will be written)...",
+                    file=sys.stderr,
+                )
+                futures.wait([job])
+                raise
+            output_dir, total, shown = job.result()
 
             self.ui.msgbox(
-                f"Configuration generated!\n\n"
-                f"Created {len(written)} files:\n{file_list}\n\n"
-                f"Location: {generator.output_dir}",
+                _wizard_template("generation_complete").render(
+                    total=total,
+                    shown=shown,
+                    output_dir=output_dir,
+                ),
                 title="Generation Complete"
             )
         except Exception as e:
@@ -6,10 +6,77 @@ Handles saving/loading wizard state and configuration values.
 
 import json
 import os
+from collections import ChainMap
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Mapping, MutableMapping, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson  # optional C-accelerated JSON for state load/save
+except ImportError:
+    orjson = None
+
+_MISSING = object()  # sentinel for "key not set" in value comparisons
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize state to compact JSON bytes (orjson if installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson if installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1024)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key once; the wizard reuses a small set of keys."""
+    return tuple(key.split("."))
+
+
+# Sections ConfigGenerator.get_context() fills with defaults -> the nested
+# dicts it also writes into; export_for_generator hands it shallow copies of
+# just these so the stored state is left untouched
+_GENERATOR_FILLED_SECTIONS = {
+    "tuning": ("arc_support", "tmc_autotune"),
+    "advanced": (),
+    "fans": ("part_cooling", "hotend", "controller"),
+    "heater_bed": (),
+    "stepper_x": (),
+    "stepper_y": (),
+    "stepper_z": (),
+}
+
+_STEPPER_KEYS = frozenset(("stepper_x", "stepper_y", "stepper_z"))
+
+# Completion checks for the major sections: name -> (config sections it reads, check)
+_COMPLETION_CHECKS = {
+    "mcu": (("mcu",), lambda c: isinstance(c.get("mcu"), dict) and "main" in c["mcu"]),
+    "printer": (("printer",), lambda c: "printer" in c),
+    "steppers": (
+        tuple(sorted(_STEPPER_KEYS)),
+        lambda c: c.keys() >= _STEPPER_KEYS,
+    ),
+    "extruder": (("extruder",), lambda c: "extruder" in c),
+    "heater_bed": (("heater_bed",), lambda c: "heater_bed" in c),
+    "probe": (("probe",), lambda c: "probe" in c),
+    "fans": (("fans",), lambda c: "fans" in c),
+}
+# Top-level config section -> completion checks that depend on it
+_COMPLETION_BY_SECTION: Dict[str, Tuple[str, ...]] = {
+    section: tuple(name for name, (reads, _) in _COMPLETION_CHECKS.items() if section in reads)
+    for reads, _ in _COMPLETION_CHECKS.values()
+    for section in reads
+}
+
 
 class WizardState:
     """Manages wizard configuration state."""
@@ -21,18 +88,52 @@ class WizardState:
     def __init__(self, state_dir: Path = None):
         self.state_dir = state_dir or self.DEFAULT_STATE_DIR
         self.state_file = self.state_dir / self.STATE_FILENAME
-        self._state: Dict[str, Any] = {}
-        self._pin_registry: Dict[str, Dict[str, Any]] = {}  # mcu_name -> {pins: [...], prefix: "..."}
-        self._assigned_pins: Dict[str, str] = {}  # pin_name -> mcu_name
+        self._init_fields()
         self._load()
+        self._refresh_completion()
         self._rebuild_pin_registry()
 
-    def _load(self) -> None:
-        """Load state from disk if exists."""
-        if self.state_file.exists():
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "WizardState":
+        """
+        Build a state around an in-memory config, with no state file behind it.
+
+        The config dict is used as-is (not copied). state_dir and state_file
+        are None and save() does nothing, so nothing touches disk.
+        """
+        state = cls.__new__(cls)
+        state.state_dir = state.state_file = None
+        state._init_fields()
+        state._load({"config": config})
+        state._refresh_completion()
+        state._rebuild_pin_registry()
+        return state
+
+    def _init_fields(self) -> None:
+        self._state: Dict[str, Any] = {}
+        self._pin_registry: Dict[str, Dict[str, Any]] = {}  # mcu_name -> {pins: [...], prefix: "..."}
+        self._assigned_pins: Dict[str, str] = {}  # pin_name -> mcu_name
+        self._state_version = 0  # bumped on every config mutation
+        self._txn_depth = 0  # >0 while inside transaction(); save() is deferred
+        self._saved_version = -1  # _state_version at the last write; -1 = never written
+        self._loaded_version = -1  # _state_version right after the last _load()
+        self._file_mtime_ns: Optional[int] = None  # state file mtime we last read/wrote
+        self._complete: set = set()  # names from _COMPLETION_CHECKS that currently pass
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the configuration is modified."""
+        return self._state_version
+
+    def _load(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Load state from disk if exists (or from data, without reading the file)."""
+        self._state_version += 1
+        self._file_mtime_ns = self._stat_mtime_ns()
+        if data is not None:
+            self._state = data
+        elif self._file_mtime_ns is not None:
             try:
-                with open(self.state_file, 'r') as f:
-                    self._state = json.load(f)
+                self._state = _loads(self.state_file.read_bytes())
             except (json.JSONDecodeError, IOError):
                 self._state = {}
         else:
@@ -40,18 +141,22 @@ class WizardState:
 
         # Ensure basic structure
         if "wizard" not in self._state:
+            now = datetime.now().isoformat()
             self._state["wizard"] = {
                 "version": "3.0",
-                "created": datetime.now().isoformat(),
-                "last_modified": datetime.now().isoformat(),
+                "created": now,
+                "last_modified": now,
             }
-        if "config" not in self._state:
+        if not isinstance(self._state.get("config"), dict):
+            # Missing, or corrupted into a non-dict: start from an empty config
             self._state["config"] = {}
+        # Stable reference to the config dict; only _load and clear replace it
+        self._config: Dict[str, Any] = self._state["config"]
 
         # Lightweight migrations / normalizations for older state files.
         # The wizard evolves over time; avoid leaving null/partial values around that
         # later cause generator output to be invalid.
-        cfg = self._state.get("config", {})
+        cfg = self._config
         if isinstance(cfg, dict):
             # Migrate legacy endstop_config -> endstop_pullup/endstop_invert for stepper_x/stepper_y
             def _migrate_endstop(stepper_key: str) -> None:
@@ -139,24 +244,95 @@ class WizardState:
                     except (ValueError, TypeError):
                         pass
 
+        self._loaded_version = self._state_version
+
     def save(self) -> None:
-        """Save state to disk."""
+        """
+        Save state to disk.
+
+        Deferred to the end of an open transaction, and skipped when nothing
+        changed since the last write or the state has no file (from_dict()).
+        """
+        if self.state_file is None or self._txn_depth or self._state_version == self._saved_version:
+            return
+
         self._state["wizard"]["last_modified"] = datetime.now().isoformat()
 
         # Ensure directory exists
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(self.state_file, 'w') as f:
+        # Write a temp file and swap it in, so an interrupted save never leaves
+        # truncated JSON behind (which _load would silently treat as empty state)
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumps(self._state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+        self._saved_version = self._state_version
+        self._file_mtime_ns = self._stat_mtime_ns()
+
+    def export_pretty(self, path: Path) -> None:
+        """Write an indented copy of the state for humans (save() writes compact JSON)."""
+        with open(path, 'w') as f:
             json.dump(self._state, f, indent=2)
 
+    def _stat_mtime_ns(self) -> Optional[int]:
+        """Modification time of the state file, or None if it doesn't exist."""
+        if self.state_file is None:
+            return None
+        try:
+            return self.state_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """
+        Re-read the state file if something else rewrote it since we last
+        read or wrote it. Returns True if the state was reloaded.
+
+        Only a stat() when nothing changed. Unsaved in-memory edits (or an
+        open transaction) are never discarded; the file is left alone then.
+        """
+        if self._txn_depth or self._state_version not in (self._saved_version, self._loaded_version):
+            return False
+        if self._stat_mtime_ns() == self._file_mtime_ns:
+            return False
+        self._load()
+        self._refresh_completion()
+        self._rebuild_pin_registry()
+        return True
+
+    @contextmanager
+    def transaction(self) -> Iterator["WizardState"]:
+        """
+        Group several changes into a single write.
+
+        save() calls inside the block are skipped; the state is written once
+        when the outermost block exits, including on error or Ctrl-C, so
+        changes made before a cancel are still persisted.
+
+        Example:
+            with state.transaction():
+                state.set("homing.homing_method", "safe_z_home")
+                state.set("homing.z_hop", 10)
+        """
+        self._txn_depth += 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+            if not self._txn_depth:
+                self.save()
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value using dot notation.
 
         Example: state.get("mcu.main.serial")
         """
-        keys = key.split(".")
-        value = self._state.get("config", {})
+        keys = _split_key(key)
+        value = self._config
 
         for k in keys:
             if isinstance(value, dict) and k in value:
@@ -166,18 +342,9 @@ class WizardState:
 
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        """
-        Set a configuration value using dot notation.
-
-        Example: state.set("mcu.main.serial", "/dev/serial/...")
-        """
-        keys = key.split(".")
-        config = self._state.setdefault("config", {})
-        if not isinstance(config, dict):
-            # Extremely defensive: if config was corrupted, reset it
-            self._state["config"] = {}
-            config = self._state["config"]
+    def _assign(self, keys: Tuple[str, ...], value: Any) -> None:
+        """Store a value at a split dot-notation key, creating parents as needed."""
+        config = self._config
 
         # Navigate to parent
         for k in keys[:-1]:
@@ -191,16 +358,63 @@ class WizardState:
         # Set value
         config[keys[-1]] = value
 
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set a configuration value using dot notation.
+
+        Example: state.set("mcu.main.serial", "/dev/serial/...")
+        """
+        keys = _split_key(key)
+        self._assign(keys, value)
+        self._state_version += 1
+        self._refresh_completion(keys[0])
+
         # Rebuild pin registry if MCU configuration changed
-        if keys[0] == "mcu" or (len(keys) > 0 and keys[0] in ["mcu"]):
+        if keys[0] == "mcu":
             self._rebuild_pin_registry()
 
+    def update(self, values: Mapping[str, Any]) -> None:
+        """
+        Set several dot-notation keys at once.
+
+        Completion and the pin registry are refreshed once for the batch
+        rather than after every key.
+
+        Example: state.update({"printer.kinematics": "corexy", "printer.bed_size_x": 350})
+        """
+        sections = set()
+        for key, value in values.items():
+            keys = _split_key(key)
+            self._assign(keys, value)
+            sections.add(keys[0])
+        if not sections:
+            return
+
+        self._state_version += 1
+        for section in sections:
+            self._refresh_completion(section)
+        if "mcu" in sections:
+            self._rebuild_pin_registry()
+
+    def set_if_changed(self, key: str, value: Any) -> bool:
+        """
+        Set a configuration value only if it differs from the stored one.
+
+        Values of a different type count as changed (0 vs 0.0), so a re-run
+        still normalizes what gets written. Returns True if the value was set.
+        """
+        current = self.get(key, _MISSING)
+        # Only scalars are compared: a list/dict may be the stored object itself,
+        # mutated in place by the caller, and would always compare equal.
+        if isinstance(value, _SCALARS) and type(current) is type(value) and current == value:
+            return False
+        self.set(key, value)
+        return True
+
     def delete(self, key: str) -> bool:
         """Delete a configuration value. Returns True if existed."""
-        keys = key.split(".")
-        config = self._state.get("config", {})
-        if not isinstance(config, dict):
-            return False
+        keys = _split_key(key)
+        config = self._config
 
         # Navigate to parent
         for k in keys[:-1]:
@@ -211,52 +425,87 @@ class WizardState:
         # Delete if exists
         if isinstance(config, dict) and keys[-1] in config:
             del config[keys[-1]]
+            self._state_version += 1
+            self._refresh_completion(keys[0])
             return True
         return False
 
+    def pop_subtree(self, section: str) -> bool:
+        """
+        Drop a whole top-level config section in one step. Returns True if existed.
+
+        Example: state.pop_subtree("probe")
+        """
+        if self._config.pop(section, _MISSING) is _MISSING:
+            return False
+        self._state_version += 1
+        self._refresh_completion(section)
+        return True
+
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get an entire configuration section."""
-        return self._state.get("config", {}).get(section, {})
+        return self._config.get(section, {})
 
     def set_section(self, section: str, data: Dict[str, Any]) -> None:
         """Set an entire configuration section."""
-        self._state.setdefault("config", {})[section] = data
+        self._config[section] = data
+        self._state_version += 1
+        self._refresh_completion(section)
 
     def clear(self) -> None:
         """Clear all configuration (keeps wizard metadata)."""
-        self._state["config"] = {}
+        self._state["config"] = self._config = {}
         self._state["wizard"]["last_modified"] = datetime.now().isoformat()
+        self._state_version += 1
+        self._complete.clear()
 
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration data."""
-        return self._state.get("config", {})
+        return self._config
 
     def is_section_complete(self, section: str) -> bool:
         """Check if a section has been configured."""
-        return section in self._state.get("config", {})
+        return section in self._config
+
+    def _refresh_completion(self, section: Optional[str] = None) -> None:
+        """Re-evaluate the completion checks that read ``section`` (all if None)."""
+        config = self._config
+        names = _COMPLETION_CHECKS if section is None else _COMPLETION_BY_SECTION.get(section, ())
+        for name in names:
+            if _COMPLETION_CHECKS[name][1](config):
+                self._complete.add(name)
+            else:
+                self._complete.discard(name)
+
+    def is_complete(self, name: str) -> bool:
+        """Check one major section from get_completion_status() (e.g. "mcu")."""
+        return name in self._complete
 
     def get_completion_status(self) -> Dict[str, bool]:
         """Get completion status for all major sections."""
-        config = self._state.get("config", {})
-
-        return {
-            "mcu": "mcu" in config and "main" in config.get("mcu", {}),
-            "printer": "printer" in config,
-            "steppers": all(k in config for k in ["stepper_x", "stepper_y", "stepper_z"]),
-            "extruder": "extruder" in config,
-            "heater_bed": "heater_bed" in config,
-            "probe": "probe" in config,
-            "fans": "fans" in config,
-        }
+        return {name: name in self._complete for name in _COMPLETION_CHECKS}
+
+    def export_for_generator(self) -> MutableMapping[str, Any]:
+        """
+        Export state in format suitable for config generator.
 
-    def export_for_generator(self) -> Dict[str, Any]:
-        """Export state in format suitable for config generator."""
-        config = self._state.get("config", {}) or {}
-        export = {
+        Returns a ChainMap layered over the live config rather than a copy:
+        top-level keys written by the generator land in the front layer, and
+        the dicts it fills defaults into are shallow-copied into that layer,
+        so the stored state is never touched.
+        """
+        config = self._config
+        front: Dict[str, Any] = {
             "version": self._state["wizard"]["version"],
             "generated": datetime.now().isoformat(),
-            **config,
         }
+        for section, nested in _GENERATOR_FILLED_SECTIONS.items():
+            if isinstance(config.get(section), dict):
+                front[section] = copied = dict(config[section])
+                for key in nested:
+                    if isinstance(copied.get(key), dict):
+                        copied[key] = dict(copied[key])
+        export = ChainMap(front, config)
 
         # Normalize temperature_sensors for templates:
         # - Wizard UI stores a dict under config.temperature_sensors (built-ins + chamber + additional)
@@ -304,7 +553,7 @@ class WizardState:
         """Rebuild pin registry from current state."""
         self._pin_registry = {}
         self._assigned_pins = {}
-        config = self._state.get("config", {})
+        config = self._config
 
         # Load mainboard pins (no prefix)
         mcu_main = config.get("mcu", {}).get("main", {})
@@ -446,6 +695,8 @@ def get_state() -> WizardState:
     global _state
     if _state is None:
         _state = WizardState()
+    else:
+        _state.reload_if_changed()
     return _state
 
 
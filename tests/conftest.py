@@ -0,0 +1,153 @@
+"""
+Shared fixtures for the generator tests.
+
+The common printer baseline (~35 settings) is built once per session; each
+test gets a deep copy and only applies its own overrides.
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path (once, for every test module)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from generator.generator import ConfigGenerator
+from generator.templates import TemplateRenderer
+from wizard.state import WizardState
+
+
+# Z / leveling overrides for the reference-config scenarios the generator covers
+# (anything else is generated as single Z)
+SCENARIO_OVERRIDES = {
+    "corexy_qgl_4z": {
+        'stepper_z.z_motor_count': 4,
+        'stepper_z1.motor_port': 'MOTOR_3',
+        'stepper_z2.motor_port': 'MOTOR_4',
+        'stepper_z3.motor_port': 'MOTOR_5',
+        'bed_leveling.leveling_type': 'qgl',
+    },
+    "corexy_ztilt_3z": {
+        'stepper_z.z_motor_count': 3,
+        'stepper_z1.motor_port': 'MOTOR_3',
+        'stepper_z2.motor_port': 'MOTOR_4',
+        'bed_leveling.leveling_type': 'z_tilt',
+    },
+}
+SCENARIO_OVERRIDES["corexy_ztilt_3z_dual_mcu"] = SCENARIO_OVERRIDES["corexy_ztilt_3z"]
+
+
+def create_base_state(state_dir: Path = None) -> WizardState:
+    """Create a minimal valid state with common settings."""
+    state = WizardState(state_dir)
+    state.update({
+        # MCU
+        'mcu.main.board_type': 'btt-octopus-v1.1',
+        'mcu.main.serial': '/dev/serial/by-id/usb-test',
+
+        # Printer
+        'printer.bed_size_x': 350,
+        'printer.bed_size_y': 350,
+        'printer.bed_size_z': 300,
+        'printer.kinematics': 'corexy',
+
+        # X stepper
+        'stepper_x.motor_port': 'MOTOR_0',
+        'stepper_x.driver_type': 'TMC2209',
+        'stepper_x.driver_protocol': 'uart',
+        'stepper_x.run_current': 0.8,
+        'stepper_x.belt_pitch': 2,
+        'stepper_x.pulley_teeth': 20,
+
+        # Y stepper
+        'stepper_y.motor_port': 'MOTOR_1',
+        'stepper_y.driver_type': 'TMC2209',
+        'stepper_y.driver_protocol': 'uart',
+        'stepper_y.run_current': 0.8,
+        'stepper_y.belt_pitch': 2,
+        'stepper_y.pulley_teeth': 20,
+
+        # Z stepper (single)
+        'stepper_z.motor_port': 'MOTOR_2_1',
+        'stepper_z.z_motor_count': 1,
+        'stepper_z.driver_type': 'TMC2209',
+        'stepper_z.driver_protocol': 'uart',
+        'stepper_z.drive_type': 'leadscrew',
+        'stepper_z.leadscrew_pitch': 8,
+        'stepper_z.run_current': 0.8,
+        'stepper_z.endstop_type': 'probe',
+
+        # Extruder
+        'extruder.location': 'mainboard',
+        'extruder.motor_port_mainboard': 'MOTOR_6',
+        'extruder.driver_type': 'TMC2209',
+        'extruder.driver_protocol': 'uart',
+        'extruder.run_current': 0.6,
+        'extruder.extruder_type': 'orbiter_v2',
+        'extruder.heater_location': 'mainboard',
+        'extruder.heater_port_mainboard': 'HE0',
+        'extruder.sensor_location': 'mainboard',
+        'extruder.sensor_port_mainboard': 'T0',
+        'extruder.sensor_type': 'Generic 3950',
+
+        # Bed heater
+        'heater_bed.heater_pin': 'HB',
+        'heater_bed.sensor_port': 'TB',
+        'heater_bed.sensor_type': 'Generic 3950',
+    })
+    return state
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_templates():
+    """Parse config-sections.yaml up front so no single test pays for it."""
+    TemplateRenderer()
+
+
+@pytest.fixture(scope="session")
+def _base_state_proto(tmp_path_factory) -> WizardState:
+    """The common baseline, built once per test session."""
+    return create_base_state(tmp_path_factory.mktemp("state"))
+
+
+@pytest.fixture
+def new_base_state(_base_state_proto):
+    """Factory for fresh copies of the baseline (for tests that need several)."""
+    return lambda: copy.deepcopy(_base_state_proto)
+
+
+@pytest.fixture
+def base_state(new_base_state) -> WizardState:
+    """A private copy of the baseline; tests only apply their own deltas."""
+    return new_base_state()
+
+
+@pytest.fixture
+def scenario_state(new_base_state):
+    """Factory: a baseline copy with a reference scenario applied (Tap probe)."""
+    def _make(scenario_id: str) -> WizardState:
+        state = new_base_state()
+        state.update({'probe.probe_type': 'tap', **SCENARIO_OVERRIDES.get(scenario_id, {})})
+        return state
+    return _make
+
+
+@pytest.fixture(scope="session")
+def generate():
+    """
+    ConfigGenerator(state).generate(), memoized on the state's config for the session.
+
+    Both test modules generate some of the same printers; each distinct config
+    is generated once. Callers get their own copy of the files dict.
+    """
+    cache = {}
+
+    def _generate(state: WizardState, sections_only: bool = False) -> dict:
+        key = (json.dumps(state.get_all(), sort_keys=True), sections_only)
+        if key not in cache:
+            cache[key] = ConfigGenerator(state).generate(sections_only=sections_only)
+        return dict(cache[key])
+    return _generate
@@ -6,9 +6,12 @@ Provides REST API for the React frontend to interact with
 gschpoozi templates and config generator.
 """
 
+import functools
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Dict
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -20,53 +23,61 @@ PROJECT_ROOT = WEB_DIR.parent
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 SCHEMA_DIR = PROJECT_ROOT / "schema"
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
-
-# Add scripts to path for importing generator
-sys.path.insert(0, str(SCRIPTS_DIR))
-
-from routers import templates, generator, state
-
-app = FastAPI(
-    title="gschpoozi Web Wizard API",
-    description="Backend API for gschpoozi web-based configuration wizard",
-    version="1.0.0",
-)
-
-# CORS for development (frontend on different port)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Vite dev server
-        "http://localhost:3000",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:3000",
-        "*",  # Allow all in dev - restrict in production
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+_BOARD_DIRS = (
+    ("boards_count", TEMPLATES_DIR / "boards"),
+    ("toolboards_count", TEMPLATES_DIR / "toolboards"),
 )
+# The install layout doesn't change while the server runs
+_TEMPLATES_EXISTS = TEMPLATES_DIR.exists()
+_SCHEMA_EXISTS = SCHEMA_DIR.exists()
+
+# Make the wizard/generator packages importable from a checkout, once; the
+# Docker image already has them on PYTHONPATH
+if SCRIPTS_DIR.is_dir() and str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@functools.lru_cache(maxsize=4)
+def _count_json(directory: Path, mtime_ns: int) -> int:
+    """Count *.json in a directory; keyed on its mtime, which changes on add/remove."""
+    return sum(1 for _ in directory.glob("*.json"))
+
+
+def _board_counts() -> Dict[str, int]:
+    """Board/toolboard template counts, re-globbed only when a directory changes."""
+    counts = {}
+    for key, directory in _BOARD_DIRS:
+        try:
+            counts[key] = _count_json(directory, directory.stat().st_mtime_ns)
+        except OSError:
+            counts[key] = 0
+    return counts
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the count cache so the first health probe doesn't walk the filesystem
+    _board_counts()
+    # Load template JSON and compile the generator's templates up front,
+    # so async handlers don't hit the disk on the first requests
+    from routers.generator import warm_generator
+    from routers.templates import warm_templates
+    warm_templates()
+    warm_generator()
+    yield
 
-# Include routers
-app.include_router(templates.router, prefix="/api", tags=["Templates"])
-app.include_router(generator.router, prefix="/api", tags=["Generator"])
-app.include_router(state.router, prefix="/api", tags=["State"])
 
-
-@app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
         "project_root": str(PROJECT_ROOT),
-        "templates_found": TEMPLATES_DIR.exists(),
-        "schema_found": SCHEMA_DIR.exists(),
-        "boards_count": len(list((TEMPLATES_DIR / "boards").glob("*.json"))) if (TEMPLATES_DIR / "boards").exists() else 0,
-        "toolboards_count": len(list((TEMPLATES_DIR / "toolboards").glob("*.json"))) if (TEMPLATES_DIR / "toolboards").exists() else 0,
+        "templates_found": _TEMPLATES_EXISTS,
+        "schema_found": _SCHEMA_EXISTS,
+        **_board_counts(),
     }
 
 
-@app.get("/api/info")
 async def get_info():
     """Get project information."""
     return {
@@ -77,13 +88,78 @@ async def get_info():
     }
 
 
+class FrontendStaticFiles(StaticFiles):
+    """
+    StaticFiles with browser caching suited to a Vite build.
+
+    Files under assets/ have content-hashed names and never change, so they
+    are cached for a year; everything else (index.html) is revalidated via
+    the ETag/Last-Modified headers Starlette already sends.
+    """
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            if path.startswith("assets/"):
+                response.headers["cache-control"] = "public, max-age=31536000, immutable"
+            else:
+                response.headers["cache-control"] = "no-cache"
+        return response
+
+
 # In production, serve frontend static files
 FRONTEND_BUILD = WEB_DIR / "frontend" / "dist"
-if FRONTEND_BUILD.exists():
-    app.mount("/", StaticFiles(directory=FRONTEND_BUILD, html=True), name="frontend")
+
+# CORS for development (frontend on different port). The bundled nginx proxies
+# /api same-origin; set CORS_ORIGINS (comma-separated) to allow other frontends.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get(
+        "CORS_ORIGINS",
+        # Vite dev server / frontend container
+        "http://localhost:5173,http://localhost:3000,http://127.0.0.1:5173,http://127.0.0.1:3000",
+    ).split(",")
+    if origin.strip()
+]
+
+
+def create_app() -> FastAPI:
+    """Build the API app. Routers (and the generator behind them) load here."""
+    from routers import templates, generator, state
+
+    app = FastAPI(
+        title="gschpoozi Web Wizard API",
+        description="Backend API for gschpoozi web-based configuration wizard",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include routers
+    app.include_router(templates.router, prefix="/api", tags=["Templates"])
+    app.include_router(generator.router, prefix="/api", tags=["Generator"])
+    app.include_router(state.router, prefix="/api", tags=["State"])
+    app.get("/api/health")(health_check)
+    app.get("/api/info")(get_info)
+
+    if FRONTEND_BUILD.exists():
+        app.mount("/", FrontendStaticFiles(directory=FRONTEND_BUILD, html=True), name="frontend")
+
+    return app
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # Import string, so the reload worker imports the app itself
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
 
@@ -2,27 +2,71 @@
 API endpoints for config generation and preview.
 """
 
-import sys
+import hashlib
+import io
 import json
-import tempfile
+import re
+import sys
+import zipfile
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, HTTPException
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+try:
+    import orjson  # optional C-accelerated JSON encoder for state files
+except ImportError:
+    orjson = None
 
 # Paths
 BACKEND_DIR = Path(__file__).parent.parent
 PROJECT_ROOT = BACKEND_DIR.parent.parent
-SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 SCHEMA_DIR = PROJECT_ROOT / "schema"
 
-# Add scripts to path for importing generator
-sys.path.insert(0, str(SCRIPTS_DIR))
-sys.path.insert(0, str(SCRIPTS_DIR / "generator"))
+# wizard/generator come from scripts/, put on sys.path by main.py (or by
+# PYTHONPATH in the Docker image)
 
 router = APIRouter()
 
+try:
+    from wizard.drivers import SPI_DRIVERS
+except ImportError:
+    SPI_DRIVERS = {"TMC5160", "TMC2130", "TMC2240", "TMC2660"}
+_SPI_DRIVERS_UPPER = frozenset(d.upper() for d in SPI_DRIVERS)
+
+# Sections that get driver_protocol derived from driver_type
+_DRIVER_SECTIONS = (
+    'stepper_x', 'stepper_y', 'stepper_z',
+    'stepper_x1', 'stepper_y1',
+    'stepper_z1', 'stepper_z2', 'stepper_z3',
+    'extruder',
+)
+
+# Successful /preview results by _preview_key(); shared, must not be mutated
+_PREVIEW_CACHE: "OrderedDict[bytes, GenerateResponse]" = OrderedDict()
+_PREVIEW_CACHE_SIZE = 64
+
+# Keys holding a pin or port: "*_pin*", "*.pin", or "port" in any case
+_PIN_KEY_RE = re.compile(r'_pin|\.pin$|(?i:port)')
+_PIN_MODIFIERS = '^!~'
+
+
+@lru_cache(maxsize=1024)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key once, interning the parts so nested dicts share them."""
+    return tuple(sys.intern(part) for part in key.split("."))
+
+
+@lru_cache(maxsize=1024)
+def _is_pin_key(key: str) -> bool:
+    """Classify a state key once; the frontend sends the same keys every request."""
+    return _PIN_KEY_RE.search(key) is not None
+
 
 class GenerateRequest(BaseModel):
     """Request body for config generation."""
@@ -38,6 +82,73 @@ class GenerateResponse(BaseModel):
     warnings: List[str] = []
 
 
+def warm_generator() -> None:
+    """
+    Import the generator and wizard modules, load config-sections.yaml and
+    compile its templates, so the first preview doesn't pay for any of it
+    (the imports inside the handlers are then sys.modules hits).
+    """
+    try:
+        import wizard.state  # noqa: F401
+        import generator.generator  # noqa: F401
+        from generator.templates import TemplateRenderer
+        TemplateRenderer().precompile()
+    except (ImportError, OSError):
+        pass  # generator not available here; /preview reports it per request
+
+
+def _generate_in_memory(nested_state: Dict[str, Any]) -> Dict[str, str]:
+    """Generate config files from a nested state without touching disk."""
+    from wizard.state import WizardState
+    from generator.generator import ConfigGenerator
+
+    generator = ConfigGenerator(
+        state=WizardState.from_dict(nested_state),
+        templates_dir=TEMPLATES_DIR,
+        read_existing=False,
+    )
+    return generator.generate()
+
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+async def _read_body(request: Request, model: Type[_Model]) -> _Model:
+    """
+    Validate the raw JSON body straight into a request model.
+
+    pydantic parses the bytes itself, instead of FastAPI decoding the JSON
+    into Python objects first and validating those (the wizard state is
+    sent whole on every edit). Errors still come back as the usual 422.
+    """
+    try:
+        return model.model_validate_json(await request.body())
+    except PydanticValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
+
+def _body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a body read with _read_body()."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+
+    Generated configs are large and the model was just built from trusted
+    values, so skip FastAPI's response_model revalidation and encoding pass.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 class ValidateRequest(BaseModel):
     """Request body for validation."""
     wizard_state: Dict[str, Any]
@@ -58,182 +169,207 @@ class ValidateResponse(BaseModel):
     warnings: List[ValidationError] = []
 
 
-def transform_web_state_to_wizard_state(web_state: Dict[str, Any]) -> Dict[str, Any]:
+def _record_pin(pin_usage: Dict[str, List[str]], key: str, value: Any) -> None:
+    """Add key to pin_usage if it is a pin/port key holding a pin."""
+    if value and isinstance(value, str) and _is_pin_key(key):
+        pin = value.lstrip(_PIN_MODIFIERS) if value[0] in _PIN_MODIFIERS else value
+        if pin and pin not in ('None', 'null'):
+            pin_usage.setdefault(pin, []).append(key)
+
+
+def _collect_pin_usage(web_state: Dict[str, Any]) -> Dict[str, List[str]]:
+    """pin_usage as from transform_web_state_to_wizard_state(), without nesting the state."""
+    pin_usage: Dict[str, List[str]] = {}
+    for key, value in web_state.items():
+        _record_pin(pin_usage, key, value)
+    return pin_usage
+
+
+def transform_web_state_to_wizard_state(
+    web_state: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
     """
     Transform web frontend state format to the format expected by the generator.
 
     Web state uses dot notation keys: "stepper_x.motor_port" = "MOTOR_0"
     Generator expects nested structure: {"stepper_x": {"motor_port": "MOTOR_0"}}
+
+    Returns (nested_state, pin_usage), where pin_usage maps each pin (modifiers
+    stripped) to the pin/port keys using it, in state order. It is collected in
+    the same pass so callers don't have to rescan the state for conflicts.
     """
     result: Dict[str, Any] = {}
+    pin_usage: Dict[str, List[str]] = {}
 
     for key, value in web_state.items():
         if value is None:
             continue
 
-        parts = key.split(".")
-        current = result
-
-        for i, part in enumerate(parts[:-1]):
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+        _record_pin(pin_usage, key, value)
 
-        if parts:
-            current[parts[-1]] = value
+        *parents, leaf = _split_key(key)
+        current = result
+        for part in parents:
+            current = current.setdefault(part, {})
+            if not isinstance(current, dict):
+                break  # a parent key holds a plain value ("fans.hotend": "x"); can't nest under it
+        else:
+            current[leaf] = value
 
     # Compute driver_protocol from driver_type for all steppers and extruder.
     # The web frontend doesn't set this, but templates need it for SPI/UART branching.
-    try:
-        from wizard.drivers import SPI_DRIVERS
-    except ImportError:
-        SPI_DRIVERS = {"TMC5160", "TMC2130", "TMC2240", "TMC2660"}
+    for section in _DRIVER_SECTIONS:
+        data = result.get(section)
+        if isinstance(data, dict):
+            dt = data.get('driver_type', '')
+            if dt and isinstance(dt, str):
+                data['driver_protocol'] = 'spi' if dt.upper() in _SPI_DRIVERS_UPPER else 'uart'
 
-    for section in ['stepper_x', 'stepper_y', 'stepper_z',
-                    'stepper_x1', 'stepper_y1',
-                    'stepper_z1', 'stepper_z2', 'stepper_z3',
-                    'extruder']:
-        if section in result and isinstance(result[section], dict):
-            dt = result[section].get('driver_type', '')
-            if dt:
-                result[section]['driver_protocol'] = 'spi' if dt.upper() in SPI_DRIVERS else 'uart'
+    return result, pin_usage
 
-    return result
+
+class _Rule(NamedTuple):
+    """One field check in validate_state; rules run in table order."""
+    field: str
+    required: str = ''  # error message when the value is missing/empty
+    choices: Tuple[str, ...] = ()  # allowed values, checked when set
+    invalid: str = ''  # error message for a value outside choices ({value})
+    convert: Optional[Callable[[Any], float]] = None  # float/int for numeric limits
+    error_above: Optional[float] = None
+    error_msg: str = ''  # {value} is the converted number
+    warn_above: Optional[float] = None
+    warn_msg: str = ''
+    not_a_number: str = ''  # error when convert fails (silently skipped if empty)
+    when: Optional[Tuple[str, Any, Any]] = None  # only if state.get(key, default) == value
+
+
+def _stepper_rules(axis: str) -> Tuple[_Rule, ...]:
+    prefix = f'stepper_{axis}'
+    return (
+        _Rule(f'{prefix}.motor_port', required=f'{axis.upper()} axis motor port is required'),
+        _Rule(
+            f'{prefix}.run_current', convert=float,
+            error_above=2.5, error_msg='Run current {value}A exceeds safe limit (2.5A)',
+            warn_above=2.0, warn_msg='Run current {value}A is high - ensure adequate cooling',
+            not_a_number='Run current must be a number',
+        ),
+    )
 
 
-@router.post("/validate", response_model=ValidateResponse)
-async def validate_state(request: ValidateRequest) -> ValidateResponse:
+_RULES: Tuple[_Rule, ...] = (
+    # MCU
+    _Rule('mcu.main.board_type', required='Board type is required'),
+    _Rule('mcu.main.serial', required='MCU serial path is required'),
+    # Kinematics
+    _Rule(
+        'printer.kinematics', required='Kinematics type is required',
+        choices=('cartesian', 'corexy', 'corexz', 'delta', 'hybrid_corexy'),
+        invalid='Invalid kinematics type: {value}',
+    ),
+    # Steppers
+    *_stepper_rules('x'),
+    *_stepper_rules('y'),
+    *_stepper_rules('z'),
+    # Extruder
+    _Rule('extruder.extruder_type', required='Extruder type is required'),
+    _Rule(
+        'extruder.run_current', convert=float,
+        warn_above=1.5, warn_msg='Extruder run current {value}A is high for most extruders',
+    ),
+    # Temperature limits
+    _Rule(
+        'extruder.max_temp', convert=int,
+        error_above=350, error_msg='Max temp exceeds safe limit (350C)',
+        warn_above=300, warn_msg='Max temp above 300C requires high-temp thermistor',
+    ),
+    _Rule(
+        'heater_bed.max_temp', convert=int,
+        warn_above=130, warn_msg='Bed max temp above 130C - verify heater rating',
+    ),
+    # Heater bed
+    _Rule('heater_bed.heater_pin', required='Bed heater pin is required'),
+    _Rule('heater_bed.sensor_port', required='Bed sensor port is required'),
+    # Fans (pin required on whichever board the fan is wired to)
+    _Rule(
+        'fans.part_cooling.pin_mainboard', required='Part cooling fan pin is required',
+        when=('fans.part_cooling.location', 'mainboard', 'mainboard'),
+    ),
+    _Rule(
+        'fans.part_cooling.pin_toolboard', required='Part cooling fan pin is required',
+        when=('fans.part_cooling.location', 'toolboard', 'mainboard'),
+    ),
+    _Rule(
+        'fans.hotend.pin_mainboard', required='Hotend fan pin is required',
+        when=('fans.hotend.location', 'mainboard', 'mainboard'),
+    ),
+    _Rule(
+        'fans.hotend.pin_toolboard', required='Hotend fan pin is required',
+        when=('fans.hotend.location', 'toolboard', 'mainboard'),
+    ),
+)
+
+
+@router.post(
+    "/validate",
+    response_model=None,
+    responses={200: {"model": ValidateResponse}},
+    openapi_extra=_body_schema(ValidateRequest),
+)
+async def validate_state(raw_request: Request) -> Response:
     """
     Validate wizard state (partial or complete).
     Returns field-level errors and warnings.
     """
-    errors: List[ValidationError] = []
-    warnings: List[ValidationError] = []
+    request = await _read_body(raw_request, ValidateRequest)
+    pin_usage = _collect_pin_usage(request.wizard_state)
+    return _json_response(_validate(request.wizard_state, pin_usage))
 
-    state = request.wizard_state
-
-    # MCU validation
-    if not state.get('mcu.main.board_type'):
-        errors.append(ValidationError(field='mcu.main.board_type', message='Board type is required'))
-
-    if not state.get('mcu.main.serial'):
-        errors.append(ValidationError(field='mcu.main.serial', message='MCU serial path is required'))
-
-    # Kinematics validation
-    kinematics = state.get('printer.kinematics')
-    if not kinematics:
-        errors.append(ValidationError(field='printer.kinematics', message='Kinematics type is required'))
-    elif kinematics not in ['cartesian', 'corexy', 'corexz', 'delta', 'hybrid_corexy']:
-        errors.append(ValidationError(field='printer.kinematics', message=f'Invalid kinematics type: {kinematics}'))
-
-    # Stepper validation
-    for axis in ['x', 'y', 'z']:
-        prefix = f'stepper_{axis}'
-
-        if not state.get(f'{prefix}.motor_port'):
-            errors.append(ValidationError(field=f'{prefix}.motor_port', message=f'{axis.upper()} axis motor port is required'))
-
-        run_current = state.get(f'{prefix}.run_current')
-        if run_current is not None:
-            try:
-                current = float(run_current)
-                if current > 2.5:
-                    errors.append(ValidationError(
-                        field=f'{prefix}.run_current',
-                        message=f'Run current {current}A exceeds safe limit (2.5A)'
-                    ))
-                elif current > 2.0:
-                    warnings.append(ValidationError(
-                        field=f'{prefix}.run_current',
-                        message=f'Run current {current}A is high - ensure adequate cooling',
-                        severity='warning'
-                    ))
-            except (ValueError, TypeError):
-                errors.append(ValidationError(field=f'{prefix}.run_current', message='Run current must be a number'))
-
-    # Extruder validation
-    if not state.get('extruder.extruder_type'):
-        errors.append(ValidationError(field='extruder.extruder_type', message='Extruder type is required'))
-
-    extruder_current = state.get('extruder.run_current')
-    if extruder_current is not None:
-        try:
-            current = float(extruder_current)
-            if current > 1.5:
-                warnings.append(ValidationError(
-                    field='extruder.run_current',
-                    message=f'Extruder run current {current}A is high for most extruders',
-                    severity='warning'
-                ))
-        except (ValueError, TypeError):
-            pass
 
-    # Temperature limits
-    max_temp = state.get('extruder.max_temp')
-    if max_temp is not None:
-        try:
-            temp = int(max_temp)
-            if temp > 350:
-                errors.append(ValidationError(
-                    field='extruder.max_temp',
-                    message='Max temp exceeds safe limit (350C)'
-                ))
-            elif temp > 300:
-                warnings.append(ValidationError(
-                    field='extruder.max_temp',
-                    message='Max temp above 300C requires high-temp thermistor',
-                    severity='warning'
-                ))
-        except (ValueError, TypeError):
-            pass
+def _validate(state: Dict[str, Any], pin_usage: Dict[str, List[str]]) -> ValidateResponse:
+    """Run the field rules and pin-conflict check (pin_usage as from _collect_pin_usage())."""
+    errors: List[ValidationError] = []
+    warnings: List[ValidationError] = []
 
-    bed_max_temp = state.get('heater_bed.max_temp')
-    if bed_max_temp is not None:
+    for rule in _RULES:
+        if rule.when is not None:
+            guard_key, expected, default = rule.when
+            if state.get(guard_key, default) != expected:
+                continue
+        value = state.get(rule.field)
+
+        if not value:
+            if rule.required:
+                errors.append(ValidationError(field=rule.field, message=rule.required))
+                continue
+        elif rule.choices and value not in rule.choices:
+            errors.append(ValidationError(field=rule.field, message=rule.invalid.format(value=value)))
+
+        if rule.convert is None or value is None:
+            continue
         try:
-            temp = int(bed_max_temp)
-            if temp > 130:
-                warnings.append(ValidationError(
-                    field='heater_bed.max_temp',
-                    message='Bed max temp above 130C - verify heater rating',
-                    severity='warning'
-                ))
+            number = rule.convert(value)
         except (ValueError, TypeError):
-            pass
-
-    # Heater bed validation
-    if not state.get('heater_bed.heater_pin'):
-        errors.append(ValidationError(field='heater_bed.heater_pin', message='Bed heater pin is required'))
-
-    if not state.get('heater_bed.sensor_port'):
-        errors.append(ValidationError(field='heater_bed.sensor_port', message='Bed sensor port is required'))
-
-    # Fan validation
-    fan_part_loc = state.get('fans.part_cooling.location', 'mainboard')
-    if fan_part_loc == 'mainboard' and not state.get('fans.part_cooling.pin_mainboard'):
-        errors.append(ValidationError(field='fans.part_cooling.pin_mainboard', message='Part cooling fan pin is required'))
-    elif fan_part_loc == 'toolboard' and not state.get('fans.part_cooling.pin_toolboard'):
-        errors.append(ValidationError(field='fans.part_cooling.pin_toolboard', message='Part cooling fan pin is required'))
-
-    fan_hotend_loc = state.get('fans.hotend.location', 'mainboard')
-    if fan_hotend_loc == 'mainboard' and not state.get('fans.hotend.pin_mainboard'):
-        errors.append(ValidationError(field='fans.hotend.pin_mainboard', message='Hotend fan pin is required'))
-    elif fan_hotend_loc == 'toolboard' and not state.get('fans.hotend.pin_toolboard'):
-        errors.append(ValidationError(field='fans.hotend.pin_toolboard', message='Hotend fan pin is required'))
-
-    # Pin conflict detection
-    used_pins: Dict[str, str] = {}
-    for key, value in state.items():
-        if '_pin' in key or key.endswith('.pin') or 'port' in key.lower():
-            if isinstance(value, str) and value:
-                pin = value.lstrip('^!~')  # Remove modifiers
-                if pin and pin not in ['None', 'null', '']:
-                    if pin in used_pins:
-                        errors.append(ValidationError(
-                            field=key,
-                            message=f'Pin conflict: {pin} already used by {used_pins[pin]}'
-                        ))
-                    else:
-                        used_pins[pin] = key
+            if rule.not_a_number:
+                errors.append(ValidationError(field=rule.field, message=rule.not_a_number))
+            continue
+        if rule.error_above is not None and number > rule.error_above:
+            errors.append(ValidationError(field=rule.field, message=rule.error_msg.format(value=number)))
+        elif rule.warn_above is not None and number > rule.warn_above:
+            warnings.append(ValidationError(
+                field=rule.field,
+                message=rule.warn_msg.format(value=number),
+                severity='warning'
+            ))
+
+    # Pin conflict detection: pins used by more than one key
+    for pin, keys in pin_usage.items():
+        if len(keys) < 2:
+            continue
+        owner = keys[0]
+        errors.extend(
+            ValidationError(field=key, message=f'Pin conflict: {pin} already used by {owner}')
+            for key in keys[1:]
+        )
 
     return ValidateResponse(
         valid=len(errors) == 0,
@@ -242,74 +378,148 @@ async def validate_state(request: ValidateRequest) -> ValidateResponse:
     )
 
 
-@router.post("/preview", response_model=GenerateResponse)
-async def preview_config(request: GenerateRequest) -> GenerateResponse:
+@router.post(
+    "/preview",
+    response_model=None,
+    responses={200: {"model": GenerateResponse}},
+    openapi_extra=_body_schema(GenerateRequest),
+)
+async def preview_config(raw_request: Request) -> Response:
     """
     Generate config preview without saving to disk.
     Returns all generated config file contents.
     """
+    request = await _read_body(raw_request, GenerateRequest)
     try:
         # Transform web state to generator format
-        nested_state = transform_web_state_to_wizard_state(request.wizard_state)
+        nested_state, _ = transform_web_state_to_wizard_state(request.wizard_state)
+    except Exception as e:
+        return _json_response(GenerateResponse(
+            success=False,
+            files={},
+            errors=[str(e)],
+        ))
+    return _json_response(_preview(nested_state))
 
-        # Try to import and use the real generator
-        try:
-            from wizard.state import WizardState
-            from generator.generator import ConfigGenerator
-
-            # Create temporary directory for generation
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create a temporary state file
-                state_file = temp_path / ".gschpoozi_state.json"
-                with open(state_file, 'w', encoding='utf-8') as f:
-                    json.dump({"wizard": {"version": "3.0"}, "config": nested_state}, f)
-
-                # Create WizardState from the temp file
-                wizard_state = WizardState(state_dir=temp_path)
-
-                # Generate config
-                generator = ConfigGenerator(
-                    state=wizard_state,
-                    output_dir=temp_path,
-                    templates_dir=TEMPLATES_DIR,
-                )
-
-                files = generator.generate()
-
-                return GenerateResponse(
-                    success=True,
-                    files=files,
-                )
-
-        except ImportError as e:
-            # Generator not available, return mock response
-            return GenerateResponse(
-                success=False,
-                files={},
-                errors=[f"Generator module not available: {str(e)}. Run from project root."],
-            )
-        except Exception as e:
-            return GenerateResponse(
-                success=False,
-                files={},
-                errors=[f"Generation error: {str(e)}"],
-            )
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _preview_key(nested_state: Dict[str, Any]) -> bytes:
+    """
+    Digest of a state plus the mtimes of everything generation reads from
+    disk (config-sections.yaml and the selected board files), so editing a
+    template invalidates cached previews.
+    """
+    mcu = nested_state.get("mcu")
+    mcu = mcu if isinstance(mcu, dict) else {}
+    sources = [SCHEMA_DIR / "config-sections.yaml"]
+    for name, subdir in (("main", "boards"), ("toolboard", "toolboards")):
+        section = mcu.get(name)
+        board_type = section.get("board_type") if isinstance(section, dict) else None
+        if isinstance(board_type, str) and board_type:
+            sources.append(TEMPLATES_DIR / subdir / f"{board_type}.json")
+    payload = json.dumps(
+        [[str(p) for p in sources], [_mtime_ns(p) for p in sources], nested_state],
+        sort_keys=True, default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _preview(nested_state: Dict[str, Any]) -> GenerateResponse:
+    """
+    Generate the preview files, reporting failures in the response.
+
+    Successful previews are memoized: live preview re-sends identical
+    states whenever the user pauses or re-enters a value.
+    """
+    try:
+        key = _preview_key(nested_state)
+    except (TypeError, ValueError):
+        key = None  # not JSON-serializable; generate uncached
+    cached = _PREVIEW_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        _PREVIEW_CACHE.move_to_end(key)
+        return cached
+
+    # Try to import and use the real generator
+    try:
+        files = _generate_in_memory(nested_state)
+
+        response = GenerateResponse(
+            success=True,
+            files=files,
+        )
+        if key is not None:
+            _PREVIEW_CACHE[key] = response
+            if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+                _PREVIEW_CACHE.popitem(last=False)
+        return response
+
+    except ImportError as e:
+        # Generator not available, return mock response
+        return GenerateResponse(
+            success=False,
+            files={},
+            errors=[f"Generator module not available: {str(e)}. Run from project root."],
+        )
     except Exception as e:
         return GenerateResponse(
             success=False,
             files={},
-            errors=[str(e)],
+            errors=[f"Generation error: {str(e)}"],
         )
 
 
-@router.post("/generate", response_model=GenerateResponse)
-async def generate_config(request: GenerateRequest) -> GenerateResponse:
+class PreviewWithValidationResponse(BaseModel):
+    """Response from /preview_with_validation."""
+    validation: ValidateResponse
+    preview: GenerateResponse
+
+
+@router.post(
+    "/preview_with_validation",
+    response_model=None,
+    responses={200: {"model": PreviewWithValidationResponse}},
+    openapi_extra=_body_schema(GenerateRequest),
+)
+async def preview_with_validation(raw_request: Request) -> Response:
+    """
+    Validate and preview in one request.
+
+    The body is parsed and the state transformed once, and both results come
+    back together, saving the second round trip of calling /validate and
+    /preview separately.
+    """
+    request = await _read_body(raw_request, GenerateRequest)
+    try:
+        nested_state, pin_usage = transform_web_state_to_wizard_state(request.wizard_state)
+    except Exception as e:
+        return _json_response(PreviewWithValidationResponse(
+            validation=_validate(request.wizard_state, _collect_pin_usage(request.wizard_state)),
+            preview=GenerateResponse(success=False, files={}, errors=[str(e)]),
+        ))
+    return _json_response(PreviewWithValidationResponse(
+        validation=_validate(request.wizard_state, pin_usage),
+        preview=_preview(nested_state),
+    ))
+
+
+@router.post(
+    "/generate",
+    response_model=None,
+    responses={200: {"model": GenerateResponse}},
+    openapi_extra=_body_schema(GenerateRequest),
+)
+async def generate_config(raw_request: Request) -> Response:
     """
     Generate config files and save to specified directory.
     """
+    request = await _read_body(raw_request, GenerateRequest)
     if not request.output_dir:
         raise HTTPException(
             status_code=400,
@@ -320,7 +530,7 @@ async def generate_config(request: GenerateRequest) -> GenerateResponse:
 
     try:
         # Transform web state to generator format
-        nested_state = transform_web_state_to_wizard_state(request.wizard_state)
+        nested_state, _ = transform_web_state_to_wizard_state(request.wizard_state)
 
         from wizard.state import WizardState
         from generator.generator import ConfigGenerator
@@ -330,8 +540,10 @@ async def generate_config(request: GenerateRequest) -> GenerateResponse:
 
         # Create a temporary state file
         state_file = output_path / ".gschpoozi_state.json"
-        with open(state_file, 'w', encoding='utf-8') as f:
-            json.dump({"wizard": {"version": "3.0"}, "config": nested_state}, f)
+        state_data = {"wizard": {"version": "3.0"}, "config": nested_state}
+        state_file.write_bytes(
+            orjson.dumps(state_data) if orjson is not None else json.dumps(state_data).encode("utf-8")
+        )
 
         # Create WizardState
         wizard_state = WizardState(state_dir=output_path)
@@ -346,15 +558,48 @@ async def generate_config(request: GenerateRequest) -> GenerateResponse:
         files = generator.generate()
         generator.write_files(files)
 
-        return GenerateResponse(
+        return _json_response(GenerateResponse(
             success=True,
             files=files,
-        )
+        ))
 
     except Exception as e:
-        return GenerateResponse(
+        return _json_response(GenerateResponse(
             success=False,
             files={},
             errors=[str(e)],
-        )
+        ))
+
 
+@router.post(
+    "/generate/zip",
+    response_class=Response,
+    responses={200: {"content": {"application/zip": {}}}},
+    openapi_extra=_body_schema(GenerateRequest),
+)
+async def generate_zip(raw_request: Request) -> Response:
+    """
+    Generate config files and return them as a zip download (nothing is
+    saved on the server; output_dir is ignored).
+
+    Preferred over /preview for fetching a full config: file contents go out
+    as raw deflated bytes instead of JSON-escaped strings.
+    """
+    request = await _read_body(raw_request, GenerateRequest)
+    try:
+        nested_state, _ = transform_web_state_to_wizard_state(request.wizard_state)
+        files = _generate_in_memory(nested_state)
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=f"Generator module not available: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Generation error: {e}")
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+        for name, content in sorted(files.items()):
+            zf.writestr(name, content.encode("utf-8"))
+    return Response(
+        content=buf.getvalue(),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="gschpoozi-config.zip"'},
+    )
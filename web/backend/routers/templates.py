@@ -4,9 +4,15 @@ API endpoints for board, toolboard, probe, extruder, and motor templates.
 
 import json
 import os
+import zlib
 from pathlib import Path
-from typing import List, Optional, Any
-from fastapi import APIRouter, HTTPException
+from typing import Dict, List, Optional, Any, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response
+
+try:
+    import orjson  # optional C-accelerated JSON parser
+except ImportError:
+    orjson = None
 
 router = APIRouter()
 
@@ -32,10 +38,112 @@ def get_templates_dir() -> Path:
 TEMPLATES_DIR = get_templates_dir()
 
 
+# Parsed JSON per file, as (mtime_ns, data); reparsed only when the file changes.
+# Cached objects are shared between requests and must not be mutated.
+_JSON_CACHE: Dict[Path, Tuple[int, Any]] = {}
+# Template listings per (subdir, include_full), as (file mtimes, listing)
+_LIST_CACHE: Dict[Tuple[str, bool], Tuple[tuple, List[dict]]] = {}
+# Encoded response bodies, as (source objects, bytes); reused while the
+# listings they were built from are still the cached ones
+_BODY_CACHE: Dict[str, Tuple[tuple, bytes]] = {}
+# /templates/all body, as (file names and mtimes per directory, bytes, etag)
+_ALL_TEMPLATES_CACHE: Optional[Tuple[tuple, bytes, str]] = None
+_ALL_TEMPLATE_DIRS = ("boards", "toolboards", "probes", "extruders")
+
+
 def load_json_file(filepath: Path) -> dict:
-    """Load and parse a JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load and parse a JSON file (cached until its mtime changes)."""
+    return _load_json(filepath, filepath.stat().st_mtime_ns)
+
+
+def _load_json(filepath: Path, mtime_ns: int) -> Any:
+    """load_json_file() for a caller that already has the file's mtime."""
+    cached = _JSON_CACHE.get(filepath)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    raw = filepath.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _JSON_CACHE[filepath] = (mtime_ns, data)
+    return data
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode plain JSON data to bytes (orjson if installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_response(key: str, payload: Any, sources: tuple) -> Response:
+    """
+    Return payload as a JSON response, encoding it only when its sources change.
+
+    Template data is plain JSON, so FastAPI's jsonable_encoder pass over it
+    would do no useful work.
+    """
+    cached = _BODY_CACHE.get(key)
+    if (cached is None or len(cached[0]) != len(sources)
+            or any(old is not new for old, new in zip(cached[0], sources))):
+        cached = (sources, _dumps(payload))
+        _BODY_CACHE[key] = cached
+    return Response(content=cached[1], media_type="application/json")
+
+
+def _listing_response(subdir: str) -> Response:
+    """JSON response for list_templates(subdir), reusing its encoded body."""
+    listing = list_templates(subdir)
+    return _json_response(subdir, listing, (listing,))
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Weak comparison of If-None-Match against etag (RFC 7232).
+
+    A proxy that compresses the response (nginx with gzip on) hands the
+    browser a W/ tag, so the prefix is ignored on both sides; lists and "*"
+    are honoured.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _not_modified(request: Request, filepath: Path) -> Tuple[Optional[Response], Dict[str, str]]:
+    """
+    Build validator headers for a template file from its stat().
+
+    Returns (304 response or None, headers to attach to the full response).
+    """
+    st = filepath.stat()
+    headers = {
+        "ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Cache-Control": "public, max-age=300",
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers), headers
+    return None, headers
+
+
+def _template_response(request: Request, filepath: Path) -> Response:
+    """Serve a single template file with ETag revalidation."""
+    not_modified, headers = _not_modified(request, filepath)
+    if not_modified is not None:
+        return not_modified
+    data = load_json_file(filepath)
+    response = _json_response(str(filepath), data, (data,))
+    response.headers.update(headers)
+    return response
 
 
 def list_templates(subdir: str, include_full: bool = False) -> List[dict]:
@@ -44,13 +152,32 @@ def list_templates(subdir: str, include_full: bool = False) -> List[dict]:
     if not template_dir.exists():
         return []
 
+    # scandir hands back each entry's stat, so this is one directory read
+    # instead of a glob plus a stat() per file.
+    try:
+        with os.scandir(template_dir) as it:
+            entries = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
+    except OSError:
+        return []
+    stats = []
+    for entry in entries:
+        try:
+            stats.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            pass  # file vanished mid-listing
+    version = tuple(stats)
+    cached = _LIST_CACHE.get((subdir, include_full))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     templates = []
-    for filepath in sorted(template_dir.glob("*.json")):
+    for name, mtime_ns in version:
+        stem = name[:-len(".json")]
         try:
-            data = load_json_file(filepath)
+            data = _load_json(template_dir / name, mtime_ns)
             item = {
-                "id": filepath.stem,
-                "name": data.get("name", filepath.stem),
+                "id": stem,
+                "name": data.get("name", stem),
                 "manufacturer": data.get("manufacturer", "Unknown"),
                 "description": data.get("description", ""),
             }
@@ -58,28 +185,47 @@ def list_templates(subdir: str, include_full: bool = False) -> List[dict]:
                 item["data"] = data
             templates.append(item)
         except Exception as e:
-            print(f"Warning: Could not load {filepath}: {e}")
+            print(f"Warning: Could not load {template_dir / name}: {e}")
 
+    _LIST_CACHE[(subdir, include_full)] = (version, templates)
     return templates
 
 
+def warm_templates() -> None:
+    """
+    Parse every template (and encode the listings) at startup.
+
+    Handlers are async but read files synchronously; with the caches warm a
+    request only stat()s, so disk reads happen again only after a template
+    changes.
+    """
+    for subdir in _ALL_TEMPLATE_DIRS:
+        _listing_response(subdir)
+    motors_file = TEMPLATES_DIR / "motors" / "motors.json"
+    if motors_file.exists():
+        try:
+            load_json_file(motors_file)
+        except Exception as e:
+            print(f"Warning: Could not load {motors_file}: {e}")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Board Templates
 # ─────────────────────────────────────────────────────────────────────────────
 
 @router.get("/boards")
-async def list_boards() -> List[dict]:
+async def list_boards() -> Response:
     """List all available mainboard templates."""
-    return list_templates("boards")
+    return _listing_response("boards")
 
 
 @router.get("/boards/{board_id}")
-async def get_board(board_id: str) -> dict:
+async def get_board(board_id: str, request: Request) -> Response:
     """Get a specific board template with full pin definitions."""
     filepath = TEMPLATES_DIR / "boards" / f"{board_id}.json"
     if not filepath.exists():
         raise HTTPException(status_code=404, detail=f"Board '{board_id}' not found")
-    return load_json_file(filepath)
+    return _template_response(request, filepath)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -87,18 +233,18 @@ async def get_board(board_id: str) -> dict:
 # ─────────────────────────────────────────────────────────────────────────────
 
 @router.get("/toolboards")
-async def list_toolboards() -> List[dict]:
+async def list_toolboards() -> Response:
     """List all available toolboard templates."""
-    return list_templates("toolboards")
+    return _listing_response("toolboards")
 
 
 @router.get("/toolboards/{toolboard_id}")
-async def get_toolboard(toolboard_id: str) -> dict:
+async def get_toolboard(toolboard_id: str, request: Request) -> Response:
     """Get a specific toolboard template."""
     filepath = TEMPLATES_DIR / "toolboards" / f"{toolboard_id}.json"
     if not filepath.exists():
         raise HTTPException(status_code=404, detail=f"Toolboard '{toolboard_id}' not found")
-    return load_json_file(filepath)
+    return _template_response(request, filepath)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -106,18 +252,18 @@ async def get_toolboard(toolboard_id: str) -> dict:
 # ─────────────────────────────────────────────────────────────────────────────
 
 @router.get("/probes")
-async def list_probes() -> List[dict]:
+async def list_probes() -> Response:
     """List all available probe templates."""
-    return list_templates("probes")
+    return _listing_response("probes")
 
 
 @router.get("/probes/{probe_id}")
-async def get_probe(probe_id: str) -> dict:
+async def get_probe(probe_id: str, request: Request) -> Response:
     """Get a specific probe template."""
     filepath = TEMPLATES_DIR / "probes" / f"{probe_id}.json"
     if not filepath.exists():
         raise HTTPException(status_code=404, detail=f"Probe '{probe_id}' not found")
-    return load_json_file(filepath)
+    return _template_response(request, filepath)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -125,18 +271,18 @@ async def get_probe(probe_id: str) -> dict:
 # ─────────────────────────────────────────────────────────────────────────────
 
 @router.get("/extruders")
-async def list_extruders() -> List[dict]:
+async def list_extruders() -> Response:
     """List all available extruder presets."""
-    return list_templates("extruders")
+    return _listing_response("extruders")
 
 
 @router.get("/extruders/{extruder_id}")
-async def get_extruder(extruder_id: str) -> dict:
+async def get_extruder(extruder_id: str, request: Request) -> Response:
     """Get a specific extruder preset."""
     filepath = TEMPLATES_DIR / "extruders" / f"{extruder_id}.json"
     if not filepath.exists():
         raise HTTPException(status_code=404, detail=f"Extruder '{extruder_id}' not found")
-    return load_json_file(filepath)
+    return _template_response(request, filepath)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -157,7 +303,7 @@ async def list_motors() -> List[dict]:
 
 
 @router.get("/motors/{motor_id}")
-async def get_motor(motor_id: str) -> dict:
+async def get_motor(motor_id: str, request: Request) -> Response:
     """Get a specific motor's specifications."""
     motors_file = TEMPLATES_DIR / "motors" / "motors.json"
     if motors_file.exists():
@@ -165,7 +311,12 @@ async def get_motor(motor_id: str) -> dict:
         motors = data if isinstance(data, list) else data.get("motors", [])
         for motor in motors:
             if motor.get("id") == motor_id or motor.get("name") == motor_id:
-                return motor
+                not_modified, headers = _not_modified(request, motors_file)
+                if not_modified is not None:
+                    return not_modified
+                response = _json_response(f"motor:{motor_id}", motor, (motor,))
+                response.headers.update(headers)
+                return response
 
     raise HTTPException(status_code=404, detail=f"Motor '{motor_id}' not found")
 
@@ -175,15 +326,31 @@ async def get_motor(motor_id: str) -> dict:
 # ─────────────────────────────────────────────────────────────────────────────
 
 @router.get("/templates/all")
-async def get_all_templates() -> dict:
+async def get_all_templates(request: Request) -> Response:
     """
     Get all templates in one request for initial frontend load.
     Reduces number of API calls needed on startup.
-    """
-    return {
-        "boards": list_templates("boards"),
-        "toolboards": list_templates("toolboards"),
-        "probes": list_templates("probes"),
-        "extruders": list_templates("extruders"),
-    }
 
+    The encoded body is kept until a template file is added, removed or
+    edited (the file mtimes from list_templates' directory scan), so a repeat
+    request costs one scandir per directory. Clients get an ETag and can
+    revalidate for a 304.
+    """
+    global _ALL_TEMPLATES_CACHE
+    listings = {subdir: list_templates(subdir) for subdir in _ALL_TEMPLATE_DIRS}
+    sig = tuple(
+        _LIST_CACHE[(subdir, False)][0] if (subdir, False) in _LIST_CACHE else None
+        for subdir in _ALL_TEMPLATE_DIRS
+    )
+
+    cached = _ALL_TEMPLATES_CACHE
+    if cached is None or cached[0] != sig:
+        etag = f'"{zlib.crc32(repr(sig).encode()):08x}"'
+        cached = (sig, _dumps(listings), etag)
+        _ALL_TEMPLATES_CACHE = cached
+
+    _, body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -52,6 +52,11 @@ export interface GenerateResponse {
   warnings: string[];
 }
 
+export interface PreviewWithValidationResponse {
+  validation: ValidateResponse;
+  preview: GenerateResponse;
+}
+
 export interface StateResponse {
   state: Record<string, any>;
   metadata: Record<string, any>;
@@ -135,12 +140,36 @@ export const generatorApi = {
     });
   },
 
+  /** Validation and preview in a single request. */
+  async previewWithValidation(wizardState: Record<string, any>): Promise<PreviewWithValidationResponse> {
+    return fetchJSON('/preview_with_validation', {
+      method: 'POST',
+      body: JSON.stringify({ wizard_state: wizardState }),
+    });
+  },
+
   async generate(wizardState: Record<string, any>, outputDir: string): Promise<GenerateResponse> {
     return fetchJSON('/generate', {
       method: 'POST',
       body: JSON.stringify({ wizard_state: wizardState, output_dir: outputDir }),
     });
   },
+
+  /** Generated config files as a zip archive (for downloading). */
+  async generateZip(wizardState: Record<string, any>): Promise<Blob> {
+    const response = await fetch(`${API_BASE}/generate/zip`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ wizard_state: wizardState }),
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({ detail: response.statusText }));
+      throw new Error(error.detail || `API Error: ${response.status}`);
+    }
+
+    return response.blob();
+  },
 };
 
 // ─────────────────────────────────────────────────────────────────────────────